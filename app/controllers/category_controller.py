@@ -1,50 +1,172 @@
+from typing import List, Optional, Sequence
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi_pagination import Params, Page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from app.schemas.responses import Message
+from app.core.batch import create_batch_query, create_batch_response
+from app.core.pagination import paginate_by_cursor, async_paginate_by_cursor
+from app.core.inserts import create_insert_query, raise_integrity_error
+from app.core.cache import (
+    async_invalidate_catalog,
+    catalog_cache,
+    catalog_tags,
+    invalidate_catalog,
+)
+from app.core.conditional import check_if_match
+from app.schemas.responses import BatchGetResponse, CursorPage, Message
 from datetime import datetime
 from uuid import UUID
+from app.core.loaders import (
+    category_loader_options,
+    create_category_products_query,
+    set_category_products,
+)
+from app.core.replicas import async_primary_session, primary_session
+from app.core.settings import settings
 from app.models.category_model import CategoryModel
-from app.schemas.category_schema import CategorySchemaCreate, CategorySchemaUpdate
+from app.models.product_model import ProductModel
+from app.schemas.category_schema import (
+    CategorySchemaCreate,
+    CategorySchemaRead,
+    CategorySchemaUpdate,
+)
+from app.schemas.product_schema import ProductSchemaRead
+
+
+def _invalidate_cache(uuid: UUID) -> None:
+    # Remove a categoria e os produtos dela (removidos em cascata na exclusão)
+    invalidate_catalog(CategorySchemaRead, uuid=uuid)
+    invalidate_catalog(ProductSchemaRead, category_uuid=uuid)
+
+
+async def _async_invalidate_cache(uuid: UUID) -> None:
+    await async_invalidate_catalog(CategorySchemaRead, uuid=uuid)
+    await async_invalidate_catalog(ProductSchemaRead, category_uuid=uuid)
 
 
 class CategoryController:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, page: int = 1, size: int = 50) -> Page[CategoryModel]:
+    def _expand_products(self, categories: Sequence[CategoryModel]) -> None:
+        # Carrega os primeiros produtos de todas as categorias em uma única consulta
+        if not categories:
+            return
+
+        query = create_category_products_query(
+            categories, settings.CATEGORY_PRODUCTS_EXPAND_LIMIT
+        )
+        set_category_products(categories, self.db.execute(query).scalars().all())
+
+    def _ensure_exists(self, uuid: UUID) -> None:
+        category = (
+            self.db.query(CategoryModel.uuid).filter(CategoryModel.uuid == uuid).first()
+        )
+
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found.",
+            )
+
+    def _get_for_update(self, uuid: UUID, if_match: Optional[str]) -> CategoryModel:
+        # Com If-Match, a contagem de produtos compõe a versão, como no GET
+        query = self.db.query(CategoryModel).filter(CategoryModel.uuid == uuid)
+
+        if if_match is not None:
+            query = query.options(*category_loader_options())
+
+        category_model = query.first()
+
+        if not category_model:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found.",
+            )
+
+        check_if_match(if_match, category_model)
+
+        return category_model
+
+    def get_all(
+        self, page: int = 1, size: int = 50, expand: bool = False
+    ) -> Page[CategoryModel]:
         """
         Método para retornar uma lista de categorias.
 
         Parâmetros:
         - page: int (Página atual)
         - size: int (Quantidade de registros por página)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
 
         Retorno:
         - Page[CategoryModel] (Lista de categorias)
 
         """
-        query = select(CategoryModel).order_by(CategoryModel.created_at.desc())
+        query = (
+            select(CategoryModel)
+            .options(*category_loader_options())
+            .order_by(CategoryModel.created_at.desc())
+        )
         params = Params(page=page, size=size)
 
-        return paginate(self.db, query, params)
+        categories = paginate(self.db, query, params)
+
+        if expand:
+            self._expand_products(categories.items)
 
-    def get(self, uuid: UUID) -> CategoryModel:
+        return categories
+
+    def get_all_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+        expand: bool = False,
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de categorias paginada por cursor.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
+
+        Retorno:
+        - CursorPage (Lista de categorias)
+        """
+        query = select(CategoryModel).options(*category_loader_options())
+
+        categories = paginate_by_cursor(
+            self.db, query, CategoryModel, cursor, size, include_total
+        )
+
+        if expand:
+            self._expand_products(categories.items)
+
+        return categories
+
+    def get(self, uuid: UUID, expand: bool = False) -> CategoryModel:
         """
         Método para retornar uma categoria.
 
         Parâmetros:
         - uuid: UUID (Identificador da categoria)
+        - expand: bool (Inclui os primeiros produtos da categoria)
 
         Retorno:
         - CategoryModel (Categoria)
         """
         category = (
-            self.db.query(CategoryModel).filter(CategoryModel.uuid == uuid).first()
+            self.db.query(CategoryModel)
+            .options(*category_loader_options())
+            .filter(CategoryModel.uuid == uuid)
+            .first()
         )
 
         if not category:
@@ -53,8 +175,121 @@ class CategoryController:
                 detail="Category not found.",
             )
 
+        if expand:
+            self._expand_products([category])
+
         return category
 
+    def get_many(self, uuids: List[UUID], expand: bool = False) -> BatchGetResponse:
+        """
+        Método para retornar várias categorias em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores das categorias)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        query = create_batch_query(CategoryModel, uuids).options(
+            *category_loader_options()
+        )
+        categories = self.db.execute(query).scalars().all()
+
+        if expand:
+            self._expand_products(categories)
+
+        return create_batch_response(uuids, categories)
+
+    def get_by_slug(self, slug: str) -> CategorySchemaRead:
+        """
+        Método para retornar uma categoria pelo slug.
+
+        A categoria é lida do cache do catálogo e, na ausência, buscada pelo
+        índice único de slug e armazenada no cache.
+
+        Parâmetros:
+        - slug: str (Slug da categoria)
+
+        Retorno:
+        - CategorySchemaRead (Categoria)
+        """
+        key = f"category:{slug}"
+        category = catalog_cache.get(key, CategorySchemaRead)
+
+        if category is None:
+            # O cache é preenchido a partir do primário, nunca de uma réplica
+            with primary_session(self.db) as db:
+                category_model = (
+                    db.query(CategoryModel)
+                    .options(*category_loader_options())
+                    .filter(CategoryModel.slug == slug)
+                    .first()
+                )
+
+            if not category_model:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Category not found.",
+                )
+
+            category = CategorySchemaRead.model_validate(category_model)
+            catalog_cache.set(key, category, catalog_tags(category))
+
+        return category
+
+    def get_products(
+        self, uuid: UUID, page: int = 1, size: int = 50
+    ) -> Page[ProductModel]:
+        """
+        Método para retornar os produtos de uma categoria.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+        - page: int (Página atual)
+        - size: int (Quantidade de registros por página)
+
+        Retorno:
+        - Page[ProductModel] (Lista de produtos)
+        """
+        self._ensure_exists(uuid)
+
+        query = (
+            select(ProductModel)
+            .filter(ProductModel.category_uuid == uuid)
+            .order_by(ProductModel.created_at.desc())
+        )
+        params = Params(page=page, size=size)
+
+        return paginate(self.db, query, params)
+
+    def get_products_by_cursor(
+        self,
+        uuid: UUID,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+    ) -> CursorPage:
+        """
+        Método para retornar os produtos de uma categoria paginados por cursor.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+
+        Retorno:
+        - CursorPage (Lista de produtos)
+        """
+        self._ensure_exists(uuid)
+
+        query = select(ProductModel).filter(ProductModel.category_uuid == uuid)
+
+        return paginate_by_cursor(
+            self.db, query, ProductModel, cursor, size, include_total
+        )
+
     def create(self, category: CategorySchemaCreate) -> Message:
         """
         Método para criar uma categoria.
@@ -65,51 +300,42 @@ class CategoryController:
         Retorno:
         - Message (Mensagem de retorno)
         """
-        category_model = CategoryModel(**category.model_dump())
+        # Um único INSERT ... ON CONFLICT: os índices únicos detectam o duplicado
+        query = create_insert_query(self.db, CategoryModel).values(
+            **category.model_dump(exclude_none=True)
+        )
 
         try:
-            category_exists = (
-                self.db.query(CategoryModel)
-                .filter(CategoryModel.name == category_model.name)
-                .first()
-            )
-
-            if category_exists:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Category already exists.",
-                )
-
-            self.db.add(category_model)
-            self.db.commit()
+            result = self.db.execute(query)
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
 
-            return Message(status=True, message="Category created successfully.")
-        except IntegrityError:
+        if not result.rowcount:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Category already exists.",
             )
 
-    def full_update(self, category: CategorySchemaUpdate, uuid: UUID) -> Message:
+        self.db.commit()
+
+        return Message(status=True, message="Category created successfully.")
+
+    def full_update(
+        self, category: CategorySchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar uma categoria.
 
         Parâmetros:
         - category: CategorySchemaUpdate (Categoria)
         - uuid: UUID (Identificador da categoria)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
 
         Retorno:
         - Message (Mensagem de retorno)
         """
-        category_model = (
-            self.db.query(CategoryModel).filter(CategoryModel.uuid == uuid).first()
-        )
-
-        if not category_model:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Category not found.",
-            )
+        category_model = self._get_for_update(uuid, if_match)
 
         try:
             category_model.name = category.name
@@ -117,34 +343,28 @@ class CategoryController:
             category_model.updated_at = datetime.now()
 
             self.db.commit()
+            _invalidate_cache(uuid)
 
             return Message(status=True, message="Category updated successfully.")
-        except IntegrityError:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Category already exists.",
-            )
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
 
-    def partial_update(self, category: CategorySchemaUpdate, uuid: UUID) -> Message:
+    def partial_update(
+        self, category: CategorySchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar parcialmente uma categoria.
 
         Parâmetros:
         - category: CategorySchemaUpdate (Categoria)
         - uuid: UUID (Identificador da categoria)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
 
         Retorno:
         - Message (Mensagem de retorno)
         """
-        category_model = (
-            self.db.query(CategoryModel).filter(CategoryModel.uuid == uuid).first()
-        )
-
-        if not category_model:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Category not found.",
-            )
+        category_model = self._get_for_update(uuid, if_match)
 
         try:
             if category.name:
@@ -155,13 +375,12 @@ class CategoryController:
             category_model.updated_at = datetime.now()
 
             self.db.commit()
+            _invalidate_cache(uuid)
 
             return Message(status=True, message="Category updated successfully.")
-        except IntegrityError:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Category already exists.",
-            )
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
 
     def delete(self, uuid: UUID) -> Message:
         """
@@ -185,5 +404,365 @@ class CategoryController:
 
         self.db.delete(category_model)
         self.db.commit()
+        _invalidate_cache(uuid)
+
+        return Message(status=True, message="Category deleted successfully.")
+
+
+class AsyncCategoryController:
+    """
+    Variante assíncrona do CategoryController, utilizada com AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_by_uuid(
+        self, uuid: UUID, if_match: Optional[str] = None
+    ) -> CategoryModel:
+        # Com If-Match, a contagem de produtos compõe a versão, como no GET
+        query = select(CategoryModel).filter(CategoryModel.uuid == uuid)
+
+        if if_match is not None:
+            query = query.options(*category_loader_options())
+
+        result = await self.db.execute(query)
+        category = result.scalars().first()
+
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found.",
+            )
+
+        check_if_match(if_match, category)
+
+        return category
+
+    async def _expand_products(self, categories: Sequence[CategoryModel]) -> None:
+        # Carrega os primeiros produtos de todas as categorias em uma única consulta
+        if not categories:
+            return
+
+        query = create_category_products_query(
+            categories, settings.CATEGORY_PRODUCTS_EXPAND_LIMIT
+        )
+        result = await self.db.execute(query)
+        set_category_products(categories, result.scalars().all())
+
+    async def _ensure_exists(self, uuid: UUID) -> None:
+        result = await self.db.execute(
+            select(CategoryModel.uuid).filter(CategoryModel.uuid == uuid)
+        )
+
+        if not result.first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found.",
+            )
+
+    async def get_all(
+        self, page: int = 1, size: int = 50, expand: bool = False
+    ) -> Page[CategoryModel]:
+        """
+        Método para retornar uma lista de categorias.
+
+        Parâmetros:
+        - page: int (Página atual)
+        - size: int (Quantidade de registros por página)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
+
+        Retorno:
+        - Page[CategoryModel] (Lista de categorias)
+        """
+        query = (
+            select(CategoryModel)
+            .options(*category_loader_options())
+            .order_by(CategoryModel.created_at.desc())
+        )
+        params = Params(page=page, size=size)
+
+        categories = await paginate(self.db, query, params)
+
+        if expand:
+            await self._expand_products(categories.items)
+
+        return categories
+
+    async def get_all_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+        expand: bool = False,
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de categorias paginada por cursor.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
+
+        Retorno:
+        - CursorPage (Lista de categorias)
+        """
+        query = select(CategoryModel).options(*category_loader_options())
+
+        categories = await async_paginate_by_cursor(
+            self.db, query, CategoryModel, cursor, size, include_total
+        )
+
+        if expand:
+            await self._expand_products(categories.items)
+
+        return categories
+
+    async def get(self, uuid: UUID, expand: bool = False) -> CategoryModel:
+        """
+        Método para retornar uma categoria.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+        - expand: bool (Inclui os primeiros produtos da categoria)
+
+        Retorno:
+        - CategoryModel (Categoria)
+        """
+        result = await self.db.execute(
+            select(CategoryModel)
+            .options(*category_loader_options())
+            .filter(CategoryModel.uuid == uuid)
+        )
+        category = result.scalars().first()
+
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found.",
+            )
+
+        if expand:
+            await self._expand_products([category])
+
+        return category
+
+    async def get_many(
+        self, uuids: List[UUID], expand: bool = False
+    ) -> BatchGetResponse:
+        """
+        Método para retornar várias categorias em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores das categorias)
+        - expand: bool (Inclui os primeiros produtos de cada categoria)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        query = create_batch_query(CategoryModel, uuids).options(
+            *category_loader_options()
+        )
+        result = await self.db.execute(query)
+        categories = result.scalars().all()
+
+        if expand:
+            await self._expand_products(categories)
+
+        return create_batch_response(uuids, categories)
+
+    async def get_by_slug(self, slug: str) -> CategorySchemaRead:
+        """
+        Método para retornar uma categoria pelo slug.
+
+        Parâmetros:
+        - slug: str (Slug da categoria)
+
+        Retorno:
+        - CategorySchemaRead (Categoria)
+        """
+        key = f"category:{slug}"
+        category = await catalog_cache.async_get(key, CategorySchemaRead)
+
+        if category is None:
+            # O cache é preenchido a partir do primário, nunca de uma réplica
+            async with async_primary_session(self.db) as db:
+                result = await db.execute(
+                    select(CategoryModel)
+                    .options(*category_loader_options())
+                    .filter(CategoryModel.slug == slug)
+                )
+                category_model = result.scalars().first()
+
+            if not category_model:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Category not found.",
+                )
+
+            category = CategorySchemaRead.model_validate(category_model)
+            await catalog_cache.async_set(key, category, catalog_tags(category))
+
+        return category
+
+    async def get_products(
+        self, uuid: UUID, page: int = 1, size: int = 50
+    ) -> Page[ProductModel]:
+        """
+        Método para retornar os produtos de uma categoria.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+        - page: int (Página atual)
+        - size: int (Quantidade de registros por página)
+
+        Retorno:
+        - Page[ProductModel] (Lista de produtos)
+        """
+        await self._ensure_exists(uuid)
+
+        query = (
+            select(ProductModel)
+            .filter(ProductModel.category_uuid == uuid)
+            .order_by(ProductModel.created_at.desc())
+        )
+        params = Params(page=page, size=size)
+
+        return await paginate(self.db, query, params)
+
+    async def get_products_by_cursor(
+        self,
+        uuid: UUID,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+    ) -> CursorPage:
+        """
+        Método para retornar os produtos de uma categoria paginados por cursor.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+
+        Retorno:
+        - CursorPage (Lista de produtos)
+        """
+        await self._ensure_exists(uuid)
+
+        query = select(ProductModel).filter(ProductModel.category_uuid == uuid)
+
+        return await async_paginate_by_cursor(
+            self.db, query, ProductModel, cursor, size, include_total
+        )
+
+    async def create(self, category: CategorySchemaCreate) -> Message:
+        """
+        Método para criar uma categoria.
+
+        Parâmetros:
+        - category: CategorySchemaCreate (Categoria)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        query = create_insert_query(self.db, CategoryModel).values(
+            **category.model_dump(exclude_none=True)
+        )
+
+        try:
+            result = await self.db.execute(query)
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
+
+        if not result.rowcount:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Category already exists.",
+            )
+
+        await self.db.commit()
+
+        return Message(status=True, message="Category created successfully.")
+
+    async def full_update(
+        self, category: CategorySchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar uma categoria.
+
+        Parâmetros:
+        - category: CategorySchemaUpdate (Categoria)
+        - uuid: UUID (Identificador da categoria)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        category_model = await self._get_by_uuid(uuid, if_match)
+
+        try:
+            category_model.name = category.name
+            category_model.slug = category.slug
+            category_model.updated_at = datetime.now()
+
+            await self.db.commit()
+            await _async_invalidate_cache(uuid)
+
+            return Message(status=True, message="Category updated successfully.")
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
+
+    async def partial_update(
+        self, category: CategorySchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar parcialmente uma categoria.
+
+        Parâmetros:
+        - category: CategorySchemaUpdate (Categoria)
+        - uuid: UUID (Identificador da categoria)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        category_model = await self._get_by_uuid(uuid, if_match)
+
+        try:
+            if category.name:
+                category_model.name = category.name
+            if category.slug:
+                category_model.slug = category.slug
+
+            category_model.updated_at = datetime.now()
+
+            await self.db.commit()
+            await _async_invalidate_cache(uuid)
+
+            return Message(status=True, message="Category updated successfully.")
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(error, "Category already exists.")
+
+    async def delete(self, uuid: UUID) -> Message:
+        """
+        Método para deletar uma categoria.
+
+        Parâmetros:
+        - uuid: UUID (Identificador da categoria)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        category_model = await self._get_by_uuid(uuid)
+
+        await self.db.delete(category_model)
+        await self.db.commit()
+        await _async_invalidate_cache(uuid)
 
         return Message(status=True, message="Category deleted successfully.")
@@ -1,37 +1,369 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import status
 from fastapi.exceptions import HTTPException
-from app.schemas.responses import Message
+from app.schemas.responses import BatchGetResponse, CursorPage, Message
 from datetime import datetime
 from fastapi_pagination import Params, Page
 from fastapi_pagination.ext.sqlalchemy import paginate
+from app.core.pagination import paginate_by_cursor, async_paginate_by_cursor
+from app.core.batch import create_batch_query, create_batch_response
+from app.core.search import create_search_page, create_search_query
+from app.core.export import format_csv, format_rows
+from app.core.inserts import create_insert_query, raise_integrity_error
+from app.core.stock import create_decrement_query, merge_reservation_items, stock_error
+from app.core.cache import (
+    async_invalidate_catalog,
+    catalog_cache,
+    catalog_tags,
+    invalidate_catalog,
+)
+from app.core.conditional import check_if_match
+from app.core.replicas import async_primary_session, primary_session
+from app.core.settings import settings
 from sqlalchemy.future import select
-from uuid import UUID
+from uuid import UUID, uuid4
+from app.models.category_model import CategoryModel
 from app.models.product_model import ProductModel
-from app.schemas.product_schema import ProductSchemaCreate, ProductSchemaUpdate
+from app.schemas.category_schema import CategorySchemaRead
+from app.schemas.product_schema import (
+    ProductSchemaBulkReport,
+    ProductSchemaBulkResult,
+    ProductSchemaCreate,
+    ProductSchemaFilter,
+    ProductSchemaRead,
+    ProductSchemaReservation,
+    ProductSchemaReservationReport,
+    ProductSchemaStock,
+    ProductSchemaUpdate,
+)
+
+# Linha da importação em lote pronta para o INSERT: (posição, valores)
+BulkRow = Tuple[int, Dict[str, Any]]
+
+
+# Colunas das chaves de ordenação aceitas na listagem (ProductSort)
+SORT_COLUMNS = {
+    "created_at": ProductModel.created_at,
+    "name": ProductModel.name,
+    "price": ProductModel.price,
+    "stock": ProductModel.stock,
+}
+
+
+def _create_list_query(filters: Optional[ProductSchemaFilter] = None):
+    """
+    Cria a consulta da listagem com os filtros informados.
+
+    Todos os filtros viram condições de uma única consulta, atendida pelos
+    índices (category_uuid, created_at, uuid), (category_uuid, price, uuid) e
+    (price, uuid).
+    """
+    query = select(ProductModel)
+
+    if filters is None:
+        return query
+
+    if filters.category_uuid:
+        query = query.where(ProductModel.category_uuid == filters.category_uuid)
+
+    if filters.min_price is not None:
+        query = query.where(ProductModel.price >= filters.min_price)
+
+    if filters.max_price is not None:
+        query = query.where(ProductModel.price <= filters.max_price)
+
+    if filters.in_stock is not None:
+        query = query.where(
+            ProductModel.stock > 0 if filters.in_stock else ProductModel.stock == 0
+        )
+
+    if filters.name_prefix:
+        # LIKE 'prefixo%' com os curingas do prefixo escapados
+        query = query.where(
+            ProductModel.name.startswith(filters.name_prefix, autoescape=True)
+        )
+
+    return query
+
+
+def _create_order_by(sort: str) -> Tuple[Any, Any]:
+    # O uuid desempata registros com o mesmo valor, mantendo as páginas estáveis
+    column = SORT_COLUMNS[sort.lstrip("-")]
+
+    if sort.startswith("-"):
+        return column.desc(), ProductModel.uuid.desc()
+
+    return column.asc(), ProductModel.uuid.asc()
+
+
+def _invalidate_cache(uuid: Optional[UUID] = None) -> None:
+    # Remove o produto alterado e as categorias, cuja contagem de produtos mudou
+    if uuid:
+        invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+    invalidate_catalog(CategorySchemaRead)
+
+
+async def _async_invalidate_cache(uuid: Optional[UUID] = None) -> None:
+    if uuid:
+        await async_invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+    await async_invalidate_catalog(CategorySchemaRead)
+
+
+# Colunas da exportação do catálogo, na ordem do CSV
+EXPORT_COLUMNS = (
+    ProductModel.uuid,
+    ProductModel.category_uuid,
+    ProductModel.name,
+    ProductModel.slug,
+    ProductModel.price,
+    ProductModel.stock,
+    ProductModel.created_at,
+    ProductModel.updated_at,
+)
+
+
+def _create_export_query(category_uuid: Optional[UUID] = None):
+    """
+    Cria a consulta da exportação, lida em lotes por um cursor no servidor.
+
+    Apenas as colunas são selecionadas (sem instanciar ProductModel) e a
+    ordem segue o índice (created_at, uuid).
+    """
+    query = select(*EXPORT_COLUMNS).order_by(ProductModel.created_at, ProductModel.uuid)
+
+    if category_uuid:
+        query = query.where(ProductModel.category_uuid == category_uuid)
+
+    return query.execution_options(yield_per=settings.PRODUCT_EXPORT_BATCH_SIZE)
+
+
+def _export_header() -> str:
+    return format_csv([[column.key for column in EXPORT_COLUMNS]])
+
+
+def _validate_bulk_rows(
+    rows: List[Any],
+) -> Tuple[
+    List[Optional[ProductSchemaBulkResult]], List[Tuple[int, ProductSchemaCreate]]
+]:
+    """
+    Valida cada linha da importação em lote individualmente.
+
+    Retorno:
+    - Tuple (Resultados já conhecidos por posição, produtos válidos)
+    """
+    results: List[Optional[ProductSchemaBulkResult]] = [None] * len(rows)
+    products = []
+
+    for index, row in enumerate(rows):
+        try:
+            products.append((index, ProductSchemaCreate.model_validate(row)))
+        except ValidationError as e:
+            results[index] = ProductSchemaBulkResult(
+                index=index,
+                status="invalid",
+                detail="; ".join(error["msg"] for error in e.errors()),
+            )
+
+    return results, products
+
+
+def _plan_bulk_rows(
+    results: List[Optional[ProductSchemaBulkResult]],
+    products: List[Tuple[int, ProductSchemaCreate]],
+    existing_categories: Set[UUID],
+) -> List[BulkRow]:
+    """
+    Separa os produtos válidos entre repetidos, sem categoria e a inserir.
+
+    Nome, slug ou uuid repetido no próprio lote é duplicado; os já existentes
+    no banco são detectados pelo INSERT ... ON CONFLICT de cada lote.
+
+    Retorno:
+    - List[BulkRow] (Linhas a inserir, na ordem da requisição)
+    """
+    names: Set[str] = set()
+    slugs: Set[str] = set()
+    uuids: Set[UUID] = set()
+    pending = []
+
+    for index, product in products:
+        if product.category_uuid not in existing_categories:
+            results[index] = ProductSchemaBulkResult(
+                index=index, status="invalid", detail="Category not found."
+            )
+        elif product.name in names or product.slug in slugs or product.uuid in uuids:
+            results[index] = ProductSchemaBulkResult(
+                index=index, status="duplicate", detail="Product already exists."
+            )
+        else:
+            names.add(product.name)
+            slugs.add(product.slug)
+            values = product.model_dump(exclude={"created_at", "updated_at"})
+            # Um uuid repetido no mesmo INSERT seria descartado pelo ON CONFLICT,
+            # mas o RETURNING o reportaria como criado nas duas linhas
+            values["uuid"] = values["uuid"] or uuid4()
+            uuids.add(values["uuid"])
+            pending.append((index, values))
+
+    return pending
+
+
+def _set_batch_results(
+    results: List[Optional[ProductSchemaBulkResult]],
+    batch: List[BulkRow],
+    inserted: Optional[Set[UUID]],
+) -> None:
+    # inserted é None quando o lote inteiro falhou
+    for index, values in batch:
+        if inserted is None:
+            results[index] = ProductSchemaBulkResult(
+                index=index, status="failed", detail="Batch insert failed."
+            )
+        elif values["uuid"] in inserted:
+            results[index] = ProductSchemaBulkResult(
+                index=index, status="created", uuid=values["uuid"]
+            )
+        else:
+            results[index] = ProductSchemaBulkResult(
+                index=index, status="duplicate", detail="Product already exists."
+            )
+
+
+def _bulk_report(
+    results: List[Optional[ProductSchemaBulkResult]],
+) -> ProductSchemaBulkReport:
+    statuses = [result.status for result in results]
+
+    return ProductSchemaBulkReport(
+        created=statuses.count("created"),
+        duplicates=statuses.count("duplicate"),
+        invalid=statuses.count("invalid"),
+        failed=statuses.count("failed"),
+        results=results,
+    )
 
 
 class ProductController:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, page: int = 1, size: int = 50) -> Page[ProductModel]:
+    def get_all(
+        self,
+        page: int = 1,
+        size: int = 50,
+        filters: Optional[ProductSchemaFilter] = None,
+        sort: str = "-created_at",
+    ) -> Page[ProductModel]:
         """
         Método para retornar uma lista de produtos.
 
         Parâmetros:
         - page: int (Página atual)
         - size: int (Quantidade de registros por página)
+        - filters: Optional[ProductSchemaFilter] (Filtros da listagem)
+        - sort: str (Chave de ordenação, "-" para ordem decrescente)
 
         Retorno:
         - Page[ProductModel] (Lista de produtos)
         """
-        query = select(ProductModel).order_by(ProductModel.created_at.desc())
+        query = _create_list_query(filters).order_by(*_create_order_by(sort))
         params = Params(page=page, size=size)
 
         return paginate(self.db, query, params)
 
+    def get_all_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+        filters: Optional[ProductSchemaFilter] = None,
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de produtos paginada por cursor.
+
+        A ordem é sempre a do cursor (created_at, uuid) decrescente.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+        - filters: Optional[ProductSchemaFilter] (Filtros da listagem)
+
+        Retorno:
+        - CursorPage (Lista de produtos)
+        """
+        query = _create_list_query(filters)
+
+        return paginate_by_cursor(
+            self.db, query, ProductModel, cursor, size, include_total
+        )
+
+    def search(
+        self, q: str, cursor: Optional[str] = None, size: int = 50
+    ) -> CursorPage:
+        """
+        Método para buscar produtos pelo nome e pelo slug.
+
+        A busca é textual (tsvector e trigramas no PostgreSQL, FTS5 no SQLite),
+        com prefixo em cada termo, ordenada por relevância e paginada por cursor.
+
+        Parâmetros:
+        - q: str (Texto buscado)
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de resultados por página)
+
+        Retorno:
+        - CursorPage (Produtos encontrados)
+        """
+        query = create_search_query(self.db, q, cursor, size)
+
+        return create_search_page(self.db.execute(query).all(), size)
+
+    def export(
+        self, category_uuid: Optional[UUID] = None, export_format: str = "ndjson"
+    ) -> Iterator[str]:
+        """
+        Método para exportar o catálogo de produtos em stream.
+
+        Os produtos são lidos em lotes de PRODUCT_EXPORT_BATCH_SIZE por um
+        cursor no servidor e cada lote é formatado e enviado antes do próximo
+        ser lido, mantendo a memória constante. O gerador é consumido durante
+        o envio da resposta, por isso é ele quem fecha a sessão.
+
+        Parâmetros:
+        - category_uuid: Optional[UUID] (Filtra os produtos da categoria)
+        - export_format: str (ndjson ou csv)
+
+        Retorno:
+        - Iterator[str] (Lotes formatados)
+        """
+        try:
+            if export_format == "csv":
+                yield _export_header()
+
+            result = self.db.execute(_create_export_query(category_uuid))
+
+            for partition in result.partitions():
+                yield format_rows(partition, export_format)
+        finally:
+            self.db.close()
+
     def get(self, uuid: UUID) -> ProductModel:
         """
         Método para retornar um produto.
@@ -53,6 +385,57 @@ class ProductController:
 
         return product
 
+    def get_many(self, uuids: List[UUID]) -> BatchGetResponse:
+        """
+        Método para retornar vários produtos em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores dos produtos)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        products = self.db.execute(create_batch_query(ProductModel, uuids))
+        return create_batch_response(uuids, products.scalars().all())
+
+    def get_by_slug(self, slug: str) -> ProductSchemaRead:
+        """
+        Método para retornar um produto pelo slug.
+
+        O produto é lido do cache do catálogo e, na ausência, buscado pelo
+        índice único de slug e armazenado no cache.
+
+        Parâmetros:
+        - slug: str (Slug do produto)
+
+        Retorno:
+        - ProductSchemaRead (Produto)
+        """
+        key = f"product:{slug}"
+        product = catalog_cache.get(key, ProductSchemaRead)
+
+        if product is None:
+            # O cache é preenchido a partir do primário, nunca de uma réplica
+            with primary_session(self.db) as db:
+                product_model = (
+                    db.execute(select(ProductModel).filter(ProductModel.slug == slug))
+                    .scalars()
+                    .first()
+                )
+
+            if not product_model:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Product not found.",
+                )
+
+            product = ProductSchemaRead.model_validate(
+                product_model, from_attributes=True
+            )
+            catalog_cache.set(key, product, catalog_tags(product))
+
+        return product
+
     def create(self, product: ProductSchemaCreate) -> Message:
         """
         Método para criar um produto.
@@ -63,38 +446,95 @@ class ProductController:
         Retorno:
         - Message (Mensagem de retorno)
         """
-        product_model = ProductModel(**product.model_dump())
+        # Um único INSERT ... ON CONFLICT: os índices únicos detectam o duplicado
+        query = create_insert_query(self.db, ProductModel).values(
+            **product.model_dump(exclude_none=True)
+        )
 
         try:
-            product_exists = (
-                self.db.query(ProductModel)
-                .filter(ProductModel.name == product_model.name)
-                .first()
+            result = self.db.execute(query)
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
             )
 
-            if product_exists:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Product already exists.",
-                )
-
-            self.db.add(product_model)
-            self.db.commit()
-
-            return Message(status=True, message="Product created successfully.")
-        except IntegrityError:
+        if not result.rowcount:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Product already exists.",
             )
 
-    def full_update(self, product: ProductSchemaUpdate, uuid: UUID) -> Message:
+        self.db.commit()
+        _invalidate_cache()
+
+        return Message(status=True, message="Product created successfully.")
+
+    def create_bulk(
+        self, rows: List[Any], batch_size: int = 500
+    ) -> ProductSchemaBulkReport:
+        """
+        Método para criar produtos em lote.
+
+        As linhas são validadas uma a uma, as categorias são verificadas com
+        uma única consulta e os produtos são inseridos com INSERT de múltiplas
+        linhas ... ON CONFLICT DO NOTHING RETURNING, um COMMIT por lote. As
+        linhas não retornadas já existiam no banco (nome ou slug).
+
+        Parâmetros:
+        - rows: List[Any] (Linhas da requisição, ainda não validadas)
+        - batch_size: int (Quantidade de produtos por INSERT)
+
+        Retorno:
+        - ProductSchemaBulkReport (Resultado de cada linha)
+        """
+        results, products = _validate_bulk_rows(rows)
+        pending: List[BulkRow] = []
+
+        if products:
+            category_uuids = {product.category_uuid for _, product in products}
+
+            existing_categories = set(
+                self.db.execute(
+                    select(CategoryModel.uuid).where(
+                        CategoryModel.uuid.in_(category_uuids)
+                    )
+                ).scalars()
+            )
+
+            pending = _plan_bulk_rows(results, products, existing_categories)
+
+        query = create_insert_query(self.db, ProductModel).returning(ProductModel.uuid)
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+
+            try:
+                inserted = set(
+                    self.db.execute(query, [values for _, values in batch]).scalars()
+                )
+                self.db.commit()
+            except IntegrityError:
+                # Violação que não é de unicidade: apenas este lote é perdido
+                self.db.rollback()
+                inserted = None
+
+            _set_batch_results(results, batch, inserted)
+
+        _invalidate_cache()
+
+        return _bulk_report(results)
+
+    def full_update(
+        self, product: ProductSchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar um produto.
 
         Parâmetros:
         - product: ProductSchemaUpdate (Produto)
         - uuid: UUID (Identificador do produto)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
 
         Retorno:
         - Message (Mensagem de retorno)
@@ -110,6 +550,8 @@ class ProductController:
                     detail="Product not found.",
                 )
 
+            check_if_match(if_match, product_model)
+
             product_model.name = product.name
             product_model.slug = product.slug
             product_model.price = product.price
@@ -119,21 +561,25 @@ class ProductController:
             product_model.updated_at = datetime.now()
 
             self.db.commit()
+            _invalidate_cache(uuid)
 
             return Message(status=True, message="Product updated successfully.")
-        except IntegrityError:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Product already exists.",
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
             )
 
-    def partial_update(self, product: ProductSchemaUpdate, uuid: UUID) -> Message:
+    def partial_update(
+        self, product: ProductSchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar parcialmente um produto.
 
         Parâmetros:
         - product: ProductSchemaUpdate (Produto)
         - uuid: UUID (Identificador do produto)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
 
         Retorno:
         - Message (Mensagem de retorno)
@@ -149,6 +595,8 @@ class ProductController:
                     detail="Product not found.",
                 )
 
+            check_if_match(if_match, product_model)
+
             if product.name:
                 product_model.name = product.name
             if product.slug:
@@ -163,14 +611,87 @@ class ProductController:
             product_model.updated_at = datetime.now()
 
             self.db.commit()
+            _invalidate_cache(uuid)
 
             return Message(status=True, message="Product updated successfully.")
-        except IntegrityError:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Product already exists.",
+        except IntegrityError as error:
+            self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
             )
 
+    def _product_exists(self, uuid: UUID) -> bool:
+        query = select(ProductModel.uuid).filter(ProductModel.uuid == uuid)
+        return self.db.execute(query).first() is not None
+
+    def decrement_stock(self, uuid: UUID, quantity: int) -> ProductSchemaStock:
+        """
+        Método para dar baixa no estoque de um produto.
+
+        A baixa é feita em um único UPDATE condicionado ao estoque disponível,
+        sem ler a linha antes, então compras concorrentes não perdem
+        alterações.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do produto)
+        - quantity: int (Quantidade retirada do estoque)
+
+        Retorno:
+        - ProductSchemaStock (Estoque restante)
+        """
+        row = self.db.execute(create_decrement_query(uuid, quantity)).first()
+
+        if row is None:
+            self.db.rollback()
+            raise stock_error(uuid, self._product_exists(uuid))
+
+        self.db.commit()
+        invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+        return ProductSchemaStock(uuid=row.uuid, stock=row.stock)
+
+    def reserve_stock(
+        self, reservation: ProductSchemaReservation
+    ) -> ProductSchemaReservationReport:
+        """
+        Método para dar baixa no estoque de vários produtos em uma transação.
+
+        Todas as baixas são aplicadas ou nenhuma: se um produto não existe ou
+        não tem estoque suficiente, a transação é desfeita. Os produtos são
+        alterados na ordem dos UUIDs, para que reservas concorrentes bloqueiem
+        as linhas na mesma ordem e não entrem em deadlock.
+
+        Parâmetros:
+        - reservation: ProductSchemaReservation (Produtos e quantidades)
+
+        Retorno:
+        - ProductSchemaReservationReport (Estoque restante de cada produto)
+        """
+        quantities = merge_reservation_items(reservation.items)
+        stocks = {}
+
+        for uuid in sorted(quantities):
+            row = self.db.execute(
+                create_decrement_query(uuid, quantities[uuid])
+            ).first()
+
+            if row is None:
+                self.db.rollback()
+                raise stock_error(uuid, self._product_exists(uuid))
+
+            stocks[uuid] = row.stock
+
+        self.db.commit()
+
+        for uuid in quantities:
+            invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+        return ProductSchemaReservationReport(
+            items=[
+                ProductSchemaStock(uuid=uuid, stock=stocks[uuid]) for uuid in quantities
+            ]
+        )
+
     def delete(self, uuid: UUID) -> Message:
         """
         Método para deletar um produto.
@@ -193,5 +714,429 @@ class ProductController:
 
         self.db.delete(product_model)
         self.db.commit()
+        _invalidate_cache(uuid)
+
+        return Message(status=True, message="Product deleted successfully.")
+
+
+class AsyncProductController:
+    """
+    Variante assíncrona do ProductController, utilizada com AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_by_uuid(self, uuid: UUID) -> ProductModel:
+        result = await self.db.execute(
+            select(ProductModel).filter(ProductModel.uuid == uuid)
+        )
+        product = result.scalars().first()
+
+        if not product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found.",
+            )
+
+        return product
+
+    async def get_all(
+        self,
+        page: int = 1,
+        size: int = 50,
+        filters: Optional[ProductSchemaFilter] = None,
+        sort: str = "-created_at",
+    ) -> Page[ProductModel]:
+        """
+        Método para retornar uma lista de produtos.
+
+        Parâmetros:
+        - page: int (Página atual)
+        - size: int (Quantidade de registros por página)
+        - filters: Optional[ProductSchemaFilter] (Filtros da listagem)
+        - sort: str (Chave de ordenação, "-" para ordem decrescente)
+
+        Retorno:
+        - Page[ProductModel] (Lista de produtos)
+        """
+        query = _create_list_query(filters).order_by(*_create_order_by(sort))
+        params = Params(page=page, size=size)
+
+        return await paginate(self.db, query, params)
+
+    async def get_all_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        size: int = 50,
+        include_total: bool = False,
+        filters: Optional[ProductSchemaFilter] = None,
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de produtos paginada por cursor.
+
+        A ordem é sempre a do cursor (created_at, uuid) decrescente.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+        - filters: Optional[ProductSchemaFilter] (Filtros da listagem)
+
+        Retorno:
+        - CursorPage (Lista de produtos)
+        """
+        query = _create_list_query(filters)
+
+        return await async_paginate_by_cursor(
+            self.db, query, ProductModel, cursor, size, include_total
+        )
+
+    async def search(
+        self, q: str, cursor: Optional[str] = None, size: int = 50
+    ) -> CursorPage:
+        """
+        Método para buscar produtos pelo nome e pelo slug.
+
+        A busca é textual (tsvector e trigramas no PostgreSQL, FTS5 no SQLite),
+        com prefixo em cada termo, ordenada por relevância e paginada por cursor.
+
+        Parâmetros:
+        - q: str (Texto buscado)
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de resultados por página)
+
+        Retorno:
+        - CursorPage (Produtos encontrados)
+        """
+        query = create_search_query(self.db, q, cursor, size)
+        result = await self.db.execute(query)
+
+        return create_search_page(result.all(), size)
+
+    async def export(
+        self, category_uuid: Optional[UUID] = None, export_format: str = "ndjson"
+    ) -> AsyncIterator[str]:
+        """
+        Método para exportar o catálogo de produtos em stream.
+
+        Parâmetros:
+        - category_uuid: Optional[UUID] (Filtra os produtos da categoria)
+        - export_format: str (ndjson ou csv)
+
+        Retorno:
+        - AsyncIterator[str] (Lotes formatados)
+        """
+        try:
+            if export_format == "csv":
+                yield _export_header()
+
+            result = await self.db.stream(_create_export_query(category_uuid))
+
+            async for partition in result.partitions():
+                yield format_rows(partition, export_format)
+        finally:
+            await self.db.close()
+
+    async def get(self, uuid: UUID) -> ProductModel:
+        """
+        Método para retornar um produto.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do produto)
+
+        Retorno:
+        - ProductModel (Produto)
+        """
+        return await self._get_by_uuid(uuid)
+
+    async def get_many(self, uuids: List[UUID]) -> BatchGetResponse:
+        """
+        Método para retornar vários produtos em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores dos produtos)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        products = await self.db.execute(create_batch_query(ProductModel, uuids))
+        return create_batch_response(uuids, products.scalars().all())
+
+    async def get_by_slug(self, slug: str) -> ProductSchemaRead:
+        """
+        Método para retornar um produto pelo slug.
+
+        Parâmetros:
+        - slug: str (Slug do produto)
+
+        Retorno:
+        - ProductSchemaRead (Produto)
+        """
+        key = f"product:{slug}"
+        product = await catalog_cache.async_get(key, ProductSchemaRead)
+
+        if product is None:
+            # O cache é preenchido a partir do primário, nunca de uma réplica
+            async with async_primary_session(self.db) as db:
+                result = await db.execute(
+                    select(ProductModel).filter(ProductModel.slug == slug)
+                )
+                product_model = result.scalars().first()
+
+            if not product_model:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Product not found.",
+                )
+
+            product = ProductSchemaRead.model_validate(
+                product_model, from_attributes=True
+            )
+            await catalog_cache.async_set(key, product, catalog_tags(product))
+
+        return product
+
+    async def create(self, product: ProductSchemaCreate) -> Message:
+        """
+        Método para criar um produto.
+
+        Parâmetros:
+        - product: ProductSchemaCreate (Produto)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        query = create_insert_query(self.db, ProductModel).values(
+            **product.model_dump(exclude_none=True)
+        )
+
+        try:
+            result = await self.db.execute(query)
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
+            )
+
+        if not result.rowcount:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Product already exists.",
+            )
+
+        await self.db.commit()
+        await _async_invalidate_cache()
+
+        return Message(status=True, message="Product created successfully.")
+
+    async def create_bulk(
+        self, rows: List[Any], batch_size: int = 500
+    ) -> ProductSchemaBulkReport:
+        """
+        Método para criar produtos em lote.
+
+        As linhas são validadas uma a uma, as categorias são verificadas com
+        uma única consulta e os produtos são inseridos com INSERT de múltiplas
+        linhas ... ON CONFLICT DO NOTHING RETURNING, um COMMIT por lote. As
+        linhas não retornadas já existiam no banco (nome ou slug).
+
+        Parâmetros:
+        - rows: List[Any] (Linhas da requisição, ainda não validadas)
+        - batch_size: int (Quantidade de produtos por INSERT)
+
+        Retorno:
+        - ProductSchemaBulkReport (Resultado de cada linha)
+        """
+        results, products = _validate_bulk_rows(rows)
+        pending: List[BulkRow] = []
+
+        if products:
+            category_uuids = {product.category_uuid for _, product in products}
+
+            result = await self.db.execute(
+                select(CategoryModel.uuid).where(CategoryModel.uuid.in_(category_uuids))
+            )
+            existing_categories = set(result.scalars())
+
+            pending = _plan_bulk_rows(results, products, existing_categories)
+
+        query = create_insert_query(self.db, ProductModel).returning(ProductModel.uuid)
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+
+            try:
+                result = await self.db.execute(query, [values for _, values in batch])
+                inserted = set(result.scalars())
+                await self.db.commit()
+            except IntegrityError:
+                await self.db.rollback()
+                inserted = None
+
+            _set_batch_results(results, batch, inserted)
+
+        await _async_invalidate_cache()
+
+        return _bulk_report(results)
+
+    async def full_update(
+        self, product: ProductSchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar um produto.
+
+        Parâmetros:
+        - product: ProductSchemaUpdate (Produto)
+        - uuid: UUID (Identificador do produto)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        product_model = await self._get_by_uuid(uuid)
+        check_if_match(if_match, product_model)
+
+        try:
+            product_model.name = product.name
+            product_model.slug = product.slug
+            product_model.price = product.price
+            product_model.stock = product.stock
+            product_model.category_uuid = product.category_uuid
+
+            product_model.updated_at = datetime.now()
+
+            await self.db.commit()
+            await _async_invalidate_cache(uuid)
+
+            return Message(status=True, message="Product updated successfully.")
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
+            )
+
+    async def partial_update(
+        self, product: ProductSchemaUpdate, uuid: UUID, if_match: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar parcialmente um produto.
+
+        Parâmetros:
+        - product: ProductSchemaUpdate (Produto)
+        - uuid: UUID (Identificador do produto)
+        - if_match: Optional[str] (ETag esperado, cabeçalho If-Match)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        product_model = await self._get_by_uuid(uuid)
+        check_if_match(if_match, product_model)
+
+        try:
+            if product.name:
+                product_model.name = product.name
+            if product.slug:
+                product_model.slug = product.slug
+            if product.price:
+                product_model.price = product.price
+            if product.stock:
+                product_model.stock = product.stock
+            if product.category_uuid:
+                product_model.category_uuid = product.category_uuid
+
+            product_model.updated_at = datetime.now()
+
+            await self.db.commit()
+            await _async_invalidate_cache(uuid)
+
+            return Message(status=True, message="Product updated successfully.")
+        except IntegrityError as error:
+            await self.db.rollback()
+            raise_integrity_error(
+                error, "Product already exists.", "Category not found."
+            )
+
+    async def _product_exists(self, uuid: UUID) -> bool:
+        query = select(ProductModel.uuid).filter(ProductModel.uuid == uuid)
+        result = await self.db.execute(query)
+        return result.first() is not None
+
+    async def decrement_stock(self, uuid: UUID, quantity: int) -> ProductSchemaStock:
+        """
+        Método para dar baixa no estoque de um produto.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do produto)
+        - quantity: int (Quantidade retirada do estoque)
+
+        Retorno:
+        - ProductSchemaStock (Estoque restante)
+        """
+        result = await self.db.execute(create_decrement_query(uuid, quantity))
+        row = result.first()
+
+        if row is None:
+            await self.db.rollback()
+            raise stock_error(uuid, await self._product_exists(uuid))
+
+        await self.db.commit()
+        await async_invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+        return ProductSchemaStock(uuid=row.uuid, stock=row.stock)
+
+    async def reserve_stock(
+        self, reservation: ProductSchemaReservation
+    ) -> ProductSchemaReservationReport:
+        """
+        Método para dar baixa no estoque de vários produtos em uma transação.
+
+        Parâmetros:
+        - reservation: ProductSchemaReservation (Produtos e quantidades)
+
+        Retorno:
+        - ProductSchemaReservationReport (Estoque restante de cada produto)
+        """
+        quantities = merge_reservation_items(reservation.items)
+        stocks = {}
+
+        for uuid in sorted(quantities):
+            result = await self.db.execute(
+                create_decrement_query(uuid, quantities[uuid])
+            )
+            row = result.first()
+
+            if row is None:
+                await self.db.rollback()
+                raise stock_error(uuid, await self._product_exists(uuid))
+
+            stocks[uuid] = row.stock
+
+        await self.db.commit()
+
+        for uuid in quantities:
+            await async_invalidate_catalog(ProductSchemaRead, uuid=uuid)
+
+        return ProductSchemaReservationReport(
+            items=[
+                ProductSchemaStock(uuid=uuid, stock=stocks[uuid]) for uuid in quantities
+            ]
+        )
+
+    async def delete(self, uuid: UUID) -> Message:
+        """
+        Método para deletar um produto.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do produto)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+        """
+        product_model = await self._get_by_uuid(uuid)
+
+        await self.db.delete(product_model)
+        await self.db.commit()
+        await _async_invalidate_cache(uuid)
 
         return Message(status=True, message="Product deleted successfully.")
@@ -1,15 +1,28 @@
+from typing import List, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from app.core.security import security
-from app.core.auth import create_access_token, authenticate_user
+from app.core.settings import settings
+from app.core.auth import (
+    create_access_token,
+    authenticate_user,
+    async_authenticate_user,
+    get_user_by_email,
+    async_get_user_by_email,
+    async_invalidate_user_cache,
+    invalidate_user_cache,
+)
 from fastapi_pagination import Params, Page
 from fastapi_pagination.ext.sqlalchemy import paginate
+from app.core.batch import create_batch_query, create_batch_response
+from app.core.pagination import paginate_by_cursor, async_paginate_by_cursor
 from sqlalchemy.future import select
 from app.models.user_model import UserModel
 from app.schemas.user_schema import UserSchemaCreate, UserSchemaUpdate, UserSchemaLogin
-from app.schemas.responses import Message, JWTToken
+from app.schemas.responses import BatchGetResponse, CursorPage, Message, JWTToken
 from datetime import datetime
 from uuid import UUID
 
@@ -38,6 +51,19 @@ class UserController:
 
         return user
 
+    def get_many(self, uuids: List[UUID]) -> BatchGetResponse:
+        """
+        Método para retornar vários usuários em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores dos usuários)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        users = self.db.execute(create_batch_query(UserModel, uuids))
+        return create_batch_response(uuids, users.scalars().all())
+
     def get_all(self, page: int = 1, size: int = 50) -> Page[UserModel]:
         """
         Método para retornar uma lista de usuários.
@@ -54,20 +80,45 @@ class UserController:
         params = Params(page=page, size=size)
         return paginate(self.db, query, params)
 
-    def create(self, user: UserSchemaCreate) -> Message:
+    def get_all_by_cursor(
+        self, cursor: Optional[str] = None, size: int = 50, include_total: bool = False
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de usuários paginada por cursor.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+
+        Retorno:
+        - CursorPage (Lista de usuários)
+        """
+        query = select(UserModel)
+
+        return paginate_by_cursor(
+            self.db, query, UserModel, cursor, size, include_total
+        )
+
+    def create(
+        self, user: UserSchemaCreate, password_hash: Optional[str] = None
+    ) -> Message:
         """
         Método para criar um usuário.
 
         Parâmetros:
         - user: UserSchemaCreate (Usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
 
         Retorno:
         - Message (Mensagem de retorno)
 
         """
 
+        # O hash é gerado fora do try para que o 503 do pool não vire um 500
+        user.password = password_hash or security.get_password_hash(user.password)
+
         try:
-            user.password = security.get_password_hash(user.password)
             user_model = UserModel(**user.model_dump())
             self.db.add(user_model)
             self.db.commit()
@@ -84,13 +135,16 @@ class UserController:
                 detail=f"Internal server error: {e}",
             )
 
-    def full_update(self, user: UserSchemaUpdate, uuid: UUID) -> Message:
+    def full_update(
+        self, user: UserSchemaUpdate, uuid: UUID, password_hash: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar um usuário.
 
         Parâmetros:
         - user: UserSchemaUpdate (Usuário)
         - uuid: UUID (Identificador do usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
 
         Retorno:
         - Message (Mensagem de retorno)
@@ -107,19 +161,25 @@ class UserController:
 
         user_model.username = user.username
         user_model.email = user.email
-        user_model.password = security.get_password_hash(user.password)
+        user_model.password = password_hash or security.get_password_hash(user.password)
+        # A troca de senha invalida os tokens emitidos anteriormente
+        user_model.token_version += 1
         user_model.updated_at = datetime.now()
 
         self.db.commit()
+        invalidate_user_cache(uuid)
         return Message(status=True, message="User updated successfully.")
 
-    def partial_update(self, user: UserSchemaUpdate, uuid: UUID) -> Message:
+    def partial_update(
+        self, user: UserSchemaUpdate, uuid: UUID, password_hash: Optional[str] = None
+    ) -> Message:
         """
         Método para atualizar parcialmente um usuário.
 
         Parâmetros:
         - user: UserSchemaUpdate (Usuário)
         - uuid: UUID (Identificador do usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
 
         Retorno:
         - Message (Mensagem de retorno)
@@ -139,13 +199,50 @@ class UserController:
         if user.email:
             user_model.email = user.email
         if user.password:
-            user_model.password = security.get_password_hash(user.password)
+            user_model.password = password_hash or security.get_password_hash(
+                user.password
+            )
+            # A troca de senha invalida os tokens emitidos anteriormente
+            user_model.token_version += 1
 
         user_model.updated_at = datetime.now()
 
         self.db.commit()
+        invalidate_user_cache(uuid)
         return Message(status=True, message="User updated successfully.")
 
+    def get_by_email(self, email: str) -> Optional[UserModel]:
+        """
+        Método para buscar um usuário pelo e-mail, sem verificar a senha.
+
+        Parâmetros:
+        - email: str (E-mail do usuário)
+
+        Retorno:
+        - Optional[UserModel] (Usuário, ou None se não existir)
+        """
+        return get_user_by_email(email, self.db)
+
+    def create_token(self, user: UserModel) -> JWTToken:
+        """
+        Método para emitir o token de acesso de um usuário já autenticado.
+
+        Parâmetros:
+        - user: UserModel (Usuário)
+
+        Retorno:
+        - JWTToken (Token de autenticação)
+        """
+        return JWTToken(
+            access_token=create_access_token(
+                str(user.uuid),
+                user.token_version,
+                username=user.username,
+                scopes=settings.JWT_SCOPES,
+            ),
+            token_type="bearer",
+        )
+
     def login(self, user: UserSchemaLogin) -> JWTToken:
         """
         Método para realizar login.
@@ -165,10 +262,7 @@ class UserController:
                 detail="Incorrect email or password.",
             )
 
-        return JWTToken(
-            access_token=create_access_token(user.username),
-            token_type="bearer",
-        )
+        return self.create_token(user)
 
     def delete(self, uuid: UUID) -> Message:
         """
@@ -191,4 +285,260 @@ class UserController:
 
         self.db.delete(user)
         self.db.commit()
+        invalidate_user_cache(uuid)
+        return Message(status=True, message="User deleted successfully.")
+
+
+class AsyncUserController:
+    """
+    Variante assíncrona do UserController, utilizada com AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_by_uuid(self, uuid: UUID) -> UserModel:
+        result = await self.db.execute(select(UserModel).filter(UserModel.uuid == uuid))
+        user = result.scalars().first()
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found.",
+            )
+
+        return user
+
+    async def get(self, uuid: UUID) -> UserModel:
+        """
+        Método para retornar um usuário.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do usuário)
+
+        Retorno:
+        - UserModel (Usuário)
+        """
+        return await self._get_by_uuid(uuid)
+
+    async def get_many(self, uuids: List[UUID]) -> BatchGetResponse:
+        """
+        Método para retornar vários usuários em uma única consulta.
+
+        Parâmetros:
+        - uuids: List[UUID] (Identificadores dos usuários)
+
+        Retorno:
+        - BatchGetResponse (Resultado de cada UUID, na ordem requisitada)
+        """
+        users = await self.db.execute(create_batch_query(UserModel, uuids))
+        return create_batch_response(uuids, users.scalars().all())
+
+    async def get_all(self, page: int = 1, size: int = 50) -> Page[UserModel]:
+        """
+        Método para retornar uma lista de usuários.
+
+        Parâmetros:
+        - page: int (Página atual)
+        - size: int (Quantidade de registros por página)
+
+        Retorno:
+        - Page[UserModel] (Lista de usuários)
+        """
+
+        query = select(UserModel).order_by(UserModel.created_at.desc())
+        params = Params(page=page, size=size)
+        return await paginate(self.db, query, params)
+
+    async def get_all_by_cursor(
+        self, cursor: Optional[str] = None, size: int = 50, include_total: bool = False
+    ) -> CursorPage:
+        """
+        Método para retornar uma lista de usuários paginada por cursor.
+
+        Parâmetros:
+        - cursor: Optional[str] (Cursor da página anterior)
+        - size: int (Quantidade de registros por página)
+        - include_total: bool (Inclui a contagem total de registros)
+
+        Retorno:
+        - CursorPage (Lista de usuários)
+        """
+        query = select(UserModel)
+
+        return await async_paginate_by_cursor(
+            self.db, query, UserModel, cursor, size, include_total
+        )
+
+    async def create(
+        self, user: UserSchemaCreate, password_hash: Optional[str] = None
+    ) -> Message:
+        """
+        Método para criar um usuário.
+
+        Parâmetros:
+        - user: UserSchemaCreate (Usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+
+        """
+
+        user.password = password_hash or await security.async_get_password_hash(
+            user.password
+        )
+
+        try:
+            user_model = UserModel(**user.model_dump())
+            self.db.add(user_model)
+            await self.db.commit()
+
+            return Message(status=True, message="User created successfully.")
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User already exists.",
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Internal server error: {e}",
+            )
+
+    async def full_update(
+        self, user: UserSchemaUpdate, uuid: UUID, password_hash: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar um usuário.
+
+        Parâmetros:
+        - user: UserSchemaUpdate (Usuário)
+        - uuid: UUID (Identificador do usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+
+        """
+
+        user_model = await self._get_by_uuid(uuid)
+
+        user_model.username = user.username
+        user_model.email = user.email
+        user_model.password = password_hash or await security.async_get_password_hash(
+            user.password
+        )
+        # A troca de senha invalida os tokens emitidos anteriormente
+        user_model.token_version += 1
+        user_model.updated_at = datetime.now()
+
+        await self.db.commit()
+        await async_invalidate_user_cache(uuid)
+        return Message(status=True, message="User updated successfully.")
+
+    async def partial_update(
+        self, user: UserSchemaUpdate, uuid: UUID, password_hash: Optional[str] = None
+    ) -> Message:
+        """
+        Método para atualizar parcialmente um usuário.
+
+        Parâmetros:
+        - user: UserSchemaUpdate (Usuário)
+        - uuid: UUID (Identificador do usuário)
+        - password_hash: Optional[str] (Hash da senha já calculado pela rota)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+
+        """
+
+        user_model = await self._get_by_uuid(uuid)
+
+        if user.username:
+            user_model.username = user.username
+        if user.email:
+            user_model.email = user.email
+        if user.password:
+            user_model.password = (
+                password_hash or await security.async_get_password_hash(user.password)
+            )
+            # A troca de senha invalida os tokens emitidos anteriormente
+            user_model.token_version += 1
+
+        user_model.updated_at = datetime.now()
+
+        await self.db.commit()
+        await async_invalidate_user_cache(uuid)
+        return Message(status=True, message="User updated successfully.")
+
+    async def get_by_email(self, email: str) -> Optional[UserModel]:
+        """
+        Método para buscar um usuário pelo e-mail, sem verificar a senha.
+
+        Parâmetros:
+        - email: str (E-mail do usuário)
+
+        Retorno:
+        - Optional[UserModel] (Usuário, ou None se não existir)
+        """
+        return await async_get_user_by_email(email, self.db)
+
+    def create_token(self, user: UserModel) -> JWTToken:
+        """
+        Método para emitir o token de acesso de um usuário já autenticado.
+
+        Parâmetros:
+        - user: UserModel (Usuário)
+
+        Retorno:
+        - JWTToken (Token de autenticação)
+        """
+        return JWTToken(
+            access_token=create_access_token(
+                str(user.uuid),
+                user.token_version,
+                username=user.username,
+                scopes=settings.JWT_SCOPES,
+            ),
+            token_type="bearer",
+        )
+
+    async def login(self, user: UserSchemaLogin) -> JWTToken:
+        """
+        Método para realizar login.
+
+        Parâmetros:
+        - user: UserSchemaLogin (Usuário)
+
+        Retorno:
+        - JWTToken (Token de autenticação)
+        """
+
+        user = await async_authenticate_user(user.email, user.password, self.db)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect email or password.",
+            )
+
+        return self.create_token(user)
+
+    async def delete(self, uuid: UUID) -> Message:
+        """
+        Método para deletar um usuário.
+
+        Parâmetros:
+        - uuid: UUID (Identificador do usuário)
+
+        Retorno:
+        - Message (Mensagem de retorno)
+
+        """
+        user = await self._get_by_uuid(uuid)
+
+        await self.db.delete(user)
+        await self.db.commit()
+        await async_invalidate_user_cache(uuid)
         return Message(status=True, message="User deleted successfully.")
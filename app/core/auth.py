@@ -1,17 +1,156 @@
-from typing import Optional
+from typing import Any, Optional
+from hashlib import sha256
+from time import time
+from uuid import UUID
 from datetime import datetime, timedelta, timezone
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from sqlalchemy.future import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import EmailStr
 from app.core.settings import settings
 from app.core.security import security
+from app.core.cache import create_cache
 from app.models.user_model import UserModel
+from app.schemas.user_schema import UserSchemaBase
 
 # OAuth2
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.PREFIX}/login")
 
+# Cache dos usuários autenticados, indexado pelo hash do token
+auth_cache = create_cache("auth", settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL)
+
+
+def _token_key(token: str) -> str:
+    # O token não é armazenado em claro no backend do cache
+    return sha256(token.encode()).hexdigest()
+
+
+def _user_tag(uuid: UUID) -> str:
+    return f"user:{uuid}"
+
+
+def _user_snapshot(user: UserModel) -> UserSchemaBase:
+    # Apenas os dados públicos do usuário (sem o hash da senha) vão para o cache
+    return UserSchemaBase.model_validate(user, from_attributes=True)
+
+
+def _cache_ttl(exp: Optional[int]) -> float:
+    ttl = settings.AUTH_CACHE_TTL
+
+    if exp is not None:
+        ttl = min(ttl, exp - time())
+
+    return ttl
+
+
+def get_cached_user(token: str) -> Optional[UserModel]:
+    """
+    Retorna o usuário autenticado armazenado no cache de tokens.
+
+    O usuário retornado não fica associado a nenhuma sessão do banco de dados
+    e não possui a senha.
+
+    Parâmetros:
+        token (str): O token JWT usado na requisição.
+
+    Retorna:
+        UserModel: O usuário do token, ou None se ausente no cache.
+    """
+
+    snapshot = auth_cache.get(_token_key(token), UserSchemaBase)
+    return None if snapshot is None else UserModel(**snapshot.model_dump())
+
+
+async def async_get_cached_user(token: str) -> Optional[UserModel]:
+    """
+    Versão assíncrona de get_cached_user.
+    """
+
+    snapshot = await auth_cache.async_get(_token_key(token), UserSchemaBase)
+    return None if snapshot is None else UserModel(**snapshot.model_dump())
+
+
+def cache_authenticated_user(
+    token: str, user: UserModel, exp: Optional[int] = None
+) -> None:
+    """
+    Armazena uma cópia do usuário autenticado no cache de tokens.
+
+    A cópia nunca permanece no cache além da expiração do próprio token.
+
+    Parâmetros:
+        token (str): O token JWT usado na requisição.
+        user (UserModel): O usuário carregado do banco de dados.
+        exp (int): A expiração do token (timestamp), quando presente.
+    """
+
+    auth_cache.set(
+        _token_key(token), _user_snapshot(user), [_user_tag(user.uuid)], _cache_ttl(exp)
+    )
+
+
+async def async_cache_authenticated_user(
+    token: str, user: UserModel, exp: Optional[int] = None
+) -> None:
+    """
+    Versão assíncrona de cache_authenticated_user.
+    """
+
+    await auth_cache.async_set(
+        _token_key(token), _user_snapshot(user), [_user_tag(user.uuid)], _cache_ttl(exp)
+    )
+
+
+def invalidate_user_cache(uuid: UUID) -> None:
+    """
+    Remove do cache de tokens todas as entradas de um usuário.
+
+    Deve ser chamada sempre que o usuário for alterado ou removido.
+
+    Parâmetros:
+        uuid (UUID): O identificador do usuário.
+    """
+
+    auth_cache.invalidate(_user_tag(uuid))
+
+
+async def async_invalidate_user_cache(uuid: UUID) -> None:
+    """
+    Versão assíncrona de invalidate_user_cache.
+    """
+
+    await auth_cache.async_invalidate(_user_tag(uuid))
+
+
+def get_user_by_email(email: EmailStr, db: Session) -> Optional[UserModel]:
+    """
+    Busca o usuário pelo e-mail, sem verificar a senha.
+
+    Parâmetros:
+        email (EmailStr): O e-mail do usuário.
+        db (Session): A sessão do banco de dados a ser usada para a consulta.
+
+    Retorna:
+        UserModel: O usuário encontrado, ou None.
+    """
+
+    return (
+        db.execute(select(UserModel).filter(UserModel.email == email)).scalars().first()
+    )
+
+
+async def async_get_user_by_email(
+    email: EmailStr, db: AsyncSession
+) -> Optional[UserModel]:
+    """
+    Versão assíncrona de get_user_by_email.
+    """
+
+    result = await db.execute(select(UserModel).filter(UserModel.email == email))
+    return result.scalars().first()
+
 
 def authenticate_user(
     email: EmailStr, password: str, db: Session
@@ -32,9 +171,7 @@ def authenticate_user(
         UserModel: O usuário autenticado, se a autenticação for bem-sucedida. Caso contrário, None.
     """
 
-    user = (
-        db.execute(select(UserModel).filter(UserModel.email == email)).scalars().first()
-    )
+    user = get_user_by_email(email, db)
     if not user:
         return None
     if not security.verify_password(password, user.password):
@@ -42,7 +179,32 @@ def authenticate_user(
     return user
 
 
-def _create_token(type_token: str, lifetime: timedelta, sub: str) -> str:
+async def async_authenticate_user(
+    email: EmailStr, password: str, db: AsyncSession
+) -> Optional[UserModel]:
+    """
+    Versão assíncrona de authenticate_user, utilizada com sessões AsyncSession.
+
+    Parâmetros:
+        email (EmailStr): O e-mail do usuário a ser autenticado.
+        password (str): A senha do usuário a ser autenticada.
+        db (AsyncSession): A sessão assíncrona do banco de dados.
+
+    Retorna:
+        UserModel: O usuário autenticado, se a autenticação for bem-sucedida. Caso contrário, None.
+    """
+
+    user = await async_get_user_by_email(email, db)
+    if not user:
+        return None
+    if not await security.async_verify_password(password, user.password):
+        return None
+    return user
+
+
+def _create_token(
+    type_token: str, lifetime: timedelta, sub: str, version: int = 0, **claims: Any
+) -> str:
     """
     Esta função é responsável por criar um token JWT.
 
@@ -52,6 +214,8 @@ def _create_token(type_token: str, lifetime: timedelta, sub: str) -> str:
         type_token (str): O tipo do token a ser criado.
         lifetime (timedelta): O tempo de vida do token.
         sub (str): O assunto do token.
+        version (int): A versão do token do usuário (token_version).
+        claims: Claims adicionais do token (ex.: username, scopes).
 
     Retorna:
         str: O token JWT codificado.
@@ -65,19 +229,23 @@ def _create_token(type_token: str, lifetime: timedelta, sub: str) -> str:
         "exp": expire,
         "iat": datetime.now(timezone.utc),
         "sub": str(sub),
+        "ver": version,
+        **claims,
     }
 
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-def create_access_token(sub: str) -> str:
+def create_access_token(sub: str, version: int = 0, **claims: Any) -> str:
     """
     Esta função é responsável por criar um token de acesso JWT.
 
     Ela recebe um assunto e usa essa informação, juntamente com as configurações predefinidas, para criar um token de acesso JWT.
 
     Parâmetros:
-        sub (str): O assunto do token.
+        sub (str): O assunto do token (UUID do usuário).
+        version (int): A versão do token do usuário (token_version).
+        claims: Claims adicionais do token (ex.: username, scopes).
 
     Retorna:
         str: O token de acesso JWT codificado.
@@ -86,4 +254,6 @@ def create_access_token(sub: str) -> str:
         type_token="access_token",
         lifetime=timedelta(minutes=settings.JWT_EXPIRATION),
         sub=sub,
+        version=version,
+        **claims,
     )
@@ -0,0 +1,61 @@
+from typing import Any, List, Sequence
+from uuid import UUID
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from sqlalchemy import select
+from sqlalchemy.sql import Select
+from app.core.settings import settings
+from app.schemas.responses import BatchGetResponse, BatchGetResult
+
+
+def create_batch_query(model: Any, uuids: Sequence[UUID]) -> Select:
+    """
+    Cria a consulta que busca vários registros pelo UUID de uma só vez.
+
+    UUIDs repetidos são buscados uma única vez. O PostgreSQL executa o IN
+    com uma lista de valores como = ANY(...), usando o índice da chave
+    primária.
+
+    Parâmetros:
+    - model: Modelo do SQLAlchemy (com a coluna uuid)
+    - uuids: Sequence[UUID] (UUIDs requisitados)
+
+    Retorno:
+    - Select (Consulta dos registros)
+    """
+    if len(uuids) > settings.BATCH_GET_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many items, the limit is {settings.BATCH_GET_MAX_ITEMS}.",
+        )
+
+    return select(model).where(model.uuid.in_(list(dict.fromkeys(uuids))))
+
+
+def create_batch_response(
+    uuids: Sequence[UUID], items: Sequence[Any]
+) -> BatchGetResponse:
+    """
+    Monta o resultado da busca em lote, na ordem dos UUIDs requisitados.
+
+    Parâmetros:
+    - uuids: Sequence[UUID] (UUIDs requisitados)
+    - items: Sequence (Registros encontrados)
+
+    Retorno:
+    - BatchGetResponse (Resultado de cada UUID, com found ou not_found)
+    """
+    items_by_uuid = {item.uuid: item for item in items}
+    results: List[BatchGetResult] = []
+
+    for uuid in uuids:
+        item = items_by_uuid.get(uuid)
+        results.append(
+            BatchGetResult(
+                uuid=uuid, status="found" if item else "not_found", item=item
+            )
+        )
+
+    found = sum(result.status == "found" for result in results)
+
+    return BatchGetResponse(found=found, missing=len(results) - found, results=results)
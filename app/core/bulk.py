@@ -0,0 +1,79 @@
+from typing import Any, List
+from json import JSONDecodeError, loads
+from fastapi import Request, status
+from fastapi.exceptions import HTTPException
+
+# Content-Types aceitos para o formato NDJSON (um objeto JSON por linha)
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+
+def _too_many_rows(max_rows: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Too many rows, the limit is {max_rows}.",
+    )
+
+
+def _parse_ndjson_line(line: bytes, line_number: int) -> Any:
+    try:
+        return loads(line)
+    except (JSONDecodeError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid JSON at line {line_number}.",
+        )
+
+
+async def read_json_rows(request: Request, max_rows: int) -> List[Any]:
+    """
+    Lê as linhas de uma importação em lote a partir do corpo da requisição.
+
+    Aceita um array JSON ou NDJSON. No NDJSON o corpo é consumido em stream,
+    linha a linha, e a leitura é interrompida assim que o limite é excedido.
+
+    Parâmetros:
+    - request: Request (Requisição)
+    - max_rows: int (Quantidade máxima de linhas)
+
+    Retorno:
+    - List[Any] (Linhas decodificadas, ainda não validadas)
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        rows: List[Any] = []
+        buffer = b""
+        line_number = 0
+
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+
+            for line in lines:
+                line_number += 1
+
+                if line.strip():
+                    rows.append(_parse_ndjson_line(line, line_number))
+
+                if len(rows) > max_rows:
+                    raise _too_many_rows(max_rows)
+
+        if buffer.strip():
+            rows.append(_parse_ndjson_line(buffer, line_number + 1))
+
+    else:
+        try:
+            rows = loads(await request.body())
+        except (JSONDecodeError, UnicodeDecodeError):
+            rows = None
+
+        if not isinstance(rows, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The body must be a JSON array or NDJSON.",
+            )
+
+    if len(rows) > max_rows:
+        raise _too_many_rows(max_rows)
+
+    return rows
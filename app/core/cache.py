@@ -0,0 +1,425 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from typing import Type, TypeVar
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from pydantic import BaseModel
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+from app.core.settings import settings
+
+logger = getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class TTLCache:
+    """
+    Cache em memória com limite de tamanho (LRU) e tempo de expiração por item.
+
+    É seguro para uso a partir do threadpool (rotas síncronas) e do event loop,
+    e mantém contadores de acertos, falhas e remoções para as métricas.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retorna o valor armazenado ou default se ausente ou expirado.
+        """
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+
+            if expires_at <= monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Armazena um valor, removendo os itens menos usados quando cheio.
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (monotonic() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove um item do cache, se existir.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove todos os itens cujo valor satisfaz o predicado.
+
+        Retorno:
+        - int (Quantidade de itens removidos)
+        """
+        with self._lock:
+            keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+
+            for key in keys:
+                del self._data[key]
+
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove todos os itens do cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+class CacheBackend(ABC):
+    """
+    Interface dos backends de cache utilizados pelas rotas de leitura.
+
+    Os valores são schemas Pydantic, armazenados serializados em JSON, com
+    tempo de expiração e tags: invalidate remove todas as entradas marcadas
+    com qualquer uma das tags informadas. Os métodos async_* são utilizados
+    pelos controllers assíncronos.
+    """
+
+    evictions = 0
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, ttl: float, tags: Sequence[str]) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, *tags: str) -> None:
+        """
+        Remove as entradas marcadas com qualquer uma das tags.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove todas as entradas do cache.
+        """
+
+    def size(self) -> Optional[int]:
+        """
+        Retorna a quantidade de entradas, quando conhecida pelo processo.
+        """
+        return None
+
+    async def _async_get(self, key: str) -> Optional[bytes]:
+        return self._get(key)
+
+    async def _async_set(
+        self, key: str, value: bytes, ttl: float, tags: Sequence[str]
+    ) -> None:
+        self._set(key, value, ttl, tags)
+
+    async def async_invalidate(self, *tags: str) -> None:
+        """
+        Variante assíncrona de invalidate.
+        """
+        self.invalidate(*tags)
+
+    def _load(self, raw: Optional[bytes], schema: Type[T]) -> Optional[T]:
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return schema.model_validate_json(raw)
+
+    def get(self, key: str, schema: Type[T]) -> Optional[T]:
+        """
+        Retorna a entrada como uma instância de schema, ou None se ausente.
+        """
+        return self._load(self._get(key), schema)
+
+    def set(
+        self,
+        key: str,
+        value: BaseModel,
+        tags: Sequence[str] = (),
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Armazena o schema serializado por ttl segundos (padrão do cache).
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        if ttl > 0:
+            self._set(key, value.model_dump_json().encode(), ttl, tags)
+
+    async def async_get(self, key: str, schema: Type[T]) -> Optional[T]:
+        """
+        Variante assíncrona de get.
+        """
+        return self._load(await self._async_get(key), schema)
+
+    async def async_set(
+        self,
+        key: str,
+        value: BaseModel,
+        tags: Sequence[str] = (),
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Variante assíncrona de set.
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        if ttl > 0:
+            await self._async_set(key, value.model_dump_json().encode(), ttl, tags)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Backend em memória, sobre o TTLCache: cada worker mantém o seu cache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(ttl)
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    def _get(self, key: str) -> Optional[bytes]:
+        item = self._cache.get(key)
+        return None if item is None else item[0]
+
+    def _set(self, key: str, value: bytes, ttl: float, tags: Sequence[str]) -> None:
+        self._cache.set(key, (value, frozenset(tags)), ttl)
+
+    def invalidate(self, *tags: str) -> None:
+        selected = set(tags)
+        self._cache.delete_where(lambda item: not selected.isdisjoint(item[1]))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self._cache)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend compartilhado em um servidor Redis (ou compatível com o protocolo).
+
+    Cada entrada é gravada com SET PX; cada tag é um conjunto com as chaves das
+    suas entradas, que expira após o TTL padrão do cache. Falhas de conexão
+    não interrompem as requisições: a leitura é tratada como ausência e a
+    escrita é descartada.
+    """
+
+    def __init__(
+        self, client: Redis, async_client: AsyncRedis, prefix: str, ttl: float
+    ):
+        super().__init__(ttl)
+        self.client = client
+        self.async_client = async_client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _queue_set(
+        self, pipeline: Any, key: str, value: bytes, ttl: float, tags: Sequence[str]
+    ) -> None:
+        pipeline.set(self._key(key), value, px=max(int(ttl * 1000), 1))
+
+        for tag in tags:
+            pipeline.sadd(self._tag(tag), self._key(key))
+            # A tag não expira antes das entradas (o TTL nunca excede o padrão)
+            pipeline.expire(self._tag(tag), int(max(ttl, self.ttl)) + 1)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(self._key(key))
+        except RedisError as error:
+            logger.warning("Cache unavailable: %s", error)
+            return None
+
+    def _set(self, key: str, value: bytes, ttl: float, tags: Sequence[str]) -> None:
+        try:
+            with self.client.pipeline() as pipeline:
+                self._queue_set(pipeline, key, value, ttl, tags)
+                pipeline.execute()
+        except RedisError as error:
+            logger.warning("Cache unavailable: %s", error)
+
+    def invalidate(self, *tags: str) -> None:
+        names = [self._tag(tag) for tag in tags]
+
+        try:
+            with self.client.pipeline() as pipeline:
+                for name in names:
+                    pipeline.smembers(name)
+
+                keys = set().union(*pipeline.execute())
+
+            self.client.delete(*keys, *names)
+        except RedisError as error:
+            logger.error("Cache invalidation failed for %s: %s", tags, error)
+
+    def clear(self) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+
+            if keys:
+                self.client.delete(*keys)
+        except RedisError as error:
+            logger.error("Cache clear failed: %s", error)
+
+    async def _async_get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.async_client.get(self._key(key))
+        except RedisError as error:
+            logger.warning("Cache unavailable: %s", error)
+            return None
+
+    async def _async_set(
+        self, key: str, value: bytes, ttl: float, tags: Sequence[str]
+    ) -> None:
+        try:
+            async with self.async_client.pipeline() as pipeline:
+                self._queue_set(pipeline, key, value, ttl, tags)
+                await pipeline.execute()
+        except RedisError as error:
+            logger.warning("Cache unavailable: %s", error)
+
+    async def async_invalidate(self, *tags: str) -> None:
+        names = [self._tag(tag) for tag in tags]
+
+        try:
+            async with self.async_client.pipeline() as pipeline:
+                for name in names:
+                    pipeline.smembers(name)
+
+                keys = set().union(*await pipeline.execute())
+
+            await self.async_client.delete(*keys, *names)
+        except RedisError as error:
+            logger.error("Cache invalidation failed for %s: %s", tags, error)
+
+
+def create_cache(namespace: str, maxsize: int, ttl: float) -> CacheBackend:
+    """
+    Cria o backend de um cache conforme CACHE_URL.
+
+    Parâmetros:
+    - namespace: str (Prefixo das chaves no Redis, ex.: "catalog")
+    - maxsize: int (Tamanho do cache em memória; 0 desativa o cache)
+    - ttl: float (Tempo de expiração padrão, em segundos)
+
+    Retorno:
+    - CacheBackend (Redis quando CACHE_URL é informado, senão em memória)
+    """
+    if settings.CACHE_URL and maxsize > 0:
+        return RedisCacheBackend(
+            Redis.from_url(settings.CACHE_URL),
+            AsyncRedis.from_url(settings.CACHE_URL),
+            f"{settings.CACHE_PREFIX}{namespace}:",
+            ttl,
+        )
+
+    return MemoryCacheBackend(maxsize, ttl)
+
+
+# Cache de leitura do catálogo (produtos e categorias buscados por slug)
+catalog_cache = create_cache(
+    "catalog", settings.CATALOG_CACHE_SIZE, settings.CATALOG_CACHE_TTL
+)
+
+# Campos dos schemas do catálogo que identificam as entradas na invalidação
+CATALOG_TAG_FIELDS = ("uuid", "category_uuid")
+
+
+def catalog_tags(value: BaseModel) -> List[str]:
+    """
+    Retorna as tags de uma entrada do catálogo: o schema e os seus campos
+    de CATALOG_TAG_FIELDS (ex.: "ProductSchemaRead:uuid=...").
+
+    Parâmetros:
+    - value: BaseModel (Schema armazenado)
+
+    Retorno:
+    - List[str] (Tags da entrada)
+    """
+    schema = type(value)
+
+    return [schema.__name__] + [
+        f"{schema.__name__}:{name}={getattr(value, name)}"
+        for name in CATALOG_TAG_FIELDS
+        if name in schema.model_fields
+    ]
+
+
+def _invalidation_tags(schema: Type, fields: Dict[str, Any]) -> List[str]:
+    if not fields:
+        return [schema.__name__]
+
+    return [f"{schema.__name__}:{name}={value}" for name, value in fields.items()]
+
+
+def invalidate_catalog(schema: Type, **fields: Any) -> None:
+    """
+    Remove do cache do catálogo as entradas do schema com os campos informados.
+
+    Sem campos, todas as entradas do schema são removidas. Com mais de um
+    campo, são removidas as entradas que coincidem com qualquer um deles.
+
+    Parâmetros:
+    - schema: Type (Schema armazenado, ex.: ProductSchemaRead)
+    - fields: Valores que identificam as entradas (campos de CATALOG_TAG_FIELDS)
+    """
+    catalog_cache.invalidate(*_invalidation_tags(schema, fields))
+
+
+async def async_invalidate_catalog(schema: Type, **fields: Any) -> None:
+    """
+    Variante assíncrona de invalidate_catalog.
+    """
+    await catalog_cache.async_invalidate(*_invalidation_tags(schema, fields))
@@ -0,0 +1,244 @@
+from typing import Any, List, Optional
+from zlib import DEFLATED, Z_SYNC_FLUSH, compressobj
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.settings import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli é opcional
+    brotli = None
+
+# Tipos de conteúdo que já são comprimidos (ou não se beneficiam da compressão)
+_SKIPPED_MEDIA_TYPES = ("image/", "video/", "audio/", "application/zip")
+
+# Codificações aplicadas pelo middleware (sufixo do ETag da resposta comprimida)
+ENCODINGS = ("br", "gzip")
+
+
+def _accepted_encodings(accept_encoding: str) -> List[str]:
+    encodings = []
+
+    for part in accept_encoding.lower().split(","):
+        encoding, _, params = part.partition(";")
+        name, _, value = params.partition("=")
+
+        # q=0 indica que o cliente recusa a codificação
+        if name.strip() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+
+        encodings.append(encoding.strip())
+
+    return encodings
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Escolhe a codificação da resposta a partir do cabeçalho Accept-Encoding.
+
+    Brotli tem preferência quando a biblioteca está instalada; caso
+    contrário é utilizado gzip.
+
+    Parâmetros:
+    - accept_encoding: str (Cabeçalho Accept-Encoding da requisição)
+
+    Retorno:
+    - Optional[str] ("br", "gzip" ou None para enviar sem compressão)
+    """
+    encodings = _accepted_encodings(accept_encoding)
+
+    if brotli is not None and "br" in encodings:
+        return "br"
+
+    if "gzip" in encodings or "*" in encodings:
+        return "gzip"
+
+    return None
+
+
+def encode_etag(etag: str, encoding: str) -> str:
+    """
+    Adiciona a codificação ao ETag da resposta comprimida ("abc" -> "abc-gzip").
+
+    O corpo comprimido tem outros bytes, então não pode reutilizar o ETag forte
+    da resposta sem compressão (caches e Range o tratariam como idênticos).
+
+    Parâmetros:
+    - etag: str (ETag da resposta sem compressão)
+    - encoding: str (Codificação aplicada)
+
+    Retorno:
+    - str (ETag da resposta comprimida)
+    """
+    if not etag.endswith('"'):
+        return etag
+
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def decode_etag(etag: str) -> str:
+    """
+    Remove o sufixo de codificação adicionado por encode_etag.
+
+    Parâmetros:
+    - etag: str (ETag recebido do cliente)
+
+    Retorno:
+    - str (ETag da versão, independente da codificação)
+    """
+    for encoding in ENCODINGS:
+        suffix = f'-{encoding}"'
+
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+
+    return etag
+
+
+class _Compressor:
+    # Compressor incremental com a mesma interface para gzip e brotli
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor: Any = brotli.Compressor(
+                quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            # wbits 31: cabeçalho e trailer gzip
+            self._compressor = compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, DEFLATED, 31
+            )
+
+        self.encoding = encoding
+
+    def compress(self, data: bytes) -> bytes:
+        # Cada parte é enviada imediatamente, sem esperar o buffer encher
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+
+        return self._compressor.compress(data) + self._compressor.flush(Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime as respostas com Brotli ou gzip.
+
+    Respostas em uma única parte só são comprimidas a partir de
+    COMPRESSION_MINIMUM_SIZE bytes; respostas em stream (exportação) são
+    comprimidas parte a parte. Respostas sem corpo (304) e já codificadas
+    são enviadas sem alteração. O ETag de uma resposta comprimida recebe o
+    sufixo da codificação (encode_etag); um 304 repete o ETag codificado
+    quando é o que o cliente enviou em If-None-Match.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = (
+            settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = select_encoding(request_headers.get("accept-encoding", ""))
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                # O início é adiado até o primeiro corpo, que define o tamanho
+                start_message = message
+                headers = MutableHeaders(raw=message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                media_type = headers.get("content-type", "")
+
+                passthrough = (
+                    encoding is None
+                    or "content-encoding" in headers
+                    or media_type.startswith(_SKIPPED_MEDIA_TYPES)
+                )
+
+                # O cliente validou a versão comprimida: o 304 a mantém
+                if (
+                    message["status"] == 304
+                    and encoding is not None
+                    and "etag" in headers
+                ):
+                    etag = encode_etag(headers["etag"], encoding)
+
+                    if etag in request_headers.get("if-none-match", ""):
+                        headers["ETag"] = etag
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if passthrough:
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+
+                if not more_body and len(body) < self.minimum_size:
+                    # Corpo pequeno (ou vazio): a compressão não compensa
+                    passthrough = True
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding)
+                headers["Content-Encoding"] = encoding
+
+                if "etag" in headers:
+                    headers["ETag"] = encode_etag(headers["etag"], encoding)
+
+                if more_body:
+                    del headers["Content-Length"]
+                    data = compressor.compress(body)
+                else:
+                    data = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(data))
+
+                await send(start_message)
+                start_message = None
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+                return
+
+            data = compressor.compress(body)
+
+            if not more_body:
+                data += compressor.finish()
+
+            await send(
+                {"type": "http.response.body", "body": data, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,24 @@
+from typing import Any, Callable
+from inspect import iscoroutinefunction
+from fastapi.concurrency import run_in_threadpool
+
+
+async def run_controller(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Executa um método de controller a partir de uma rota assíncrona.
+
+    Métodos assíncronos (controllers AsyncSession) são aguardados diretamente no
+    event loop; métodos síncronos continuam sendo executados no threadpool, como
+    acontecia com as rotas definidas com "def".
+
+    Parâmetros:
+    - method: Callable (Método do controller)
+    - args, kwargs: Argumentos repassados ao método
+
+    Retorno:
+    - Any (Resultado do método)
+    """
+    if iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+
+    return await run_in_threadpool(method, *args, **kwargs)
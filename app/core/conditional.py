@@ -0,0 +1,181 @@
+from typing import Any, Iterable, List, Optional
+from datetime import datetime, timezone as dt_timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha1
+from fastapi import Request, Response, status
+from fastapi.exceptions import HTTPException
+from pytz import timezone
+from sqlalchemy import inspect
+from app.core.compression import decode_etag
+from app.core.settings import settings
+
+
+def _loaded_products(item: Any) -> Optional[List[Any]]:
+    # Em modelos, os produtos incluídos ficam em products_preview (a relação
+    # products nunca é lida); em schemas, no campo products
+    if inspect(item, raiseerr=False) is not None:
+        return getattr(item, "products_preview", None)
+
+    return getattr(item, "products", None)
+
+
+def _version_parts(item: Any) -> List[str]:
+    # Versão do registro: uuid e updated_at, mais a contagem e os produtos
+    # incluídos nas categorias, que mudam sem alterar o updated_at da categoria
+    parts = [str(item.uuid), str(item.updated_at)]
+    products_count = getattr(item, "products_count", None)
+    products = _loaded_products(item)
+
+    if products_count is not None:
+        parts.append(str(products_count))
+
+    if products is not None:
+        for product in products:
+            parts.extend(_version_parts(product))
+
+    return parts
+
+
+def _make_etag(parts: Iterable[str]) -> str:
+    return '"' + sha1("|".join(parts).encode()).hexdigest()[:20] + '"'
+
+
+def entity_etag(item: Any) -> str:
+    """
+    Gera o ETag de um registro a partir do uuid e do updated_at.
+
+    Parâmetros:
+    - item: Modelo ou schema de leitura (com uuid e updated_at)
+
+    Retorno:
+    - str (ETag entre aspas)
+    """
+    return _make_etag(_version_parts(item))
+
+
+def collection_etag(page: Any) -> str:
+    """
+    Gera o ETag de uma página a partir da versão de cada registro.
+
+    Inclusões e exclusões alteram os registros da página (ou o total e o
+    cursor), então também alteram o ETag.
+
+    Parâmetros:
+    - page: Page ou CursorPage
+
+    Retorno:
+    - str (ETag entre aspas)
+    """
+    parts = [str(getattr(page, "total", None)), str(getattr(page, "next_cursor", None))]
+
+    for item in page.items:
+        parts.extend(_version_parts(item))
+
+    return _make_etag(parts)
+
+
+def last_modified(item: Any) -> Optional[str]:
+    """
+    Formata o updated_at do registro como data HTTP (Last-Modified).
+
+    Datas sem fuso são gravadas no fuso de settings.TIMEZONE.
+
+    Parâmetros:
+    - item: Modelo ou schema de leitura (com updated_at)
+
+    Retorno:
+    - Optional[str] (Data HTTP em GMT, None quando não há updated_at)
+    """
+    updated_at: Optional[datetime] = item.updated_at
+
+    if updated_at is None:
+        return None
+
+    if updated_at.tzinfo is None:
+        updated_at = timezone(settings.TIMEZONE).localize(updated_at)
+
+    return format_datetime(updated_at.astimezone(dt_timezone.utc), usegmt=True)
+
+
+def _etag_in(header: str, etag: str, weak: bool) -> bool:
+    if header.strip() == "*":
+        return True
+
+    # Os ETags das respostas comprimidas identificam a mesma versão
+    tags = [decode_etag(tag.strip()) for tag in header.split(",")]
+
+    if weak:
+        # Comparação fraca (If-None-Match): o prefixo W/ é ignorado
+        tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+    return etag in tags
+
+
+def _not_modified_since(header: str, modified: Optional[str]) -> bool:
+    if modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(modified) <= parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str, modified: Optional[str] = None
+) -> Optional[Response]:
+    """
+    Avalia If-None-Match e If-Modified-Since antes da serialização.
+
+    Quando o cliente já possui a versão atual, retorna a resposta 304 (sem
+    corpo); caso contrário, adiciona ETag e Last-Modified à resposta e
+    retorna None. If-None-Match tem precedência sobre If-Modified-Since.
+
+    Parâmetros:
+    - request: Request (Requisição)
+    - response: Response (Resposta da rota, recebe os cabeçalhos)
+    - etag: str (ETag da versão atual)
+    - modified: Optional[str] (Last-Modified da versão atual)
+
+    Retorno:
+    - Optional[Response] (Resposta 304, ou None para seguir com o corpo)
+    """
+    headers = {"ETag": etag}
+
+    if modified is not None:
+        headers["Last-Modified"] = modified
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_none_match is not None:
+        not_modified = _etag_in(if_none_match, etag, weak=True)
+    elif if_modified_since is not None:
+        not_modified = _not_modified_since(if_modified_since, modified)
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+    return None
+
+
+def check_if_match(if_match: Optional[str], item: Any) -> None:
+    """
+    Valida o cabeçalho If-Match contra a versão atual do registro.
+
+    Utilizado em PUT/PATCH para controle de concorrência otimista: a
+    alteração só é aplicada se o cliente editou a versão atual.
+
+    Parâmetros:
+    - if_match: Optional[str] (Cabeçalho If-Match, opcional)
+    - item: Modelo com uuid e updated_at
+    """
+    if if_match is not None and not _etag_in(if_match, entity_etag(item), weak=False):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="The resource was modified by another request.",
+        )
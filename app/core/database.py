@@ -1,17 +1,108 @@
+from typing import Any, Dict, Type
+from uuid import uuid4
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.settings import settings
+from app.core.instrumentation import instrument_engine, instrumented_pool
+
+# Drivers assíncronos utilizados para cada banco de dados suportado
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """
+    Converte a URL de conexão síncrona para o driver assíncrono equivalente.
+
+    Parâmetros:
+    - url: str (URL de conexão síncrona)
+
+    Retorno:
+    - str (URL de conexão assíncrona)
+    """
+    database_url = make_url(url)
+    backend = database_url.get_backend_name()
+
+    return database_url.set(
+        drivername=f"{backend}+{ASYNC_DRIVERS[backend]}"
+    ).render_as_string(hide_password=False)
+
+
+def _connect_args(url: str) -> Dict[str, Any]:
+    # Parâmetros de conexão do driver: statement timeout e, no PgBouncer em
+    # modo transaction, prepared statements desativados no asyncpg
+    database_url = make_url(url)
+    connect_args: Dict[str, Any] = {}
+
+    if database_url.get_backend_name() != "postgresql":
+        return connect_args
+
+    timeout = settings.DATABASE_STATEMENT_TIMEOUT_MS
+    is_asyncpg = database_url.get_driver_name() == "asyncpg"
+
+    if timeout and is_asyncpg:
+        connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+    elif timeout:
+        connect_args["options"] = f"-c statement_timeout={timeout}"
+
+    if settings.DATABASE_POOL_MODE == "pgbouncer" and is_asyncpg:
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+    return connect_args
+
+
+def get_engine_options(url: str, pool_class: Type[Pool], name: str) -> Dict[str, Any]:
+    """
+    Monta as opções de pool e de conexão da engine a partir de Settings.
+
+    Nos modos "null" e "pgbouncer" cada sessão abre e fecha a sua conexão
+    (NullPool), deixando o pool para o PgBouncer; no modo "queue" o pool é
+    limitado por DATABASE_POOL_SIZE e DATABASE_MAX_OVERFLOW.
+
+    Parâmetros:
+    - url: str (URL de conexão)
+    - pool_class: Type[Pool] (Classe do pool no modo "queue")
+    - name: str (Nome do pool nas métricas)
+
+    Retorno:
+    - Dict[str, Any] (Argumentos de create_engine / create_async_engine)
+    """
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "echo_pool": settings.DATABASE_ECHO_POOL,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "connect_args": _connect_args(url),
+    }
+
+    if settings.DATABASE_POOL_MODE != "queue":
+        options["poolclass"] = instrumented_pool(NullPool, name)
+        return options
+
+    options.update(
+        poolclass=instrumented_pool(pool_class, name),
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    )
+
+    return options
 
 
 # Criando a engine de conexão com o banco de dados
 engine = create_engine(
-    url=settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    echo_pool=settings.DATABASE_ECHO_POOL,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    settings.DATABASE_URL,
+    **get_engine_options(settings.DATABASE_URL, QueuePool, "sync"),
 )
+instrument_engine(engine, "sync")
 
 # Criando a sessão de conexão com o banco de dados
 SessionLocal = sessionmaker(
@@ -21,3 +112,21 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
     class_=Session,
 )
+
+# Criando a engine assíncrona de conexão com o banco de dados
+async_database_url = settings.DATABASE_ASYNC_URL or get_async_database_url(
+    settings.DATABASE_URL
+)
+async_engine = create_async_engine(
+    async_database_url,
+    **get_engine_options(async_database_url, AsyncAdaptedQueuePool, "async"),
+)
+instrument_engine(async_engine.sync_engine, "async")
+
+# Criando a sessão assíncrona de conexão com o banco de dados
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
@@ -1,59 +1,115 @@
-from typing import Generator, Dict
+from typing import AsyncGenerator, Generator, Dict, Optional, Union
+from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import SecurityScopes
 from jose import JWTError, jwt
-from app.core.database import SessionLocal
+from pydantic import ValidationError
+from app.core.replicas import (
+    async_open_session,
+    async_record_write,
+    open_session,
+    record_write,
+)
+from app.core.routing import is_read_request
 from app.core.settings import settings
-from app.core.auth import oauth2_scheme
-from app.schemas.token_schema import TokenData
+from app.core.auth import (
+    oauth2_scheme,
+    async_cache_authenticated_user,
+    async_get_cached_user,
+    cache_authenticated_user,
+    get_cached_user,
+)
+from app.schemas.token_schema import Principal, TokenData
 from app.models.user_model import UserModel
 
 
-def db_session() -> Generator:
+def db_session(request: Request) -> Generator:
     """
     Dependencia para obter uma sessão do banco de dados.
 
+    Leituras (GET/HEAD e rotas READ_ONLY_ROUTE) usam uma réplica de leitura,
+    quando configurada.
+
+    Args:
+        request (Request): Requisição atual.
+
     Returns:
-        SessionLocal: Sessão do banco de dados
+        Session: Sessão do banco de dados (primário ou réplica)
 
     """
 
     # Cria uma sessão do banco de dados
-    db = SessionLocal()
+    db = open_session(request)
     try:
         # Retorna a sessão do banco de dados (yield é como um return, mas não finaliza a função)
         yield db
     finally:
         # Fecha a sessão do banco de dados
         db.close()
+        record_write(request)
 
 
-def get_current_user(
-    db: Session = Depends(db_session), token: str = Depends(oauth2_scheme)
-) -> UserModel:
+async def async_db_session(request: Request) -> AsyncGenerator:
     """
-    Dependencia para obter o usuário atual.
+    Dependencia para obter uma sessão assíncrona do banco de dados.
+
+    Leituras (GET/HEAD e rotas READ_ONLY_ROUTE) usam uma réplica de leitura,
+    quando configurada.
 
     Args:
-        db (Session, optional): Sessão do banco de dados. Defaults to Depends(db_session).
-        token (str, optional): Token de autenticação. Defaults to Depends(oauth2_scheme).
+        request (Request): Requisição atual.
 
     Returns:
-        UserModel: Usuário atual
+        AsyncSession: Sessão assíncrona do banco de dados (primário ou réplica)
+
+    """
+
+    # Cria uma sessão assíncrona do banco de dados
+    db = await async_open_session(request)
+    try:
+        yield db
+    finally:
+        # Fecha a sessão devolvendo a conexão ao pool
+        await db.close()
+        await async_record_write(request)
+
+
+def _credentials_exception() -> HTTPException:
+    """
+    Cria a exceção retornada quando as credenciais são inválidas.
+
+    Returns:
+        HTTPException: Exceção de "Não autorizado"
 
     """
 
     # Define uma exceção personalizada para problemas de credenciais
-    credentials_exception = HTTPException(
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,  # Código de status HTTP para "Não autorizado"
         detail="Could not validate credentials",  # Detalhe da mensagem de erro
         headers={"WWW-Authenticate": "Bearer"},  # Cabeçalho de autenticação exigido
     )
 
+
+def _decode_token(token: str) -> Dict:
+    """
+    Decodifica o token JWT, verificando a assinatura e a expiração.
+
+    Args:
+        token (str): Token de autenticação.
+
+    Returns:
+        Dict: Claims do token
+
+    """
+
     try:
         # Tenta decodificar o token JWT fornecido
-        payload: Dict = jwt.decode(
+        return jwt.decode(
             token=token,  # O token JWT a ser decodificado
             key=settings.JWT_SECRET,  # A chave secreta usada para decodificar o token
             algorithms=[
@@ -64,26 +120,214 @@ def get_current_user(
             },  # Não verifica o campo "aud" (audiência) do token
         )
 
-        # Extrai o nome de usuário do payload do token
-        username: str = payload.get("sub")
+    # Se ocorrer um erro durante a decodificação do token, lança uma exceção
+    except JWTError:
+        raise _credentials_exception()
+
 
-        # Se o nome de usuário não estiver presente, lança uma exceção
-        if username is None:
-            raise credentials_exception
+def _get_token_data(token: str) -> TokenData:
+    """
+    Decodifica o token JWT e extrai os dados do usuário.
 
-        # Armazena os dados do token em uma instância da classe TokenData
-        token_data: TokenData = TokenData(username=username)
+    Args:
+        token (str): Token de autenticação.
 
-    # Se ocorrer um erro durante a decodificação do token, lança uma exceção
-    except JWTError:
-        raise credentials_exception
+    Returns:
+        TokenData: Dados do token
+
+    """
+
+    payload = _decode_token(token)
+
+    # Extrai o assunto (UUID do usuário) do payload do token
+    sub: str = payload.get("sub")
+
+    # Se o assunto não estiver presente, lança uma exceção
+    if sub is None:
+        raise _credentials_exception()
+
+    # Armazena os dados do token em uma instância da classe TokenData
+    # (tokens sem a versão foram emitidos antes de token_version: versão 0)
+    return TokenData(sub=sub, version=payload.get("ver", 0), exp=payload.get("exp"))
+
+
+def _get_subject_uuid(sub: str) -> Optional[UUID]:
+    """
+    Converte o assunto do token no UUID do usuário.
+
+    Args:
+        sub (str): Assunto do token.
+
+    Returns:
+        Optional[UUID]: UUID do usuário, ou None nos tokens antigos (nome de usuário)
+
+    """
+
+    try:
+        uuid = UUID(sub)
+    except ValueError:
+        return None
+
+    # Apenas a forma canônica: um nome de usuário com 32 dígitos hexadecimais
+    # também seria aceito por UUID()
+    return uuid if str(uuid) == sub else None
+
+
+def get_current_user(
+    request: Request,
+    db: Session = Depends(db_session),
+    token: str = Depends(oauth2_scheme),
+) -> UserModel:
+    """
+    Dependencia para obter o usuário atual.
 
-    # Consulta o banco de dados para encontrar um usuário com o nome de usuário extraído do token
-    user = db.query(UserModel).filter(UserModel.username == token_data.username).first()
+    Nas leituras (GET/HEAD e rotas READ_ONLY_ROUTE) o usuário pode vir do
+    cache de tokens; nas escritas ele é sempre buscado no banco, com o
+    token_version atual.
 
-    # Se nenhum usuário for encontrado, lança uma exceção
-    if user is None:
-        raise credentials_exception
+    Args:
+        request (Request): Requisição atual.
+        db (Session, optional): Sessão do banco de dados. Defaults to Depends(db_session).
+        token (str, optional): Token de autenticação. Defaults to Depends(oauth2_scheme).
+
+    Returns:
+        UserModel: Usuário atual
+
+    """
+
+    # Token já resolvido recentemente: dispensa a decodificação e a consulta. As
+    # escritas não usam o cache: em memória ele é por worker, e um token
+    # revogado em outro worker continuaria aceito até o fim do TTL
+    if is_read_request(request.scope):
+        cached_user = get_cached_user(token)
+        if cached_user is not None:
+            return cached_user
+
+    token_data = _get_token_data(token)
+    uuid = _get_subject_uuid(token_data.sub)
+
+    # Busca o usuário pela chave primária (ou pelo nome de usuário, nos tokens antigos)
+    if uuid is not None:
+        user = db.get(UserModel, uuid)
+    elif settings.JWT_ACCEPT_USERNAME_SUBJECT:
+        user = (
+            db.execute(select(UserModel).filter(UserModel.username == token_data.sub))
+            .scalars()
+            .first()
+        )
+    else:
+        user = None
+
+    # Usuário inexistente ou senha alterada após a emissão do token
+    if user is None or user.token_version != token_data.version:
+        raise _credentials_exception()
+
+    cache_authenticated_user(token, user, token_data.exp)
 
     # Retorna o objeto do usuário
     return user
+
+
+async def async_get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(async_db_session),
+    token: str = Depends(oauth2_scheme),
+) -> UserModel:
+    """
+    Dependencia assíncrona para obter o usuário atual.
+
+    Args:
+        request (Request): Requisição atual.
+        db (AsyncSession, optional): Sessão assíncrona do banco de dados. Defaults to Depends(async_db_session).
+        token (str, optional): Token de autenticação. Defaults to Depends(oauth2_scheme).
+
+    Returns:
+        UserModel: Usuário atual
+
+    """
+
+    # As escritas sempre buscam o usuário no banco (ver get_current_user)
+    if is_read_request(request.scope):
+        cached_user = await async_get_cached_user(token)
+        if cached_user is not None:
+            return cached_user
+
+    token_data = _get_token_data(token)
+    uuid = _get_subject_uuid(token_data.sub)
+
+    if uuid is not None:
+        user = await db.get(UserModel, uuid)
+    elif settings.JWT_ACCEPT_USERNAME_SUBJECT:
+        result = await db.execute(
+            select(UserModel).filter(UserModel.username == token_data.sub)
+        )
+        user = result.scalars().first()
+    else:
+        user = None
+
+    if user is None or user.token_version != token_data.version:
+        raise _credentials_exception()
+
+    await async_cache_authenticated_user(token, user, token_data.exp)
+
+    return user
+
+
+def get_current_principal(
+    security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    Dependencia para obter o usuário autenticado apenas pelas claims do token.
+
+    Verifica a assinatura e a expiração do token, sem consultar o banco de
+    dados: alterações do usuário (inclusive a troca de senha) só se refletem
+    nos tokens emitidos depois delas.
+
+    Args:
+        security_scopes (SecurityScopes): Escopos exigidos pela rota.
+        token (str, optional): Token de autenticação. Defaults to Depends(oauth2_scheme).
+
+    Returns:
+        Principal: Usuário do token
+
+    """
+
+    payload = _decode_token(token)
+
+    # Tokens sem as claims (emitidos antes do modo claims) são recusados
+    try:
+        principal = Principal(
+            uuid=payload.get("sub"),
+            username=payload.get("username"),
+            version=payload.get("ver", 0),
+            scopes=payload.get("scopes", []),
+        )
+    except ValidationError:
+        raise _credentials_exception()
+
+    # O token precisa conter todos os escopos exigidos pela rota
+    for scope in security_scopes.scopes:
+        if scope not in principal.scopes:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions.",
+                headers={
+                    "WWW-Authenticate": f'Bearer scope="{security_scopes.scope_str}"'
+                },
+            )
+
+    return principal
+
+
+# Dependências utilizadas pelas rotas, selecionadas pela configuração DATABASE_ASYNC
+DBSession = Union[Session, AsyncSession]
+get_db = async_db_session if settings.DATABASE_ASYNC else db_session
+get_authenticated_user = (
+    async_get_current_user if settings.DATABASE_ASYNC else get_current_user
+)
+
+# Dependência das rotas de leitura do catálogo: com JWT_CLAIMS_MODE, o usuário é
+# obtido apenas das claims do token, sem consulta ao banco de dados
+get_authenticated_principal = (
+    get_current_principal if settings.JWT_CLAIMS_MODE else get_authenticated_user
+)
@@ -0,0 +1,63 @@
+from typing import Any, Iterable, Mapping, Sequence
+from csv import writer
+from datetime import datetime
+from io import StringIO
+from json import dumps
+
+# Media types de cada formato de exportação
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value: Any) -> str:
+    # UUIDs e datas não são serializáveis pelo json da biblioteca padrão
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return str(value)
+
+
+def format_ndjson(rows: Iterable[Mapping[str, Any]]) -> str:
+    """
+    Formata um lote de linhas como NDJSON (um objeto JSON por linha).
+
+    Parâmetros:
+    - rows: Iterable[Mapping] (Linhas do lote)
+
+    Retorno:
+    - str (Lote formatado)
+    """
+    return "".join(dumps(dict(row), default=_json_default) + "\n" for row in rows)
+
+
+def format_csv(rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Formata um lote de linhas como CSV.
+
+    Parâmetros:
+    - rows: Iterable[Sequence] (Linhas do lote, na ordem das colunas)
+
+    Retorno:
+    - str (Lote formatado)
+    """
+    buffer = StringIO()
+    csv_writer = writer(buffer)
+
+    for row in rows:
+        csv_writer.writerow(
+            value.isoformat() if isinstance(value, datetime) else value for value in row
+        )
+
+    return buffer.getvalue()
+
+
+def format_rows(rows: Sequence[Any], export_format: str) -> str:
+    """
+    Formata um lote de linhas (Row do SQLAlchemy) no formato de exportação.
+    """
+    if export_format == "csv":
+        return format_csv(rows)
+
+    return format_ndjson(row._mapping for row in rows)
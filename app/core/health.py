@@ -0,0 +1,98 @@
+from typing import Any, Dict, Tuple
+from time import perf_counter
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from app.core.concurrency import run_controller
+from app.core.database import async_engine, engine
+from app.core.metrics import db_pool_wait
+from app.core.replicas import replica_router
+from app.core.settings import settings
+
+# Engines reportadas em /health/db, pelo nome do pool nas métricas
+ENGINES = {
+    "sync": engine,
+    "async": async_engine.sync_engine,
+}
+
+for replica in replica_router.replicas:
+    ENGINES[replica.name] = replica.engine
+    ENGINES[f"{replica.name}-async"] = replica.async_engine.sync_engine
+
+
+def pool_status(database_engine: Engine, name: str) -> Dict[str, Any]:
+    """
+    Retorna o estado do pool de conexões e o tempo de espera acumulado.
+
+    Parâmetros:
+    - database_engine: Engine (Engine síncrona, ou async_engine.sync_engine)
+    - name: str (Nome do pool nas métricas)
+
+    Retorno:
+    - Dict[str, Any] (Conexões em uso, ociosas, overflow e esperas)
+    """
+    pool = database_engine.pool
+    waits = db_pool_wait.count(name)
+    wait_seconds = db_pool_wait.total(name)
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # overflow() é negativo enquanto o pool não atinge pool_size
+            overflow=max(pool.overflow(), 0),
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            timeout=pool.timeout(),
+        )
+
+    status.update(
+        waits=waits,
+        wait_seconds_total=round(wait_seconds, 6),
+        wait_seconds_mean=round(wait_seconds / waits, 6) if waits else 0.0,
+    )
+
+    return status
+
+
+def _ping() -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def _async_ping() -> None:
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def database_health() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Verifica a conexão com o banco (SELECT 1) e reporta o estado dos pools.
+
+    A verificação usa a engine das rotas, conforme DATABASE_ASYNC; os pools
+    das duas engines e das réplicas de leitura são reportados, junto da
+    disponibilidade de cada réplica.
+
+    Retorno:
+    - Tuple[bool, Dict[str, Any]] (Banco disponível e relatório)
+    """
+    report: Dict[str, Any] = {"mode": settings.DATABASE_POOL_MODE}
+    healthy = True
+    start = perf_counter()
+
+    try:
+        await run_controller(_async_ping if settings.DATABASE_ASYNC else _ping)
+    except Exception as error:
+        healthy = False
+        report["error"] = type(error).__name__
+
+    report["status"] = "ok" if healthy else "unavailable"
+    report["latency_ms"] = round((perf_counter() - start) * 1000, 3)
+    report["pools"] = {name: pool_status(item, name) for name, item in ENGINES.items()}
+    report["replicas"] = {
+        replica.name: "ok" if replica.available else "unavailable"
+        for replica in replica_router.replicas
+    }
+
+    return healthy, report
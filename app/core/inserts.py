@@ -0,0 +1,94 @@
+from typing import Any, NoReturn, Optional, Union
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert
+
+# SQLSTATE (PostgreSQL) e mensagens (SQLite) das violações de restrição
+CONSTRAINT_VIOLATIONS = {
+    "unique": ("23505", "UNIQUE constraint failed"),
+    "foreign_key": ("23503", "FOREIGN KEY constraint failed"),
+}
+
+# Construtores de INSERT dos bancos que suportam ON CONFLICT
+ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def create_insert_query(db: Union[Session, AsyncSession], model: Any) -> Insert:
+    """
+    Cria um INSERT ... ON CONFLICT DO NOTHING para o modelo.
+
+    Conflitos com os índices únicos (nome, slug) não geram erro: a linha
+    simplesmente não é inserida e o rowcount (ou o RETURNING) fica vazio,
+    dispensando a consulta de existência antes do INSERT. Em bancos sem
+    ON CONFLICT o INSERT comum é usado e o conflito gera IntegrityError.
+
+    Parâmetros:
+    - db: Session ou AsyncSession (Sessão do banco de dados)
+    - model: Modelo da tabela
+
+    Retorno:
+    - Insert (Consulta de inserção)
+    """
+    dialect = db.get_bind().dialect.name
+    on_conflict_insert = ON_CONFLICT_INSERTS.get(dialect)
+
+    if on_conflict_insert is None:
+        return insert(model.__table__)
+
+    return on_conflict_insert(model.__table__).on_conflict_do_nothing()
+
+
+def constraint_violation(error: IntegrityError) -> Optional[str]:
+    """
+    Identifica a restrição violada por um IntegrityError.
+
+    Usa o SQLSTATE do PostgreSQL (psycopg2 e asyncpg) ou, no SQLite, a
+    mensagem do erro.
+
+    Parâmetros:
+    - error: IntegrityError (Erro retornado pelo banco)
+
+    Retorno:
+    - Optional[str] ("unique", "foreign_key" ou None para as demais)
+    """
+    code = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+
+    for violation, (sqlstate, message) in CONSTRAINT_VIOLATIONS.items():
+        if code == sqlstate or (code is None and message in str(error.orig)):
+            return violation
+
+    return None
+
+
+def raise_integrity_error(
+    error: IntegrityError, conflict: str, not_found: Optional[str] = None
+) -> NoReturn:
+    """
+    Converte um IntegrityError na resposta HTTP correspondente.
+
+    Apenas a violação de unicidade é um conflito (409); a de chave estrangeira
+    indica um registro relacionado inexistente (404). As demais restrições não
+    são erros do cliente e o erro original é relançado.
+
+    Parâmetros:
+    - error: IntegrityError (Erro retornado pelo banco)
+    - conflict: str (Mensagem do conflito de unicidade)
+    - not_found: Optional[str] (Mensagem da chave estrangeira inexistente)
+    """
+    violation = constraint_violation(error)
+
+    if violation == "unique":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=conflict)
+
+    if violation == "foreign_key" and not_found:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+
+    raise error
@@ -0,0 +1,187 @@
+from typing import Any, Optional, Type
+from contextvars import ContextVar
+from hashlib import sha1
+from logging import getLogger
+from re import IGNORECASE, compile
+from time import perf_counter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.settings import settings
+from app.core.metrics import (
+    db_pool_checked_out,
+    db_pool_wait,
+    db_query_duration,
+    db_slow_queries,
+    http_request_duration,
+    http_request_queries,
+)
+
+logger = getLogger(__name__)
+
+# Literais e parâmetros substituídos no fingerprint das consultas
+_STRING_LITERAL = compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = compile(r"%\(\w+\)s|\$\d+|:\w+|\?")
+_IN_LIST = compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", IGNORECASE)
+_WHITESPACE = compile(r"\s+")
+
+
+class RequestStats:
+    """
+    Estatísticas do banco de dados acumuladas durante uma requisição.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+
+
+# Estatísticas da requisição atual (copiadas para o threadpool junto do contexto)
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normaliza uma consulta SQL removendo literais e parâmetros.
+
+    Consultas que diferem apenas nos valores ficam iguais, inclusive listas
+    IN com tamanhos diferentes.
+
+    Parâmetros:
+    - statement: str (Consulta SQL)
+
+    Retorno:
+    - str (Consulta normalizada)
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _BIND_PARAMETER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _IN_LIST.sub("IN (...)", statement)
+
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def fingerprint_statement(statement: str) -> str:
+    """
+    Gera o fingerprint (hash curto) da consulta normalizada.
+    """
+    return sha1(normalize_statement(statement).encode()).hexdigest()[:16]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(perf_counter())
+
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - conn.info["query_start_time"].pop()
+    db_query_duration.observe(elapsed)
+
+    stats = request_stats.get()
+    if stats is not None:
+        stats.query_time += elapsed
+
+    if elapsed * 1000 >= settings.DATABASE_SLOW_QUERY_MS:
+        fingerprint = fingerprint_statement(statement)
+        db_slow_queries.inc(fingerprint)
+        logger.warning(
+            "Slow query (%.1f ms) [%s]: %s",
+            elapsed * 1000,
+            fingerprint,
+            normalize_statement(statement),
+        )
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Registra os listeners de métricas em uma engine síncrona.
+
+    Para a engine assíncrona, utilize async_engine.sync_engine.
+
+    Parâmetros:
+    - engine: Engine (Engine do SQLAlchemy)
+    - name: str (Nome do pool nas métricas)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "checkout", lambda *args: db_pool_checked_out.inc(name))
+    event.listen(engine, "checkin", lambda *args: db_pool_checked_out.dec(name))
+
+
+def instrumented_pool(pool_class: Type[Pool], name: str) -> Type[Pool]:
+    """
+    Cria uma subclasse do pool que mede o tempo de espera por uma conexão.
+
+    O SQLAlchemy não possui evento anterior ao checkout, por isso a espera é
+    medida em volta de _do_get, que bloqueia enquanto o pool está esgotado.
+
+    Parâmetros:
+    - pool_class: Type[Pool] (Classe do pool, ex.: QueuePool)
+    - name: str (Nome do pool nas métricas)
+
+    Retorno:
+    - Type[Pool] (Classe instrumentada, passada em poolclass)
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self) -> Any:
+            start = perf_counter()
+
+            try:
+                return super()._do_get()
+            finally:
+                db_pool_wait.observe(perf_counter() - start, name)
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+
+    return InstrumentedPool
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que registra a latência e as consultas de cada requisição.
+
+    As séries usam o template da rota (ex.: /api/v1/products/{uuid}) e não o
+    caminho requisitado, para não criar uma série por identificador.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status_code = 500
+        start = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats.reset(token)
+            route = scope.get("route")
+            path = route.path if route is not None else "unmatched"
+            method = scope["method"]
+
+            http_request_duration.observe(
+                perf_counter() - start, method, path, str(status_code)
+            )
+            http_request_queries.observe(stats.queries, method, path)
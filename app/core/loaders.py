@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Sequence
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased, with_expression
+from sqlalchemy.sql import Select
+from app.models.category_model import CategoryModel
+from app.models.product_model import ProductModel
+
+
+def category_loader_options() -> List[Any]:
+    """
+    Opções de carregamento das listagens de categorias.
+
+    A relação products não é carregada; no lugar dela cada categoria recebe
+    a contagem de produtos (products_count) calculada na própria consulta.
+
+    Retorno:
+    - List (Opções para Select.options)
+    """
+    products_count = (
+        select(func.count(ProductModel.uuid))
+        .where(ProductModel.category_uuid == CategoryModel.uuid)
+        .correlate(CategoryModel)
+        .scalar_subquery()
+    )
+
+    return [with_expression(CategoryModel.products_count, products_count)]
+
+
+def create_category_products_query(
+    categories: Sequence[CategoryModel], limit: int
+) -> Select:
+    """
+    Cria a consulta que busca os primeiros produtos de cada categoria.
+
+    Os produtos de todas as categorias da página são buscados em uma única
+    consulta, limitada a "limit" produtos por categoria (row_number por
+    category_uuid), para que a resposta não cresça com o catálogo.
+
+    Parâmetros:
+    - categories: Sequence[CategoryModel] (Categorias da página)
+    - limit: int (Quantidade máxima de produtos por categoria)
+
+    Retorno:
+    - Select (Consulta dos produtos)
+    """
+    ranked = (
+        select(
+            ProductModel,
+            func.row_number()
+            .over(
+                partition_by=ProductModel.category_uuid,
+                order_by=(ProductModel.created_at.desc(), ProductModel.uuid.desc()),
+            )
+            .label("position"),
+        )
+        .where(ProductModel.category_uuid.in_([c.uuid for c in categories]))
+        .subquery()
+    )
+    product = aliased(ProductModel, ranked)
+
+    return (
+        select(product)
+        .where(ranked.c.position <= limit)
+        .order_by(ranked.c.category_uuid, ranked.c.position)
+    )
+
+
+def set_category_products(
+    categories: Sequence[CategoryModel], products: Sequence[ProductModel]
+) -> None:
+    """
+    Associa os produtos carregados às suas categorias (products_preview).
+
+    A relação products não é alterada: com cascade="all, delete-orphan", uma
+    lista parcial no estado da relação afetaria os flushes e deletes seguintes.
+
+    Parâmetros:
+    - categories: Sequence[CategoryModel] (Categorias da página)
+    - products: Sequence[ProductModel] (Produtos retornados pela consulta)
+    """
+    products_by_category: Dict[Any, List[ProductModel]] = {}
+
+    for product in products:
+        products_by_category.setdefault(product.category_uuid, []).append(product)
+
+    for category in categories:
+        category.products_preview = products_by_category.get(category.uuid, [])
@@ -0,0 +1,432 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+from glob import glob
+from hmac import compare_digest
+from json import dump, load
+from threading import Lock, Thread
+from time import sleep
+import os
+from fastapi import Request, status
+from fastapi.exceptions import HTTPException
+from app.core.auth import auth_cache
+from app.core.cache import catalog_cache
+from app.core.security import security
+from app.core.settings import settings
+
+# Família de métricas: nome, tipo, descrição e amostras (série com labels, valor)
+MetricFamily = Tuple[str, str, str, List[Tuple[str, float]]]
+
+# Caches expostos nas métricas, pelo prefixo das séries
+CACHES = {
+    "auth_cache": auth_cache,
+    "catalog_cache": catalog_cache,
+}
+
+# Limites (em segundos) dos histogramas de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Limites dos histogramas de quantidade de consultas por requisição
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Snapshot acumulado dos workers encerrados (modo multiprocesso)
+EXITED_SNAPSHOT = "exited"
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+
+    pairs = []
+
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+        pairs.append(f'{name}="{value}"')
+
+    return "{" + ",".join(pairs) + "}"
+
+
+def _metric(name: str, kind: str, description: str, value: float) -> MetricFamily:
+    return (name, kind, description, [(name, value)])
+
+
+class Counter:
+    """
+    Contador (ou gauge) com labels, no formato do Prometheus.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        kind: str = "counter",
+    ):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.kind = kind
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def collect(self) -> MetricFamily:
+        samples = []
+
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                labels = _format_labels(self.labels, label_values)
+                samples.append((f"{self.name}{labels}", value))
+
+        return (self.name, self.kind, self.description, samples)
+
+
+class Histogram:
+    """
+    Histograma com labels, no formato do Prometheus.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labels: Sequence[str] = (),
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.labels = tuple(labels)
+        # Por combinação de labels: (contagem por limite, soma, total)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], float, int]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            counts, total, count = self._values.get(
+                label_values, ([0] * len(self.buckets), 0.0, 0)
+            )
+
+            for index, bucket in enumerate(self.buckets):
+                if value <= bucket:
+                    counts[index] += 1
+
+            self._values[label_values] = (counts, total + value, count + 1)
+
+    def count(self, *label_values: str) -> int:
+        values = self._values.get(label_values)
+        return values[2] if values else 0
+
+    def total(self, *label_values: str) -> float:
+        values = self._values.get(label_values)
+        return values[1] if values else 0.0
+
+    def collect(self) -> MetricFamily:
+        names = self.labels + ("le",)
+        samples = []
+
+        with self._lock:
+            for label_values, (counts, total, count) in sorted(self._values.items()):
+                for bucket, bucket_count in zip(self.buckets, counts):
+                    labels = _format_labels(names, label_values + (bucket,))
+                    samples.append((f"{self.name}_bucket{labels}", bucket_count))
+
+                labels = _format_labels(names, label_values + ("+Inf",))
+                samples.append((f"{self.name}_bucket{labels}", count))
+
+                labels = _format_labels(self.labels, label_values)
+                samples.append((f"{self.name}_sum{labels}", total))
+                samples.append((f"{self.name}_count{labels}", count))
+
+        return (self.name, "histogram", self.description, samples)
+
+
+# Métricas das requisições e do banco de dados
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições por rota.",
+    labels=("method", "route", "status"),
+)
+http_request_queries = Histogram(
+    "http_request_queries",
+    "Consultas ao banco por requisição.",
+    buckets=QUERY_COUNT_BUCKETS,
+    labels=("method", "route"),
+)
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Duração das consultas ao banco."
+)
+db_slow_queries = Counter(
+    "db_slow_queries_total",
+    "Consultas acima de DATABASE_SLOW_QUERY_MS, por fingerprint.",
+    labels=("fingerprint",),
+)
+db_pool_wait = Histogram(
+    "db_pool_wait_seconds",
+    "Tempo de espera por uma conexão do pool.",
+    labels=("pool",),
+)
+db_pool_checked_out = Counter(
+    "db_pool_checked_out",
+    "Conexões do pool em uso.",
+    labels=("pool",),
+    kind="gauge",
+)
+
+METRICS = (
+    http_request_duration,
+    http_request_queries,
+    db_query_duration,
+    db_slow_queries,
+    db_pool_wait,
+    db_pool_checked_out,
+)
+
+
+def collect_metrics() -> List[MetricFamily]:
+    """
+    Coleta as métricas do processo atual.
+
+    Retorno:
+    - List[MetricFamily] (Famílias de métricas deste worker)
+    """
+    families = [metric.collect() for metric in METRICS]
+
+    for prefix, cache in CACHES.items():
+        families.append(
+            _metric(f"{prefix}_hits_total", "counter", "Leituras no cache.", cache.hits)
+        )
+        families.append(
+            _metric(
+                f"{prefix}_misses_total",
+                "counter",
+                "Leituras fora do cache.",
+                cache.misses,
+            )
+        )
+        families.append(
+            _metric(
+                f"{prefix}_evictions_total",
+                "counter",
+                "Entradas removidas por falta de espaço.",
+                cache.evictions,
+            )
+        )
+
+        # O tamanho de um cache compartilhado (Redis) não é conhecido pelo worker
+        if cache.size() is not None:
+            families.append(
+                _metric(f"{prefix}_size", "gauge", "Entradas no cache.", cache.size())
+            )
+
+    families.append(
+        _metric(
+            "password_hash_pending",
+            "gauge",
+            "Operações do bcrypt aguardando o pool.",
+            security.pending,
+        )
+    )
+
+    return families
+
+
+def merge_metrics(snapshots: Iterable[List[MetricFamily]]) -> List[MetricFamily]:
+    """
+    Soma as métricas de vários workers, série a série.
+
+    Contadores e histogramas são somados; os gauges (conexões em uso, tamanho
+    dos caches em memória) também, pois cada worker reporta apenas a sua parte.
+
+    Parâmetros:
+    - snapshots: Iterable[List[MetricFamily]] (Métricas de cada worker)
+
+    Retorno:
+    - List[MetricFamily] (Métricas da instância)
+    """
+    merged: Dict[str, Tuple[str, str, Dict[str, float]]] = {}
+
+    for families in snapshots:
+        for name, kind, description, samples in families:
+            _, _, values = merged.setdefault(name, (kind, description, {}))
+
+            for series, value in samples:
+                values[series] = values.get(series, 0) + value
+
+    return [
+        (name, kind, description, list(values.items()))
+        for name, (kind, description, values) in merged.items()
+    ]
+
+
+def format_metrics(families: List[MetricFamily]) -> str:
+    """
+    Gera as métricas no formato texto do Prometheus.
+
+    Parâmetros:
+    - families: List[MetricFamily] (Famílias de métricas)
+
+    Retorno:
+    - str (Métricas no formato de exposição do Prometheus)
+    """
+    lines: List[str] = []
+
+    for name, kind, description, samples in families:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+
+        for series, value in samples:
+            lines.append(f"{series} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _snapshot_path(name: str) -> str:
+    return os.path.join(settings.METRICS_MULTIPROC_DIR, f"{name}.json")
+
+
+def _read_snapshot(path: str) -> List[MetricFamily]:
+    # O arquivo de um worker pode ser removido entre a listagem e a leitura
+    try:
+        with open(path, encoding="utf-8") as file:
+            return load(file)
+    except FileNotFoundError:
+        return []
+
+
+def _write_snapshot(path: str, families: List[MetricFamily]) -> None:
+    # Gravado em um arquivo temporário e renomeado: a leitura nunca vê um JSON
+    # incompleto
+    temporary = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary, "w", encoding="utf-8") as file:
+        dump(families, file)
+
+    os.replace(temporary, path)
+
+
+_flush_lock = Lock()
+
+
+def flush_metrics() -> None:
+    """
+    Grava as métricas deste worker em METRICS_MULTIPROC_DIR.
+
+    Não faz nada quando o modo multiprocesso está desativado.
+    """
+    if not settings.METRICS_MULTIPROC_DIR:
+        return
+
+    with _flush_lock:
+        _write_snapshot(_snapshot_path(str(os.getpid())), collect_metrics())
+
+
+def _flush_periodically() -> None:
+    while True:
+        sleep(settings.METRICS_FLUSH_SECONDS)
+        flush_metrics()
+
+
+def start_metrics_flusher() -> None:
+    """
+    Inicia a thread que grava as métricas do worker a cada METRICS_FLUSH_SECONDS.
+
+    Deve ser chamada em cada worker, após o fork (post_fork do gunicorn): um
+    worker ocioso continua publicando as suas métricas.
+    """
+    if settings.METRICS_MULTIPROC_DIR:
+        Thread(target=_flush_periodically, name="metrics", daemon=True).start()
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Incorpora as métricas de um worker encerrado ao snapshot dos encerrados.
+
+    Executada pelo processo principal do gunicorn (child_exit): os contadores e
+    histogramas do worker continuam somados, para que não diminuam quando um
+    worker é reciclado, e os gauges são descartados.
+
+    Parâmetros:
+    - pid: int (PID do worker encerrado)
+    """
+    if not settings.METRICS_MULTIPROC_DIR:
+        return
+
+    path = _snapshot_path(str(pid))
+    families = [family for family in _read_snapshot(path) if family[1] != "gauge"]
+
+    if families:
+        exited = _snapshot_path(EXITED_SNAPSHOT)
+        _write_snapshot(exited, merge_metrics([_read_snapshot(exited), families]))
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def prepare_metrics_dir() -> None:
+    """
+    Cria METRICS_MULTIPROC_DIR e remove os snapshots de execuções anteriores.
+
+    Deve ser chamada pelo processo principal antes de iniciar os workers.
+    """
+    os.makedirs(settings.METRICS_MULTIPROC_DIR, exist_ok=True)
+
+    for path in glob(_snapshot_path("*")):
+        os.remove(path)
+
+
+def render_metrics() -> str:
+    """
+    Gera as métricas da aplicação no formato texto do Prometheus.
+
+    Com METRICS_MULTIPROC_DIR, as métricas de todos os workers (inclusive os
+    já encerrados) são somadas; sem ele, apenas as do worker que atendeu a
+    requisição são reportadas.
+
+    Retorno:
+    - str (Métricas no formato de exposição do Prometheus)
+    """
+    if not settings.METRICS_MULTIPROC_DIR:
+        return format_metrics(collect_metrics())
+
+    flush_metrics()
+    paths = sorted(glob(_snapshot_path("*")))
+
+    return format_metrics(merge_metrics(_read_snapshot(path) for path in paths))
+
+
+def require_metrics_access(request: Request) -> None:
+    """
+    Dependência que protege o /metrics.
+
+    Responde 404 quando METRICS_ENABLED está desativado e, com METRICS_TOKEN,
+    exige o cabeçalho "Authorization: Bearer <METRICS_TOKEN>".
+
+    Parâmetros:
+    - request: Request (Requisição)
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if not settings.METRICS_TOKEN:
+        return
+
+    authorization = request.headers.get("Authorization", "")
+
+    if not compare_digest(
+        authorization.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,171 @@
+from typing import Any, Optional, Sequence, Tuple
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from json import dumps, loads
+from uuid import UUID
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.schemas.responses import CursorPage
+
+
+def encode_cursor(created_at: datetime, uuid: UUID) -> str:
+    """
+    Gera o cursor opaco que aponta para o último registro de uma página.
+
+    Parâmetros:
+    - created_at: datetime (Data de criação do registro)
+    - uuid: UUID (Identificador do registro)
+
+    Retorno:
+    - str (Cursor codificado em base64)
+    """
+    payload = dumps([created_at.isoformat(), str(uuid)])
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+
+    Parâmetros:
+    - cursor: str (Cursor codificado em base64)
+
+    Retorno:
+    - Tuple[datetime, UUID] (Chave do último registro da página anterior)
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        created_at, uuid = loads(urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(created_at), UUID(uuid)
+    except (BinasciiError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        )
+
+
+def create_cursor_query(
+    query: Select, model: Any, cursor: Optional[str], size: int
+) -> Select:
+    """
+    Aplica a busca por chave (created_at, uuid) à consulta.
+
+    Em vez de OFFSET, a página seguinte começa logo após o último registro
+    da página anterior, usando o índice composto (created_at, uuid). Um
+    registro a mais é buscado para saber se existe uma próxima página.
+
+    Parâmetros:
+    - query: Select (Consulta base)
+    - model: Modelo com as colunas created_at e uuid
+    - cursor: Optional[str] (Cursor da página anterior)
+    - size: int (Quantidade de registros por página)
+
+    Retorno:
+    - Select (Consulta paginada)
+    """
+    query = query.order_by(None).order_by(model.created_at.desc(), model.uuid.desc())
+
+    if cursor:
+        created_at, uuid = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(model.created_at, model.uuid) < tuple_(created_at, uuid)
+        )
+
+    return query.limit(size + 1)
+
+
+def create_count_query(query: Select) -> Select:
+    """
+    Cria a consulta de contagem total da listagem.
+
+    Parâmetros:
+    - query: Select (Consulta base)
+
+    Retorno:
+    - Select (Consulta de contagem)
+    """
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def create_cursor_page(
+    items: Sequence[Any], size: int, total: Optional[int] = None
+) -> CursorPage:
+    """
+    Monta a página a partir dos registros retornados pela consulta.
+
+    Parâmetros:
+    - items: Sequence (Registros retornados, com até size + 1 itens)
+    - size: int (Quantidade de registros por página)
+    - total: Optional[int] (Total de registros, quando solicitado)
+
+    Retorno:
+    - CursorPage (Página com o cursor da próxima página)
+    """
+    items = list(items)
+    next_cursor = None
+
+    if len(items) > size:
+        items = items[:size]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].uuid)
+
+    return CursorPage(items=items, size=size, next_cursor=next_cursor, total=total)
+
+
+def paginate_by_cursor(
+    db: Session,
+    query: Select,
+    model: Any,
+    cursor: Optional[str] = None,
+    size: int = 50,
+    include_total: bool = False,
+) -> CursorPage:
+    """
+    Pagina uma consulta por cursor, sem OFFSET.
+
+    Parâmetros:
+    - db: Session (Sessão do banco de dados)
+    - query: Select (Consulta base)
+    - model: Modelo com as colunas created_at e uuid
+    - cursor: Optional[str] (Cursor da página anterior)
+    - size: int (Quantidade de registros por página)
+    - include_total: bool (Executa o COUNT(*) da listagem)
+
+    Retorno:
+    - CursorPage (Página de registros)
+    """
+    items = (
+        db.execute(create_cursor_query(query, model, cursor, size))
+        .unique()
+        .scalars()
+        .all()
+    )
+    total = db.execute(create_count_query(query)).scalar() if include_total else None
+
+    return create_cursor_page(items, size, total)
+
+
+async def async_paginate_by_cursor(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    cursor: Optional[str] = None,
+    size: int = 50,
+    include_total: bool = False,
+) -> CursorPage:
+    """
+    Versão assíncrona de paginate_by_cursor, utilizada com AsyncSession.
+    """
+    result = await db.execute(create_cursor_query(query, model, cursor, size))
+    items = result.unique().scalars().all()
+    total = (
+        (await db.execute(create_count_query(query))).scalar()
+        if include_total
+        else None
+    )
+
+    return create_cursor_page(items, size, total)
@@ -0,0 +1,300 @@
+from typing import Optional, Sequence, Tuple
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from logging import getLogger
+from math import ceil
+from threading import Lock
+from time import monotonic
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from jose import JWTError, jwt
+from redis import RedisError
+from redis.asyncio import Redis as AsyncRedis
+from starlette.datastructures import Headers
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.cache import TTLCache
+from app.core.routing import is_read_only
+from app.core.settings import settings
+
+logger = getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def parse_rate_limit(value: str) -> Optional[Tuple[int, float]]:
+    """
+    Converte um limite no formato "requisições/segundos".
+
+    O resultado é mantido em cache: cada valor é convertido uma única vez.
+
+    Parâmetros:
+    - value: str (Ex.: "10/60"; vazio desativa o limite)
+
+    Retorno:
+    - Optional[Tuple[int, float]] (Capacidade do bucket e período em segundos)
+    """
+    if not value:
+        return None
+
+    requests, _, seconds = value.partition("/")
+
+    try:
+        limit = int(requests), float(seconds)
+    except ValueError:
+        limit = None
+
+    if limit is None or limit[0] <= 0 or limit[1] <= 0:
+        raise ValueError(
+            f'Invalid rate limit {value!r}: expected "requests/seconds", '
+            'e.g. "10/60".'
+        )
+
+    return limit
+
+
+def validate_rate_limits() -> None:
+    """
+    Valida RATE_LIMIT_WRITES e RATE_LIMIT_ROUTES.
+
+    Chamada na criação do middleware, para que um limite mal formatado
+    impeça a inicialização em vez de gerar um 500 em cada requisição.
+    """
+    parse_rate_limit(settings.RATE_LIMIT_READS)
+    parse_rate_limit(settings.RATE_LIMIT_WRITES)
+
+    for route, value in settings.RATE_LIMIT_ROUTES.items():
+        try:
+            parse_rate_limit(value)
+        except ValueError as error:
+            raise ValueError(f"RATE_LIMIT_ROUTES[{route!r}]: {error}") from None
+
+
+class RateLimitStore(ABC):
+    """
+    Armazena os token buckets dos limites de requisições.
+
+    Cada bucket comporta até capacity requisições e é reabastecido
+    continuamente à taxa de capacity / period por segundo.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, capacity: int, period: float) -> float:
+        """
+        Consome um token do bucket.
+
+        Retorno:
+        - float (0 se a requisição é permitida, senão os segundos até o próximo token)
+        """
+
+    def clear(self) -> None:
+        """
+        Remove todos os buckets.
+        """
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Buckets em memória (por worker), limitados aos maxsize mais recentes.
+    """
+
+    def __init__(self, maxsize: int):
+        self._buckets = TTLCache(maxsize=maxsize)
+        self._lock = Lock()
+
+    async def hit(self, key: str, capacity: int, period: float) -> float:
+        rate = capacity / period
+        now = monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            retry_after = 0.0
+
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / rate
+
+            # O bucket expira quando estaria cheio novamente
+            self._buckets.set(key, (tokens, now), ttl=period)
+
+        return retry_after
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+# Token bucket atômico no Redis, com o relógio do servidor (TIME)
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local rate = capacity / period
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 1000))
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Buckets compartilhados em um servidor Redis, atualizados por um script Lua.
+
+    Se o Redis estiver indisponível, as requisições são permitidas.
+    """
+
+    def __init__(self, client: AsyncRedis, prefix: str):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def hit(self, key: str, capacity: int, period: float) -> float:
+        try:
+            retry_after = await self._script(
+                keys=[f"{self.prefix}{key}"], args=[capacity, period]
+            )
+        except RedisError as error:
+            logger.warning("Rate limit store unavailable: %s", error)
+            return 0.0
+
+        return float(retry_after)
+
+
+def create_rate_limit_store() -> RateLimitStore:
+    """
+    Cria o armazenamento dos limites conforme RATE_LIMIT_URL.
+
+    Retorno:
+    - RateLimitStore (Redis quando RATE_LIMIT_URL é informado, senão em memória)
+    """
+    if settings.RATE_LIMIT_URL:
+        return RedisRateLimitStore(
+            AsyncRedis.from_url(settings.RATE_LIMIT_URL),
+            f"{settings.CACHE_PREFIX}ratelimit:",
+        )
+
+    return MemoryRateLimitStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limit_store = create_rate_limit_store()
+
+
+def get_rate_limit(
+    method: str, path: str, read_only: Optional[bool] = None
+) -> Optional[Tuple[int, float]]:
+    """
+    Retorna o limite da rota: o de RATE_LIMIT_ROUTES ou, conforme a rota
+    apenas leia ou não dados, RATE_LIMIT_READS ou RATE_LIMIT_WRITES.
+
+    Parâmetros:
+    - method: str (Método HTTP)
+    - path: str (Caminho da rota, ex.: "/api/v1/products/{uuid}")
+    - read_only: Optional[bool] (Rota de leitura; None usa apenas o método)
+
+    Retorno:
+    - Optional[Tuple[int, float]] (Capacidade e período, ou None sem limite)
+    """
+    route = f"{method} {path}"
+
+    if route in settings.RATE_LIMIT_ROUTES:
+        return parse_rate_limit(settings.RATE_LIMIT_ROUTES[route])
+
+    if read_only is None:
+        read_only = is_read_only(method)
+
+    if read_only:
+        return parse_rate_limit(settings.RATE_LIMIT_READS)
+
+    return parse_rate_limit(settings.RATE_LIMIT_WRITES)
+
+
+def _get_user(headers: Headers) -> str:
+    # Usuário do token (sem consulta ao banco); tokens inválidos contam como anônimos
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+
+    if scheme.lower() != "bearer" or not token:
+        return "-"
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_aud": False},
+        )
+    except JWTError:
+        return "-"
+
+    return str(payload.get("sub", "-"))
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que aplica os limites de requisições antes do roteamento.
+
+    A rota é identificada pelo caminho do template (ex.: /products/{uuid}) e o
+    bucket é indexado pela rota, pelo IP do cliente e pelo usuário do token.
+    Requisições acima do limite recebem 429 com Retry-After, sem abrir sessão
+    com o banco de dados nem executar o bcrypt.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Sequence[BaseRoute] = ()):
+        validate_rate_limits()
+        self.app = app
+        # Lista de rotas da aplicação (preenchida após o registro do middleware)
+        self.routes = routes
+
+    def _match_route(self, scope: Scope) -> Optional[BaseRoute]:
+        for route in self.routes:
+            match, _ = route.matches(scope)
+
+            if match == Match.FULL:
+                return route
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route = self._match_route(scope)
+        path = getattr(route, "path", None)
+        limit = (
+            get_rate_limit(scope["method"], path, is_read_only(scope["method"], route))
+            if path
+            else None
+        )
+
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        address = client[0] if client else "-"
+        user = _get_user(Headers(scope=scope))
+        key = f"{scope['method']} {path}|{address}|{user}"
+
+        retry_after = await rate_limit_store.hit(key, *limit)
+
+        if retry_after > 0:
+            response = ORJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Too many requests."},
+                headers={"Retry-After": str(ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,322 @@
+from typing import AsyncIterator, Iterator, List, Optional, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from itertools import count
+from time import monotonic
+from fastapi import Request
+from jose import JWTError, jwt
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.cache import create_cache
+from app.core.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_database_url,
+    get_engine_options,
+)
+from app.core.instrumentation import instrument_engine
+from app.core.routing import is_read_request
+from app.core.settings import settings
+
+
+class RecentWrite(BaseModel):
+    """
+    Marca de escrita recente de um usuário (sub do token).
+    """
+
+    sub: str
+
+
+# Usuários que escreveram recentemente (leem do primário até o fim da janela).
+# Com CACHE_URL a marca é compartilhada: vale para todos os workers
+recent_writers = create_cache(
+    "replicas", 10000, settings.DATABASE_REPLICA_STICKY_SECONDS
+)
+
+
+class Replica:
+    """
+    Réplica de leitura, com uma engine síncrona e uma assíncrona.
+
+    As engines são criadas sem conexões abertas; pool_pre_ping é ativado
+    para que uma conexão perdida com a réplica seja detectada no checkout.
+    """
+
+    def __init__(self, url: str, name: str):
+        self.name = name
+        self.unavailable_until = 0.0
+
+        self.engine = create_engine(
+            url, **{**get_engine_options(url, QueuePool, name), "pool_pre_ping": True}
+        )
+        instrument_engine(self.engine, name)
+        self.session_factory = sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            class_=Session,
+            info={"replica": name},
+        )
+
+        async_url = get_async_database_url(url)
+        self.async_engine = create_async_engine(
+            async_url,
+            **{
+                **get_engine_options(async_url, AsyncAdaptedQueuePool, f"{name}-async"),
+                "pool_pre_ping": True,
+            },
+        )
+        instrument_engine(self.async_engine.sync_engine, f"{name}-async")
+        self.async_session_factory = async_sessionmaker(
+            bind=self.async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+            class_=AsyncSession,
+            info={"replica": name},
+        )
+
+    @property
+    def available(self) -> bool:
+        return self.unavailable_until <= monotonic()
+
+
+class ReplicaRouter:
+    """
+    Distribui as sessões de leitura entre as réplicas em rodízio.
+
+    Uma réplica que falha no checkout é ignorada por retry_seconds; sem
+    réplicas disponíveis, as leituras voltam para o primário.
+    """
+
+    def __init__(self, replicas: Sequence[Replica], retry_seconds: float):
+        self.replicas = list(replicas)
+        self.retry_seconds = retry_seconds
+        # next() de itertools.count é atômico, dispensando lock no rodízio
+        self._counter = count()
+
+    def candidates(self) -> List[Replica]:
+        """
+        Retorna as réplicas disponíveis, a partir da próxima do rodízio.
+        """
+        if not self.replicas:
+            return []
+
+        start = next(self._counter) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+
+        return [replica for replica in ordered if replica.available]
+
+    def mark_unavailable(self, replica: Replica) -> None:
+        replica.unavailable_until = monotonic() + self.retry_seconds
+
+
+def create_replicas(urls: str) -> List[Replica]:
+    """
+    Cria as réplicas a partir da lista de URLs separadas por vírgula.
+
+    Parâmetros:
+    - urls: str (DATABASE_REPLICA_URLS)
+
+    Retorno:
+    - List[Replica] (Réplicas, nomeadas replica-0, replica-1, ...)
+    """
+    return [
+        Replica(url.strip(), f"replica-{index}")
+        for index, url in enumerate(item for item in urls.split(",") if item.strip())
+    ]
+
+
+# Réplicas configuradas em DATABASE_REPLICA_URLS
+replica_router = ReplicaRouter(
+    create_replicas(settings.DATABASE_REPLICA_URLS),
+    settings.DATABASE_REPLICA_RETRY_SECONDS,
+)
+
+
+def _writer_key(request: Request) -> Optional[str]:
+    # Leituras após escrita são garantidas por usuário (sub do token). O token
+    # é validado para que um token forjado não desvie as leituras de outro
+    # usuário para o primário
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    try:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        )
+    except JWTError:
+        return None
+
+    sub = payload.get("sub")
+    return f"writer:{sub}" if sub else None
+
+
+def _read_key(request: Request) -> Optional[str]:
+    # Sem réplicas (ou fora das leituras) não há por que consultar a janela
+    if not is_read_request(request.scope) or not replica_router.replicas:
+        return None
+
+    return _writer_key(request)
+
+
+def _write_key(request: Request) -> Optional[str]:
+    if is_read_request(request.scope) or not replica_router.replicas:
+        return None
+
+    return _writer_key(request)
+
+
+def uses_replica(request: Request) -> bool:
+    """
+    Indica se a requisição pode ser atendida por uma réplica de leitura.
+
+    Parâmetros:
+    - request: Request (Requisição)
+
+    Retorno:
+    - bool (True para leituras fora da janela após uma escrita do usuário;
+      leituras são GET/HEAD e as rotas marcadas com READ_ONLY_ROUTE)
+    """
+    if not is_read_request(request.scope):
+        return False
+
+    key = _read_key(request)
+
+    return key is None or recent_writers.get(key, RecentWrite) is None
+
+
+async def async_uses_replica(request: Request) -> bool:
+    """
+    Variante assíncrona de uses_replica.
+    """
+    if not is_read_request(request.scope):
+        return False
+
+    key = _read_key(request)
+
+    return key is None or await recent_writers.async_get(key, RecentWrite) is None
+
+
+def record_write(request: Request) -> None:
+    """
+    Registra a escrita do usuário, que passa a ler do primário por alguns segundos.
+
+    Parâmetros:
+    - request: Request (Requisição)
+    """
+    key = _write_key(request)
+
+    if key is not None:
+        recent_writers.set(key, RecentWrite(sub=key))
+
+
+async def async_record_write(request: Request) -> None:
+    """
+    Variante assíncrona de record_write.
+    """
+    key = _write_key(request)
+
+    if key is not None:
+        await recent_writers.async_set(key, RecentWrite(sub=key))
+
+
+def open_session(request: Request) -> Session:
+    """
+    Abre a sessão da requisição no primário ou em uma réplica de leitura.
+
+    A conexão da réplica é obtida já na abertura (com pre-ping): se a réplica
+    estiver fora do ar, ela é marcada como indisponível e a próxima é usada.
+
+    Parâmetros:
+    - request: Request (Requisição)
+
+    Retorno:
+    - Session (Sessão do banco de dados)
+    """
+    if uses_replica(request):
+        for replica in replica_router.candidates():
+            db = replica.session_factory()
+
+            try:
+                db.connection()
+                return db
+            except (DBAPIError, OSError):
+                db.close()
+                replica_router.mark_unavailable(replica)
+
+    return SessionLocal()
+
+
+async def async_open_session(request: Request) -> AsyncSession:
+    """
+    Variante assíncrona de open_session.
+
+    Parâmetros:
+    - request: Request (Requisição)
+
+    Retorno:
+    - AsyncSession (Sessão assíncrona do banco de dados)
+    """
+    if await async_uses_replica(request):
+        for replica in replica_router.candidates():
+            db = replica.async_session_factory()
+
+            try:
+                await db.connection()
+                return db
+            except (DBAPIError, OSError):
+                await db.close()
+                replica_router.mark_unavailable(replica)
+
+    return AsyncSessionLocal()
+
+
+@contextmanager
+def primary_session(db: Session) -> Iterator[Session]:
+    """
+    Garante uma sessão no primário para leituras que preenchem os caches.
+
+    Uma réplica atrasada logo após a invalidação do cache manteria o dado
+    antigo por todo o TTL; por isso, quando db é de uma réplica, uma sessão do
+    primário é aberta (e fechada ao final).
+
+    Parâmetros:
+    - db: Session (Sessão da requisição)
+
+    Retorno:
+    - Iterator[Session] (db, ou uma sessão do primário)
+    """
+    if "replica" not in db.info:
+        yield db
+        return
+
+    primary = SessionLocal()
+
+    try:
+        yield primary
+    finally:
+        primary.close()
+
+
+@asynccontextmanager
+async def async_primary_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Variante assíncrona de primary_session.
+    """
+    if "replica" not in db.info:
+        yield db
+        return
+
+    primary = AsyncSessionLocal()
+
+    try:
+        yield primary
+    finally:
+        await primary.close()
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Optional
+from starlette.types import Scope
+
+# Métodos HTTP de leitura
+READ_METHODS = ("GET", "HEAD")
+
+# Marca das rotas que apenas leem dados apesar do método (ex.: POST batch-get):
+# atendidas pelas réplicas, sem janela de leitura após escrita e com o limite
+# de requisições das leituras. Uso: @router.post(..., openapi_extra=READ_ONLY_ROUTE)
+READ_ONLY_ROUTE: Dict[str, Any] = {"x-read-only": True}
+
+
+def is_read_only(method: str, route: Optional[Any] = None) -> bool:
+    """
+    Indica se a requisição apenas lê dados.
+
+    Parâmetros:
+    - method: str (Método HTTP)
+    - route: Optional[Any] (Rota da requisição, quando já identificada)
+
+    Retorno:
+    - bool (True para GET/HEAD e para as rotas marcadas com READ_ONLY_ROUTE)
+    """
+    if method in READ_METHODS:
+        return True
+
+    extra = getattr(route, "openapi_extra", None) or {}
+
+    return bool(extra.get("x-read-only"))
+
+
+def is_read_request(scope: Scope) -> bool:
+    """
+    Variante de is_read_only para o scope ASGI (a rota é definida pelo
+    roteamento, antes das dependências).
+    """
+    return is_read_only(scope["method"], scope.get("route"))
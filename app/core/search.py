@@ -0,0 +1,202 @@
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from json import dumps, loads
+from re import findall
+from uuid import UUID
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from sqlalchemy import cast, column, func, literal, literal_column, or_, select, table
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from app.models.product_model import ProductModel
+from app.schemas.responses import CursorPage
+
+# Objetos de busca criados pela migração fora dos modelos (ignorados pelo autogenerate)
+SEARCH_SCHEMA_OBJECTS = {
+    "search_vector",
+    "ix_products_search_vector",
+    "ix_products_name_trgm",
+}
+SEARCH_FTS_TABLE = "products_fts"
+
+# Quantidade máxima de termos considerados na busca
+SEARCH_MAX_TERMS = 10
+
+# Tabela FTS5 do SQLite, com uma cópia do nome e do slug de cada produto
+products_fts = table(SEARCH_FTS_TABLE, column("uuid"))
+
+
+def is_search_schema_object(name: Optional[str]) -> bool:
+    """
+    Indica se o objeto do banco pertence à busca textual.
+
+    Parâmetros:
+    - name: Optional[str] (Nome da tabela, coluna ou índice)
+
+    Retorno:
+    - bool (True para os objetos criados pela migração da busca)
+    """
+    if name is None:
+        return False
+
+    return name in SEARCH_SCHEMA_OBJECTS or name.startswith(SEARCH_FTS_TABLE)
+
+
+def encode_search_cursor(rank: float, uuid: UUID) -> str:
+    """
+    Gera o cursor opaco que aponta para o último resultado de uma página.
+
+    Parâmetros:
+    - rank: float (Relevância do resultado)
+    - uuid: UUID (Identificador do produto)
+
+    Retorno:
+    - str (Cursor codificado em base64)
+    """
+    payload = dumps([rank, str(uuid)])
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+    """
+    Decodifica um cursor gerado por encode_search_cursor.
+
+    Parâmetros:
+    - cursor: str (Cursor codificado em base64)
+
+    Retorno:
+    - Tuple[float, UUID] (Chave do último resultado da página anterior)
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        rank, uuid = loads(urlsafe_b64decode(cursor + padding))
+        return float(rank), UUID(uuid)
+    except (BinasciiError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        )
+
+
+def _search_terms(q: str) -> List[str]:
+    # Apenas letras e dígitos: os operadores de cada backend nunca vêm do cliente
+    terms = findall(r"\w+", q.lower())[:SEARCH_MAX_TERMS]
+
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The search query must contain letters or digits.",
+        )
+
+    return terms
+
+
+def _postgresql_search(q: str, terms: List[str]) -> Tuple[Any, Select]:
+    # tsvector gerado (GIN) com prefixo em cada termo, mais a similaridade por
+    # trigramas (GIN gin_trgm_ops) para erros de digitação
+    tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    search_vector = literal_column("products.search_vector")
+    # ts_rank + similarity é real (float4): convertido para double precision, o
+    # valor gravado no cursor (JSON) volta idêntico na comparação do keyset
+    rank = cast(
+        func.ts_rank(search_vector, tsquery) + func.similarity(ProductModel.name, q),
+        DOUBLE_PRECISION,
+    )
+    query = select(ProductModel).where(
+        or_(search_vector.op("@@")(tsquery), ProductModel.name.op("%")(q))
+    )
+
+    return rank, query
+
+
+def _sqlite_search(q: str, terms: List[str]) -> Tuple[Any, Select]:
+    # FTS5 com prefixo em cada termo; bm25 é menor para os mais relevantes
+    match = " ".join(f'"{term}"*' for term in terms)
+    rank = -func.bm25(literal_column(SEARCH_FTS_TABLE))
+    query = (
+        select(ProductModel)
+        .join(products_fts, products_fts.c.uuid == ProductModel.uuid)
+        .where(literal_column(SEARCH_FTS_TABLE).op("MATCH")(match))
+    )
+
+    return rank, query
+
+
+def _like_search(q: str, terms: List[str]) -> Tuple[Any, Select]:
+    # Bancos sem busca textual: todos os termos no nome, sem relevância
+    query = select(ProductModel).where(
+        *(ProductModel.name.ilike(f"%{term}%") for term in terms)
+    )
+
+    return literal(0.0), query
+
+
+# Construtores da busca de cada banco suportado
+SEARCH_QUERIES = {
+    "postgresql": _postgresql_search,
+    "sqlite": _sqlite_search,
+}
+
+
+def create_search_query(
+    db: Union[Session, AsyncSession], q: str, cursor: Optional[str], size: int
+) -> Select:
+    """
+    Cria a consulta da busca textual de produtos por nome e slug.
+
+    Os resultados são ordenados por relevância e paginados por cursor sobre a
+    chave (relevância, uuid). Um resultado a mais é buscado para saber se
+    existe uma próxima página.
+
+    Parâmetros:
+    - db: Session ou AsyncSession (Sessão do banco de dados)
+    - q: str (Texto buscado)
+    - cursor: Optional[str] (Cursor da página anterior)
+    - size: int (Quantidade de resultados por página)
+
+    Retorno:
+    - Select (Consulta com as colunas ProductModel e rank)
+    """
+    dialect = db.get_bind().dialect.name
+    search = SEARCH_QUERIES.get(dialect, _like_search)
+    rank, query = search(q, _search_terms(q))
+
+    if cursor:
+        last_rank, last_uuid = decode_search_cursor(cursor)
+        query = query.where(
+            tuple_(rank, ProductModel.uuid) < tuple_(last_rank, last_uuid)
+        )
+
+    return (
+        query.add_columns(rank.label("rank"))
+        .order_by(rank.desc(), ProductModel.uuid.desc())
+        .limit(size + 1)
+    )
+
+
+def create_search_page(rows: Sequence[Any], size: int) -> CursorPage:
+    """
+    Monta a página a partir das linhas (produto, rank) da busca.
+
+    Parâmetros:
+    - rows: Sequence (Linhas retornadas, com até size + 1 itens)
+    - size: int (Quantidade de resultados por página)
+
+    Retorno:
+    - CursorPage (Página com o cursor da próxima página)
+    """
+    rows = list(rows)
+    next_cursor = None
+
+    if len(rows) > size:
+        rows = rows[:size]
+        product, rank = rows[-1]
+        next_cursor = encode_search_cursor(rank, product.uuid)
+
+    return CursorPage(
+        items=[product for product, _ in rows], size=size, next_cursor=next_cursor
+    )
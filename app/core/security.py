@@ -1,22 +1,122 @@
+from typing import Any, Callable, Optional
+from asyncio import wrap_future
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+from fastapi import status
+from fastapi.exceptions import HTTPException
 from passlib.context import CryptContext
+from app.core.settings import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Executada nos processos do pool (precisa ser uma função de módulo)
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _get_password_hash(password: str) -> str:
+    # Executada nos processos do pool (precisa ser uma função de módulo)
+    return pwd_context.hash(password)
+
+
 class Security:
     """
     Classe responsável por prover métodos de segurança.
     A classe possui os seguintes métodos:
     - verify_password: Método para verificar a senha.
     - get_password_hash: Método para obter o hash da senha.
+    - async_verify_password: Versão assíncrona de verify_password.
+    - async_get_password_hash: Versão assíncrona de get_password_hash.
+
+    O bcrypt é executado em um pool de processos dedicado, fora do threadpool
+    e do GIL. Quando há mais de max_pending operações aguardando o pool, novas
+    requisições são recusadas com 503. Com workers igual a 0 o bcrypt é
+    executado na própria thread da requisição.
     """
 
-    def verify_password(self, plain_password: str, hashed_password: str):
-        return pwd_context.verify(plain_password, hashed_password)
+    def __init__(self, workers: int = 2, max_pending: int = 32):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" evita copiar as threads e o event loop do processo atual
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=get_context("spawn")
+            )
+
+        return self._executor
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    def _submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, try again later.",
+                    headers={"Retry-After": "1"},
+                )
+
+            try:
+                future = self._get_executor().submit(function, *args)
+            except BrokenProcessPool:
+                # Um processo do pool morreu: recria o pool e tenta novamente
+                self._executor = None
+                future = self._get_executor().submit(function, *args)
+
+            self.pending += 1
+
+        future.add_done_callback(self._release)
+        return future
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        if self.workers <= 0:
+            return _verify_password(plain_password, hashed_password)
+
+        return self._submit(_verify_password, plain_password, hashed_password).result()
+
+    def get_password_hash(self, password: str) -> str:
+        if self.workers <= 0:
+            return _get_password_hash(password)
+
+        return self._submit(_get_password_hash, password).result()
+
+    async def async_verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        if self.workers <= 0:
+            return _verify_password(plain_password, hashed_password)
+
+        return await wrap_future(
+            self._submit(_verify_password, plain_password, hashed_password)
+        )
+
+    async def async_get_password_hash(self, password: str) -> str:
+        if self.workers <= 0:
+            return _get_password_hash(password)
+
+        return await wrap_future(self._submit(_get_password_hash, password))
 
-    def get_password_hash(self, password: str):
-        return pwd_context.hash(password)
+    def shutdown(self) -> None:
+        """
+        Encerra o pool de processos, se tiver sido criado.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
 
 # Instanciando a classe Security
-security = Security()
+security = Security(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
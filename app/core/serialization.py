@@ -0,0 +1,37 @@
+from typing import Any, Type
+from fastapi import Response
+from fastapi_pagination import Page
+from pydantic import BaseModel
+from app.schemas.responses import CursorPage
+
+
+def _page_model(page: Any, schema: Type[BaseModel]) -> Type[BaseModel]:
+    # O Pydantic mantém em cache os modelos genéricos já parametrizados
+    page_class = CursorPage if isinstance(page, CursorPage) else Page
+    return page_class[schema]
+
+
+def page_response(page: Any, schema: Type[BaseModel], response: Response) -> Response:
+    """
+    Serializa uma página diretamente em JSON com model_dump_json.
+
+    Evita o caminho padrão do FastAPI (validação do response_model,
+    jsonable_encoder e json.dumps), que nas listagens converte cada registro
+    em dicionário antes de gerar o JSON. Os cabeçalhos já definidos na
+    resposta da rota (ETag) são mantidos.
+
+    Parâmetros:
+    - page: Page ou CursorPage (Página retornada pelo controller)
+    - schema: Type[BaseModel] (Schema de leitura dos itens)
+    - response: Response (Resposta da rota, com os cabeçalhos)
+
+    Retorno:
+    - Response (Resposta JSON já serializada)
+    """
+    page_model = _page_model(page, schema)
+    content = page_model.model_validate(page, from_attributes=True).model_dump_json()
+
+    serialized = Response(content=content, media_type="application/json")
+    serialized.headers.update(response.headers)
+
+    return serialized
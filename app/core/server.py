@@ -0,0 +1,36 @@
+from typing import Iterator
+from sqlalchemy.engine import Engine
+from app.core.database import async_engine, engine
+from app.core.replicas import replica_router
+
+
+def _engines() -> Iterator[Engine]:
+    yield engine
+    yield async_engine.sync_engine
+
+    for replica in replica_router.replicas:
+        yield replica.engine
+        yield replica.async_engine.sync_engine
+
+
+def reset_engines() -> None:
+    """
+    Descarta os pools herdados do processo principal após o fork.
+
+    As conexões não são fechadas (close=False): elas pertencem ao processo
+    principal, e cada worker abre as suas na primeira requisição.
+    """
+    for item in _engines():
+        item.dispose(close=False)
+
+
+async def shutdown_engines() -> None:
+    """
+    Fecha as conexões de todas as engines ao encerrar o worker.
+    """
+    engine.dispose()
+    await async_engine.dispose()
+
+    for replica in replica_router.replicas:
+        replica.engine.dispose()
+        await replica.async_engine.dispose()
@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import ClassVar, Dict, List, Literal
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 from sqlalchemy.orm import declarative_base
@@ -22,16 +22,111 @@ class Settings(BaseSettings):
     DATABASE_BASE_MODEL: ClassVar = declarative_base()
     DATABASE_ECHO: bool = False
     DATABASE_ECHO_POOL: bool = False
+    # Pool de conexões: "queue" (padrão), "null" (sem pool) ou "pgbouncer"
+    # (sem pool e sem prepared statements, para o modo transaction do PgBouncer)
+    DATABASE_POOL_MODE: Literal["queue", "null", "pgbouncer"] = "queue"
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = False
+    # Tempo máximo de cada consulta no PostgreSQL (0 desativa)
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 0
+    DATABASE_ASYNC: bool = False
+    DATABASE_ASYNC_URL: str = env_config("DATABASE_ASYNC_URL", default="")
+    DATABASE_SLOW_QUERY_MS: int = 200
+
+    # Réplicas de leitura (URLs separadas por vírgula, vazio desativa): rotas GET
+    # usam as réplicas em rodízio; após uma escrita, o mesmo usuário lê do
+    # primário por DATABASE_REPLICA_STICKY_SECONDS (marca compartilhada via
+    # CACHE_URL); uma réplica com falha é ignorada por
+    # DATABASE_REPLICA_RETRY_SECONDS
+    DATABASE_REPLICA_URLS: str = ""
+    DATABASE_REPLICA_STICKY_SECONDS: float = 5.0
+    DATABASE_REPLICA_RETRY_SECONDS: float = 30.0
 
     # Configurações do JWT
     JWT_SECRET: str = env_config("JWT_SECRET")
     JWT_ALGORITHM: str = env_config("JWT_ALGORITHM")
     JWT_EXPIRATION: int = env_config("JWT_EXPIRATION", cast=int)
+    # Aceita os tokens antigos, com o nome de usuário no sub (em vez do UUID);
+    # pode ser desativado após JWT_EXPIRATION minutos da atualização
+    JWT_ACCEPT_USERNAME_SUBJECT: bool = True
+    # Escopos dos tokens emitidos no login
+    JWT_SCOPES: List[str] = ["read", "write"]
+    # Modo claims: as rotas de leitura do catálogo autenticam apenas pelas claims
+    # do token (UUID, nome de usuário, versão e escopos), sem consultar o banco;
+    # as rotas de escrita continuam buscando o usuário no banco
+    JWT_CLAIMS_MODE: bool = False
+
+    # Cache dos usuários autenticados, usado apenas nas leituras (tamanho 0
+    # desativa o cache); as escritas sempre buscam o usuário no banco
+    AUTH_CACHE_SIZE: int = 1024
+    AUTH_CACHE_TTL: int = 60
+
+    # Pool de processos do bcrypt (0 executa o hash na thread da requisição);
+    # acima de PASSWORD_HASH_MAX_PENDING operações na fila a rota responde 503,
+    # limite mantido abaixo das 40 threads do threadpool do Starlette
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
 
     # Configurações do FastAPI
     PREFIX: str = "/api/v1"
+    CATEGORY_PRODUCTS_EXPAND_LIMIT: int = 10
+    PRODUCT_BULK_BATCH_SIZE: int = 500
+    PRODUCT_BULK_MAX_ROWS: int = 10000
+    PRODUCT_EXPORT_BATCH_SIZE: int = 1000
+    BATCH_GET_MAX_ITEMS: int = 100
+    PRODUCT_RESERVATION_MAX_ITEMS: int = 100
+
+    # Backend dos caches: vazio mantém os caches em memória (por worker); uma
+    # URL redis:// compartilha os caches entre os workers e as instâncias
+    CACHE_URL: str = ""
+    CACHE_PREFIX: str = "projeto02:"
+
+    # Limite de requisições (token bucket) por rota, IP do cliente e usuário, no
+    # formato "requisições/segundos". RATE_LIMIT_ROUTES define o limite de rotas
+    # específicas ("MÉTODO /caminho"), RATE_LIMIT_READS o das demais leituras
+    # (GET/HEAD e rotas READ_ONLY_ROUTE, como batch-get) e RATE_LIMIT_WRITES o
+    # das demais escritas; vazio desativa o limite. Sem RATE_LIMIT_URL, os contadores ficam
+    # em memória (por worker); uma URL redis:// os compartilha entre os workers
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_URL: str = ""
+    RATE_LIMIT_READS: str = ""
+    RATE_LIMIT_WRITES: str = "60/60"
+    RATE_LIMIT_ROUTES: Dict[str, str] = {"POST /api/v1/login": "10/60"}
+    RATE_LIMIT_MAX_KEYS: int = 100000
+
+    # Cache de leitura do catálogo por slug (tamanho 0 desativa o cache)
+    CATALOG_CACHE_SIZE: int = 1024
+    CATALOG_CACHE_TTL: int = 60
+
+    # Compressão das respostas (gzip ou Brotli, a partir do tamanho mínimo em bytes)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Métricas no formato Prometheus (/metrics): METRICS_ENABLED desativado
+    # responde 404 e METRICS_TOKEN exige "Authorization: Bearer <token>". Com
+    # METRICS_MULTIPROC_DIR (definido pelo gunicorn.conf.py com mais de um
+    # worker), cada worker grava as métricas no diretório a cada
+    # METRICS_FLUSH_SECONDS e o /metrics soma as de todos os workers
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_FLUSH_SECONDS: float = 1.0
+
+    # Servidor de produção (gunicorn.conf.py): WEB_CONCURRENCY igual a 0 usa um
+    # worker por CPU; cada worker é reciclado após WEB_MAX_REQUESTS requisições
+    # (mais um jitter) e tem WEB_GRACEFUL_TIMEOUT segundos para concluir as
+    # requisições em andamento ao ser encerrado
+    WEB_BIND: str = "0.0.0.0:8000"
+    WEB_CONCURRENCY: int = 0
+    WEB_MAX_REQUESTS: int = 10000
+    WEB_MAX_REQUESTS_JITTER: int = 1000
+    WEB_GRACEFUL_TIMEOUT: int = 30
+    WEB_TIMEOUT: int = 60
+    WEB_KEEPALIVE: int = 5
     TIMEZONE: str = env_config("TIMEZONE")
 
 
@@ -0,0 +1,91 @@
+from typing import Dict, Sequence
+from datetime import datetime
+from uuid import UUID
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from sqlalchemy import update
+from sqlalchemy.sql import Update
+from app.core.settings import settings
+from app.models.product_model import ProductModel
+from app.schemas.product_schema import ProductSchemaReservationItem
+
+
+def create_decrement_query(uuid: UUID, quantity: int) -> Update:
+    """
+    Cria o UPDATE que dá baixa no estoque de um produto em uma única instrução.
+
+    A condição stock >= quantity é avaliada pelo próprio banco junto da
+    alteração, então baixas concorrentes nunca sobrescrevem umas às outras
+    nem deixam o estoque negativo, sem leitura prévia da linha. Quando o
+    produto não existe ou o estoque é insuficiente, nenhuma linha é
+    retornada.
+
+    Parâmetros:
+    - uuid: UUID (Identificador do produto)
+    - quantity: int (Quantidade retirada do estoque)
+
+    Retorno:
+    - Update (Consulta com RETURNING uuid, stock)
+    """
+    return (
+        update(ProductModel)
+        .where(ProductModel.uuid == uuid, ProductModel.stock >= quantity)
+        .values(stock=ProductModel.stock - quantity, updated_at=datetime.now())
+        .returning(ProductModel.uuid, ProductModel.stock)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def merge_reservation_items(
+    items: Sequence[ProductSchemaReservationItem],
+) -> Dict[UUID, int]:
+    """
+    Soma as quantidades de produtos repetidos em uma reserva.
+
+    A reserva bloqueia uma linha por produto em uma única transação, então a
+    quantidade de itens é limitada a PRODUCT_RESERVATION_MAX_ITEMS.
+
+    Parâmetros:
+    - items: Sequence[ProductSchemaReservationItem] (Produtos da reserva)
+
+    Retorno:
+    - Dict[UUID, int] (Quantidade por produto, na ordem da requisição)
+    """
+    if len(items) > settings.PRODUCT_RESERVATION_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(
+                "Too many items, the limit is "
+                f"{settings.PRODUCT_RESERVATION_MAX_ITEMS}."
+            ),
+        )
+
+    quantities: Dict[UUID, int] = {}
+
+    for item in items:
+        quantities[item.uuid] = quantities.get(item.uuid, 0) + item.quantity
+
+    return quantities
+
+
+def stock_error(uuid: UUID, exists: bool) -> HTTPException:
+    """
+    Gera o erro de uma baixa de estoque que não alterou nenhuma linha.
+
+    Parâmetros:
+    - uuid: UUID (Identificador do produto)
+    - exists: bool (Indica se o produto existe)
+
+    Retorno:
+    - HTTPException (404 para produto inexistente, 409 para estoque insuficiente)
+    """
+    if not exists:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Product {uuid} not found.",
+        )
+
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Insufficient stock for product {uuid}.",
+    )
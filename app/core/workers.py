@@ -0,0 +1,83 @@
+from typing import Dict
+from tempfile import mkdtemp
+import os
+from app.core.metrics import prepare_metrics_dir
+from app.core.settings import settings
+
+
+def cpu_count() -> int:
+    """
+    Retorna o número de CPUs disponíveis para o processo.
+
+    Retorno:
+    - int (CPUs da afinidade do processo, ou do sistema)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        # Respeita a afinidade do processo (taskset, cpuset do container)
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    """
+    Retorna o número de workers do servidor de produção.
+
+    Retorno:
+    - int (WEB_CONCURRENCY, ou um worker por CPU quando igual a 0)
+    """
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+
+    return cpu_count()
+
+
+def worker_pool_settings(workers: int) -> Dict[str, int]:
+    """
+    Divide o pool de conexões configurado entre os workers.
+
+    DATABASE_POOL_SIZE e DATABASE_MAX_OVERFLOW passam a ser o total da
+    instância, de forma que o número de conexões abertas com o banco não
+    cresça com o número de workers. Cada worker mantém ao menos uma conexão.
+
+    Parâmetros:
+    - workers: int (Número de workers)
+
+    Retorno:
+    - Dict[str, int] (DATABASE_POOL_SIZE e DATABASE_MAX_OVERFLOW por worker)
+    """
+    return {
+        "DATABASE_POOL_SIZE": max(settings.DATABASE_POOL_SIZE // workers, 1),
+        "DATABASE_MAX_OVERFLOW": settings.DATABASE_MAX_OVERFLOW // workers,
+    }
+
+
+def configure_worker_pools(workers: int) -> None:
+    """
+    Aplica em Settings o pool de conexões por worker.
+
+    Deve ser chamada antes da importação de app.main, que cria as engines.
+
+    Parâmetros:
+    - workers: int (Número de workers)
+    """
+    for name, value in worker_pool_settings(workers).items():
+        setattr(settings, name, value)
+
+
+def configure_worker_metrics(workers: int) -> None:
+    """
+    Ativa o modo multiprocesso das métricas quando há mais de um worker.
+
+    Sem METRICS_MULTIPROC_DIR, cada scrape do /metrics seria atendido por um
+    worker qualquer e reportaria apenas as métricas dele. Com mais de um
+    worker e sem diretório configurado, um diretório temporário é criado.
+
+    Parâmetros:
+    - workers: int (Número de workers)
+    """
+    if workers > 1 and not settings.METRICS_MULTIPROC_DIR:
+        settings.METRICS_MULTIPROC_DIR = mkdtemp(prefix="metrics-")
+
+    if settings.METRICS_MULTIPROC_DIR:
+        prepare_metrics_dir()
@@ -1,16 +1,40 @@
-from fastapi import FastAPI, status
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, status
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.encoders import jsonable_encoder
 from app.core.settings import settings
+from app.core.metrics import flush_metrics, render_metrics, require_metrics_access
+from app.core.health import database_health
+from app.core.compression import CompressionMiddleware
+from app.core.instrumentation import MetricsMiddleware
+from app.core.ratelimit import RateLimitMiddleware
+from app.core.security import security
+from app.core.server import shutdown_engines
 from app.routers.user_routers import router as user_router
 from app.routers.category_routers import router as category_router
 from app.routers.product_routers import router as product_router
 
-# Criando a aplicação FastAPI
-app = FastAPI()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Encerra o pool de processos do bcrypt
+    security.shutdown()
+    # Grava as últimas métricas do worker (modo multiprocesso)
+    flush_metrics()
+    # Fecha as conexões com o banco após concluir as requisições em andamento
+    await shutdown_engines()
+
+
+# Criando a aplicação FastAPI (respostas JSON serializadas com orjson)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+
+# Limite de requisições por rota, IP e usuário (dentro do CORS, para que as
+# respostas 429 também recebam os cabeçalhos CORS)
+app.add_middleware(RateLimitMiddleware, routes=app.routes)
 
 # Configurando o CORS
 app.add_middleware(
@@ -21,6 +45,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas de latência e de consultas por rota
+app.add_middleware(MetricsMiddleware)
+
+# Compressão gzip/Brotli (middleware mais externo)
+app.add_middleware(CompressionMiddleware)
+
 # Configurando rotas
 app.include_router(user_router, prefix=settings.PREFIX)
 app.include_router(category_router, prefix=settings.PREFIX)
@@ -30,7 +60,7 @@ app.include_router(product_router, prefix=settings.PREFIX)
 # Tratamento de exceções
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=jsonable_encoder({"detail": exc.errors(), "body": exc.body}),
     )
@@ -40,3 +70,27 @@ async def validation_exception_handler(request, exc):
 @app.get("/", tags=["Health Check"], status_code=status.HTTP_200_OK)
 def health_check():
     return {"status": "ok"}
+
+
+# Health Check do banco de dados e dos pools de conexões
+@app.get("/health/db", tags=["Health Check"], status_code=status.HTTP_200_OK)
+async def database_health_check():
+    healthy, report = await database_health()
+
+    if not healthy:
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=report
+        )
+
+    return report
+
+
+# Métricas (formato Prometheus)
+@app.get(
+    "/metrics",
+    tags=["Metrics"],
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_access)],
+)
+def metrics():
+    return render_metrics()
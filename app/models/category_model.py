@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, DateTime, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, UUID, Index
+from sqlalchemy.orm import relationship, query_expression
 from app.core.settings import settings
 from datetime import datetime
 from pytz import timezone
@@ -9,10 +9,14 @@ from uuid import uuid4
 class CategoryModel(settings.DATABASE_BASE_MODEL):
 
     __tablename__ = "categories"
+    __table_args__ = (
+        # Índice utilizado pela paginação por cursor (created_at, uuid)
+        Index("ix_categories_created_at_uuid", "created_at", "uuid"),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
-    name = Column(String, nullable=False)
-    slug = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True, index=True)
+    slug = Column(String, nullable=False, unique=True, index=True)
     created_at = Column(
         DateTime, nullable=False, default=datetime.now(timezone(settings.TIMEZONE))
     )
@@ -23,13 +27,21 @@ class CategoryModel(settings.DATABASE_BASE_MODEL):
         onupdate=datetime.now(timezone(settings.TIMEZONE)),
     )
 
+    # Carregada apenas sob demanda (?expand=products), nunca junto das listagens
     products = relationship(
         "ProductModel",
         back_populates="category",
         uselist=True,
-        lazy="joined",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
+    # Contagem de produtos, preenchida pelas consultas via with_expression
+    products_count = query_expression()
+
+    # Primeiros produtos da categoria (?expand=products). Atributo comum, fora do
+    # mapeamento: a relação products (com cascade) nunca recebe a lista parcial
+    products_preview = None
+
     def __repr__(self):
         return f"<CategoryModel(uuid={self.uuid}, name={self.name}, slug={self.slug})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, DateTime, UUID, ForeignKey, Integer
+from sqlalchemy import Column, String, Float, DateTime, UUID, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
 from app.core.settings import settings
 from datetime import datetime
@@ -9,12 +9,31 @@ from uuid import uuid4
 class ProductModel(settings.DATABASE_BASE_MODEL):
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Índice utilizado pela paginação por cursor (created_at, uuid)
+        Index("ix_products_created_at_uuid", "created_at", "uuid"),
+        # Índices dos filtros e ordenações da listagem
+        Index(
+            "ix_products_category_uuid_created_at_uuid",
+            "category_uuid",
+            "created_at",
+            "uuid",
+        ),
+        Index("ix_products_category_uuid_price_uuid", "category_uuid", "price", "uuid"),
+        Index("ix_products_price_uuid", "price", "uuid"),
+        # Busca por prefixo do nome (LIKE 'prefixo%') no PostgreSQL
+        Index(
+            "ix_products_name_pattern",
+            "name",
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     category_uuid = Column(UUID(as_uuid=True), ForeignKey("categories.uuid"))
 
-    name = Column(String, nullable=False)
-    slug = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True, index=True)
+    slug = Column(String, nullable=False, unique=True, index=True)
     price = Column(Float, nullable=False)
     stock = Column(Integer, nullable=False)
 
@@ -28,7 +47,7 @@ class ProductModel(settings.DATABASE_BASE_MODEL):
         onupdate=datetime.now(timezone(settings.TIMEZONE)),
     )
 
-    category = relationship("CategoryModel", back_populates="products", lazy="joined")
+    category = relationship("CategoryModel", back_populates="products", lazy="select")
 
     def __repr__(self):
         return f"<ProductModel(uuid={self.uuid}, name={self.name}, price={self.price})>"
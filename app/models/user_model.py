@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, UUID
+from sqlalchemy import Column, String, DateTime, UUID, Index, Integer
 from app.core.settings import settings
 from datetime import datetime
 from pytz import timezone
@@ -8,11 +8,17 @@ from uuid import uuid4
 class UserModel(settings.DATABASE_BASE_MODEL):
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Índice utilizado pela paginação por cursor (created_at, uuid)
+        Index("ix_users_created_at_uuid", "created_at", "uuid"),
+    )
 
     uuid = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     username = Column(String, nullable=False)
     email = Column(String, nullable=False, unique=True)
     password = Column(String, nullable=False)
+    # Incrementado a cada troca de senha, invalidando os tokens emitidos antes
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(
         DateTime, nullable=False, default=datetime.now(timezone(settings.TIMEZONE))
     )
@@ -1,38 +1,121 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    Request,
+    Response,
+    Security,
+    status,
+    Query,
+)
 from fastapi_pagination import Page, add_pagination
-from sqlalchemy.orm import Session
-from app.core.deps import db_session, get_current_user
-from app.controllers.category_controller import CategoryController
+from app.core.deps import (
+    DBSession,
+    get_db,
+    get_authenticated_principal,
+    get_authenticated_user,
+)
+from app.core.concurrency import run_controller
+from app.core.serialization import page_response
+from app.core.conditional import (
+    collection_etag,
+    conditional_response,
+    entity_etag,
+)
+from app.core.routing import READ_ONLY_ROUTE
+from app.core.settings import settings
+from app.controllers.category_controller import (
+    CategoryController,
+    AsyncCategoryController,
+)
 from app.schemas.category_schema import (
     CategorySchemaRead,
     CategorySchemaCreate,
     CategorySchemaUpdate,
 )
-from app.schemas.responses import Message
+from app.schemas.product_schema import ProductSchemaRead
+from app.schemas.responses import (
+    BatchGetRequest,
+    BatchGetResponse,
+    CursorPage,
+    Message,
+)
 from uuid import UUID
-from typing import List
+from typing import Literal, Optional, Union, List
 
 
 router = APIRouter()
 
+# Controller utilizado pelas rotas, conforme a configuração DATABASE_ASYNC
+Controller = AsyncCategoryController if settings.DATABASE_ASYNC else CategoryController
+
 
 @router.get(
     "/categories",
-    response_model=Page[CategorySchemaRead],
+    response_model=Union[Page[CategorySchemaRead], CursorPage[CategorySchemaRead]],
     tags=["Categories"],
     status_code=status.HTTP_200_OK,
 )
-def get_categories(
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+async def get_categories(
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    expand: Optional[Literal["products"]] = Query(None),
 ):
     """
     Retorna uma lista de categorias.
+
+    Por padrão cada categoria traz apenas a contagem de produtos; com
+    expand=products são incluídos também os seus primeiros produtos.
+    """
+    category_controller = Controller(db)
+
+    # Paginação por cursor: busca por (created_at, uuid), sem OFFSET e sem COUNT(*)
+    if pagination == "cursor" or cursor:
+        categories = await run_controller(
+            category_controller.get_all_by_cursor,
+            cursor=cursor,
+            size=size,
+            include_total=include_total,
+            expand=expand == "products",
+        )
+    else:
+        categories = await run_controller(
+            category_controller.get_all, page, size, expand=expand == "products"
+        )
+
+    return conditional_response(
+        request, response, collection_etag(categories)
+    ) or page_response(categories, CategorySchemaRead, response)
+
+
+@router.get(
+    "/categories/by-slug/{slug}",
+    response_model=CategorySchemaRead,
+    tags=["Categories"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_category_by_slug(
+    slug: str,
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+):
     """
-    category_controller = CategoryController(db)
-    return category_controller.get_all(page, size)
+    Retorna uma categoria pelo slug.
+    """
+    category_controller = Controller(db)
+    category = await run_controller(category_controller.get_by_slug, slug)
+
+    # Sem Last-Modified: products_count muda sem alterar o updated_at
+    return conditional_response(request, response, entity_etag(category)) or category
 
 
 @router.get(
@@ -41,16 +124,94 @@ def get_categories(
     tags=["Categories"],
     status_code=status.HTTP_200_OK,
 )
-def get_category(
+async def get_category(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+    expand: Optional[Literal["products"]] = Query(None),
 ):
     """
     Retorna uma categoria.
+
+    Responde 304 (sem corpo) quando If-None-Match indica que o cliente já
+    possui a versão atual. O ETag considera também
+    a contagem de produtos e, com expand=products, os produtos incluídos.
+    """
+    category_controller = Controller(db)
+    category = await run_controller(
+        category_controller.get, uuid, expand=expand == "products"
+    )
+
+    # Sem Last-Modified: a contagem e os produtos incluídos mudam sem alterar
+    # o updated_at da categoria, então apenas o ETag identifica a versão
+    return conditional_response(request, response, entity_etag(category)) or category
+
+
+@router.get(
+    "/categories/{uuid}/products",
+    response_model=Union[Page[ProductSchemaRead], CursorPage[ProductSchemaRead]],
+    tags=["Categories"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_category_products(
+    uuid: UUID,
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=100),
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+):
+    """
+    Retorna os produtos de uma categoria.
+    """
+    category_controller = Controller(db)
+
+    if pagination == "cursor" or cursor:
+        products = await run_controller(
+            category_controller.get_products_by_cursor,
+            uuid,
+            cursor=cursor,
+            size=size,
+            include_total=include_total,
+        )
+    else:
+        products = await run_controller(
+            category_controller.get_products, uuid, page, size
+        )
+
+    return conditional_response(
+        request, response, collection_etag(products)
+    ) or page_response(products, ProductSchemaRead, response)
+
+
+@router.post(
+    "/categories/batch-get",
+    response_model=BatchGetResponse[CategorySchemaRead],
+    tags=["Categories"],
+    status_code=status.HTTP_200_OK,
+    openapi_extra=READ_ONLY_ROUTE,
+)
+async def get_categories_batch(
+    batch: BatchGetRequest,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+    expand: Optional[Literal["products"]] = Query(None),
+):
+    """
+    Retorna várias categorias pelo UUID, em uma única consulta.
+
+    Cada UUID é reportado como found (com a categoria) ou not_found.
     """
-    category_controller = CategoryController(db)
-    return category_controller.get(uuid)
+    category_controller = Controller(db)
+    return await run_controller(
+        category_controller.get_many, batch.uuids, expand=expand == "products"
+    )
 
 
 @router.post(
@@ -59,16 +220,16 @@ def get_category(
     tags=["Categories"],
     status_code=status.HTTP_201_CREATED,
 )
-def create_category(
+async def create_category(
     category: CategorySchemaCreate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Cria uma categoria.
     """
-    category_controller = CategoryController(db)
-    return category_controller.create(category)
+    category_controller = Controller(db)
+    return await run_controller(category_controller.create, category)
 
 
 @router.put(
@@ -77,17 +238,23 @@ def create_category(
     tags=["Categories"],
     status_code=status.HTTP_200_OK,
 )
-def update_category(
+async def update_category(
     uuid: UUID,
     category: CategorySchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+    if_match: Optional[str] = Header(None),
 ):
     """
     Atualiza uma categoria.
+
+    Com If-Match, a alteração só é aplicada se o ETag for o da versão atual
+    (412 caso contrário).
     """
-    category_controller = CategoryController(db)
-    return category_controller.full_update(category, uuid)
+    category_controller = Controller(db)
+    return await run_controller(
+        category_controller.full_update, category, uuid, if_match=if_match
+    )
 
 
 @router.patch(
@@ -96,17 +263,23 @@ def update_category(
     tags=["Categories"],
     status_code=status.HTTP_200_OK,
 )
-def partial_update_category(
+async def partial_update_category(
     uuid: UUID,
     category: CategorySchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+    if_match: Optional[str] = Header(None),
 ):
     """
     Atualiza parcialmente uma categoria.
+
+    Com If-Match, a alteração só é aplicada se o ETag for o da versão atual
+    (412 caso contrário).
     """
-    category_controller = CategoryController(db)
-    return category_controller.partial_update(category, uuid)
+    category_controller = Controller(db)
+    return await run_controller(
+        category_controller.partial_update, category, uuid, if_match=if_match
+    )
 
 
 @router.delete(
@@ -115,16 +288,16 @@ def partial_update_category(
     tags=["Categories"],
     status_code=status.HTTP_200_OK,
 )
-def delete_category(
+async def delete_category(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Deleta uma categoria.
     """
-    category_controller = CategoryController(db)
-    return category_controller.delete(uuid)
+    category_controller = Controller(db)
+    return await run_controller(category_controller.delete, uuid)
 
 
 # Adiciona paginação aos endpoints
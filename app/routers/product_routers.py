@@ -1,39 +1,198 @@
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    Request,
+    Response,
+    Security,
+    status,
+    Query,
+)
+from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, add_pagination
-from app.core.deps import db_session, get_current_user
+from app.core.deps import (
+    DBSession,
+    get_db,
+    get_authenticated_principal,
+    get_authenticated_user,
+)
+from app.core.bulk import NDJSON_CONTENT_TYPES, read_json_rows
+from app.core.concurrency import run_controller
+from app.core.conditional import (
+    collection_etag,
+    conditional_response,
+    entity_etag,
+    last_modified,
+)
+from app.core.export import EXPORT_MEDIA_TYPES
+from app.core.serialization import page_response
+from app.core.routing import READ_ONLY_ROUTE
+from app.core.settings import settings
 from app.models.product_model import ProductModel
-from app.controllers.product_controller import ProductController
+from app.controllers.product_controller import ProductController, AsyncProductController
 from app.schemas.product_schema import (
+    ProductSchemaBulkReport,
+    ProductSchemaFilter,
     ProductSchemaRead,
     ProductSchemaCreate,
+    ProductSchemaReservation,
+    ProductSchemaReservationReport,
+    ProductSchemaStock,
+    ProductSchemaStockChange,
     ProductSchemaUpdate,
+    ProductSort,
+)
+from app.schemas.responses import (
+    BatchGetRequest,
+    BatchGetResponse,
+    CursorPage,
+    Message,
 )
-from app.schemas.responses import Message
 from uuid import UUID
-from typing import Optional, List
+from typing import Literal, Optional, Union, List
 
 
 router = APIRouter()
 
+# Controller utilizado pelas rotas, conforme a configuração DATABASE_ASYNC
+Controller = AsyncProductController if settings.DATABASE_ASYNC else ProductController
+
 
 @router.get(
     "/products",
-    response_model=Page[ProductSchemaRead],
+    response_model=Union[Page[ProductSchemaRead], CursorPage[ProductSchemaRead]],
     tags=["Products"],
     status_code=status.HTTP_200_OK,
 )
-def get_products(
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+async def get_products(
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    category_uuid: Optional[UUID] = Query(None),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    in_stock: Optional[bool] = Query(None),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=50),
+    sort: ProductSort = Query("-created_at"),
+):
+    """
+    Retorna uma lista de produtos, com filtros e ordenação opcionais.
+    """
+    product_controller = Controller(db)
+    filters = ProductSchemaFilter(
+        category_uuid=category_uuid,
+        min_price=min_price,
+        max_price=max_price,
+        in_stock=in_stock,
+        name_prefix=name_prefix,
+    )
+
+    # Paginação por cursor: busca por (created_at, uuid), sem OFFSET e sem COUNT(*)
+    if pagination == "cursor" or cursor:
+        if sort != "-created_at":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Sorting is only supported with offset pagination.",
+            )
+
+        products = await run_controller(
+            product_controller.get_all_by_cursor,
+            cursor=cursor,
+            size=size,
+            include_total=include_total,
+            filters=filters,
+        )
+    else:
+        products = await run_controller(
+            product_controller.get_all, page=page, size=size, filters=filters, sort=sort
+        )
+
+    return conditional_response(
+        request, response, collection_etag(products)
+    ) or page_response(products, ProductSchemaRead, response)
+
+
+@router.get(
+    "/products/export",
+    response_class=StreamingResponse,
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+)
+async def export_products(
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    category_uuid: Optional[UUID] = Query(None),
 ):
     """
-    Retorna uma lista de produtos.
+    Exporta todos os produtos em stream, como NDJSON ou CSV.
     """
-    product_controller = ProductController(db)
-    return product_controller.get_all(page=page, size=size)
+    product_controller = Controller(db)
+
+    return StreamingResponse(
+        product_controller.export(category_uuid, export_format=format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="products.{format}"'},
+    )
+
+
+@router.get(
+    "/products/search",
+    response_model=CursorPage[ProductSchemaRead],
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+)
+async def search_products(
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+    q: str = Query(..., min_length=1, max_length=100),
+    size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+):
+    """
+    Busca produtos pelo nome e pelo slug, ordenados por relevância.
+    """
+    product_controller = Controller(db)
+    products = await run_controller(
+        product_controller.search, q, cursor=cursor, size=size
+    )
+
+    return page_response(products, ProductSchemaRead, response)
+
+
+@router.get(
+    "/products/by-slug/{slug}",
+    response_model=ProductSchemaRead,
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_product_by_slug(
+    slug: str,
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+):
+    """
+    Retorna um produto pelo slug.
+    """
+    product_controller = Controller(db)
+    product = await run_controller(product_controller.get_by_slug, slug)
+
+    return (
+        conditional_response(
+            request, response, entity_etag(product), last_modified(product)
+        )
+        or product
+    )
 
 
 @router.get(
@@ -42,16 +201,28 @@ def get_products(
     tags=["Products"],
     status_code=status.HTTP_200_OK,
 )
-def get_product(
+async def get_product(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
 ):
     """
     Retorna um produto.
+
+    Responde 304 (sem corpo) quando If-None-Match ou If-Modified-Since
+    indicam que o cliente já possui a versão atual.
     """
-    product_controller = ProductController(db)
-    return product_controller.get(uuid)
+    product_controller = Controller(db)
+    product = await run_controller(product_controller.get, uuid)
+
+    return (
+        conditional_response(
+            request, response, entity_etag(product), last_modified(product)
+        )
+        or product
+    )
 
 
 @router.post(
@@ -60,16 +231,126 @@ def get_product(
     tags=["Products"],
     status_code=status.HTTP_201_CREATED,
 )
-def create_product(
+async def create_product(
     product: ProductSchemaCreate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Cria um produto.
     """
-    product_controller = ProductController(db)
-    return product_controller.create(product)
+    product_controller = Controller(db)
+    return await run_controller(product_controller.create, product)
+
+
+@router.post(
+    "/products/bulk",
+    response_model=ProductSchemaBulkReport,
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/ProductSchemaCreate"},
+                    }
+                },
+                **{
+                    content_type: {
+                        "schema": {"$ref": "#/components/schemas/ProductSchemaCreate"}
+                    }
+                    for content_type in NDJSON_CONTENT_TYPES
+                },
+            },
+        }
+    },
+)
+async def create_products_bulk(
+    request: Request,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+    batch_size: int = Query(settings.PRODUCT_BULK_BATCH_SIZE, ge=1, le=5000),
+):
+    """
+    Cria produtos em lote a partir de um array JSON ou de NDJSON.
+
+    Retorna o resultado de cada linha (created, duplicate, invalid ou failed).
+    """
+    rows = await read_json_rows(request, settings.PRODUCT_BULK_MAX_ROWS)
+
+    product_controller = Controller(db)
+    return await run_controller(
+        product_controller.create_bulk, rows, batch_size=batch_size
+    )
+
+
+@router.post(
+    "/products/batch-get",
+    response_model=BatchGetResponse[ProductSchemaRead],
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+    openapi_extra=READ_ONLY_ROUTE,
+)
+async def get_products_batch(
+    batch: BatchGetRequest,
+    db: DBSession = Depends(get_db),
+    current_user=Security(get_authenticated_principal, scopes=["read"]),
+):
+    """
+    Retorna vários produtos pelo UUID, em uma única consulta.
+
+    Cada UUID é reportado como found (com o produto) ou not_found.
+    """
+    product_controller = Controller(db)
+    return await run_controller(product_controller.get_many, batch.uuids)
+
+
+@router.post(
+    "/products/stock/reservations",
+    response_model=ProductSchemaReservationReport,
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+)
+async def reserve_products_stock(
+    reservation: ProductSchemaReservation,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+):
+    """
+    Dá baixa no estoque de vários produtos em uma única transação.
+
+    Se algum produto não existe (404) ou não tem estoque suficiente (409),
+    nenhuma baixa é aplicada.
+    """
+    product_controller = Controller(db)
+    return await run_controller(product_controller.reserve_stock, reservation)
+
+
+@router.post(
+    "/products/{uuid}/stock/decrement",
+    response_model=ProductSchemaStock,
+    tags=["Products"],
+    status_code=status.HTTP_200_OK,
+)
+async def decrement_product_stock(
+    uuid: UUID,
+    change: ProductSchemaStockChange,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+):
+    """
+    Dá baixa no estoque de um produto.
+
+    Responde 409 quando o estoque é insuficiente; o estoque nunca fica
+    negativo, mesmo com requisições concorrentes.
+    """
+    product_controller = Controller(db)
+    return await run_controller(
+        product_controller.decrement_stock, uuid, change.quantity
+    )
 
 
 @router.put(
@@ -78,17 +359,23 @@ def create_product(
     tags=["Products"],
     status_code=status.HTTP_200_OK,
 )
-def update_product(
+async def update_product(
     uuid: UUID,
     product: ProductSchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+    if_match: Optional[str] = Header(None),
 ):
     """
     Atualiza um produto.
+
+    Com If-Match, a alteração só é aplicada se o ETag for o da versão atual
+    (412 caso contrário).
     """
-    product_controller = ProductController(db)
-    return product_controller.full_update(product, uuid)
+    product_controller = Controller(db)
+    return await run_controller(
+        product_controller.full_update, product, uuid, if_match=if_match
+    )
 
 
 @router.patch(
@@ -97,17 +384,23 @@ def update_product(
     tags=["Products"],
     status_code=status.HTTP_200_OK,
 )
-def partial_update_product(
+async def partial_update_product(
     uuid: UUID,
     product: ProductSchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+    if_match: Optional[str] = Header(None),
 ):
     """
     Atualiza parcialmente um produto.
+
+    Com If-Match, a alteração só é aplicada se o ETag for o da versão atual
+    (412 caso contrário).
     """
-    product_controller = ProductController(db)
-    return product_controller.partial_update(product, uuid)
+    product_controller = Controller(db)
+    return await run_controller(
+        product_controller.partial_update, product, uuid, if_match=if_match
+    )
 
 
 @router.delete(
@@ -116,16 +409,16 @@ def partial_update_product(
     tags=["Products"],
     status_code=status.HTTP_200_OK,
 )
-def delete_product(
+async def delete_product(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Deleta um produto.
     """
-    product_controller = ProductController(db)
-    return product_controller.delete(uuid)
+    product_controller = Controller(db)
+    return await run_controller(product_controller.delete, uuid)
 
 
 # Adiciona paginação aos resultados
@@ -1,47 +1,125 @@
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_pagination import Page, add_pagination
-from app.controllers.user_controller import UserController
-from app.core.deps import db_session, get_current_user
+from app.controllers.user_controller import UserController, AsyncUserController
+from app.core.deps import DBSession, get_db, get_authenticated_user
+from app.core.concurrency import run_controller
+from app.core.security import security
+from app.core.serialization import page_response
+from app.core.conditional import (
+    collection_etag,
+    conditional_response,
+    entity_etag,
+    last_modified,
+)
+from app.core.routing import READ_ONLY_ROUTE
+from app.core.settings import settings
 from app.schemas.user_schema import (
     UserSchemaCreate,
     UserSchemaLogin,
     UserSchemaUpdate,
     UserSchemaBase,
 )
-from app.schemas.responses import Message, JWTToken
+from app.schemas.responses import (
+    BatchGetRequest,
+    BatchGetResponse,
+    CursorPage,
+    JWTToken,
+    Message,
+)
 from uuid import UUID
-from typing import Optional, List
+from typing import Literal, Optional, Union, List
 
 router = APIRouter()
 
+# Controller utilizado pelas rotas, conforme a configuração DATABASE_ASYNC
+Controller = AsyncUserController if settings.DATABASE_ASYNC else UserController
+
 
-@router.get("/users", response_model=Page[UserSchemaBase], tags=["Users"])
-def get_users(
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+async def _hash_password(password: Optional[str]) -> Optional[str]:
+    # O bcrypt é aguardado aqui, no event loop, nos dois modos: no modo síncrono
+    # o controller roda no threadpool, e uma thread não fica bloqueada esperando
+    # o pool de processos
+    return await security.async_get_password_hash(password) if password else None
+
+
+@router.get(
+    "/users",
+    response_model=Union[Page[UserSchemaBase], CursorPage[UserSchemaBase]],
+    tags=["Users"],
+)
+async def get_users(
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
 ):
     """
     Retorna uma lista de usuários.
     """
-    user_controller = UserController(db)
-    return user_controller.get_all(page=page, size=size)
+    user_controller = Controller(db)
+
+    # Paginação por cursor: busca por (created_at, uuid), sem OFFSET e sem COUNT(*)
+    if pagination == "cursor" or cursor:
+        users = await run_controller(
+            user_controller.get_all_by_cursor,
+            cursor=cursor,
+            size=size,
+            include_total=include_total,
+        )
+    else:
+        users = await run_controller(user_controller.get_all, page=page, size=size)
+
+    return conditional_response(
+        request, response, collection_etag(users)
+    ) or page_response(users, UserSchemaBase, response)
+
+
+@router.post(
+    "/users/batch-get",
+    response_model=BatchGetResponse[UserSchemaBase],
+    tags=["Users"],
+    status_code=status.HTTP_200_OK,
+    openapi_extra=READ_ONLY_ROUTE,
+)
+async def get_users_batch(
+    batch: BatchGetRequest,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
+):
+    """
+    Retorna vários usuários pelo UUID, em uma única consulta.
+
+    Cada UUID é reportado como found (com o usuário) ou not_found.
+    """
+    user_controller = Controller(db)
+    return await run_controller(user_controller.get_many, batch.uuids)
 
 
 @router.get("/users/{uuid}", response_model=UserSchemaBase, tags=["Users"])
-def get_user(
+async def get_user(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Retorna um usuário.
     """
-    user_controller = UserController(db)
-    return user_controller.get(uuid)
+    user_controller = Controller(db)
+    user = await run_controller(user_controller.get, uuid)
+
+    return (
+        conditional_response(request, response, entity_etag(user), last_modified(user))
+        or user
+    )
 
 
 @router.post(
@@ -50,12 +128,13 @@ def get_user(
     tags=["Users"],
     status_code=status.HTTP_201_CREATED,
 )
-def create_user(user: UserSchemaCreate, db: Session = Depends(db_session)):
+async def create_user(user: UserSchemaCreate, db: DBSession = Depends(get_db)):
     """
     Cria um novo usuário.
     """
-    user_controller = UserController(db)
-    return user_controller.create(user)
+    user_controller = Controller(db)
+    password_hash = await _hash_password(user.password)
+    return await run_controller(user_controller.create, user, password_hash)
 
 
 @router.put(
@@ -64,17 +143,18 @@ def create_user(user: UserSchemaCreate, db: Session = Depends(db_session)):
     tags=["Users"],
     status_code=status.HTTP_200_OK,
 )
-def full_update_user(
+async def full_update_user(
     uuid: UUID,
     user: UserSchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Atualiza um usuário.
     """
-    user_controller = UserController(db)
-    return user_controller.full_update(user, uuid)
+    user_controller = Controller(db)
+    password_hash = await _hash_password(user.password)
+    return await run_controller(user_controller.full_update, user, uuid, password_hash)
 
 
 @router.patch(
@@ -83,29 +163,43 @@ def full_update_user(
     tags=["Users"],
     status_code=status.HTTP_200_OK,
 )
-def update_partial_user(
+async def update_partial_user(
     uuid: UUID,
     user: UserSchemaUpdate,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Atualiza um usuário.
     """
-    user_controller = UserController(db)
-    return user_controller.partial_update(user, uuid)
+    user_controller = Controller(db)
+    password_hash = await _hash_password(user.password)
+    return await run_controller(
+        user_controller.partial_update, user, uuid, password_hash
+    )
 
 
 @router.post("/login", response_model=JWTToken, tags=["Users Auth"])
-def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(db_session)
+async def login_user(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: DBSession = Depends(get_db)
 ):
     """
     Autentica um usuário.
     """
-    user_controller = UserController(db)
+    user_controller = Controller(db)
     user = UserSchemaLogin(email=form_data.username, password=form_data.password)
-    return user_controller.login(user)
+    user_model = await run_controller(user_controller.get_by_email, user.email)
+
+    # A senha é verificada no event loop (pool de processos), fora do threadpool
+    if not user_model or not await security.async_verify_password(
+        user.password, user_model.password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password.",
+        )
+
+    return user_controller.create_token(user_model)
 
 
 @router.delete(
@@ -114,16 +208,16 @@ def login_user(
     tags=["Users"],
     status_code=status.HTTP_200_OK,
 )
-def delete_user(
+async def delete_user(
     uuid: UUID,
-    db: Session = Depends(db_session),
-    current_user=Depends(get_current_user),
+    db: DBSession = Depends(get_db),
+    current_user=Depends(get_authenticated_user),
 ):
     """
     Deleta um usuário.
     """
-    user_controller = UserController(db)
-    return user_controller.delete(uuid)
+    user_controller = Controller(db)
+    return await run_controller(user_controller.delete, uuid)
 
 
 # Adiciona paginação aos resultados
@@ -1,7 +1,8 @@
 from datetime import datetime
 from pydantic.types import UUID4
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from sqlalchemy import inspect
+from typing import Any, Optional, List
 from re import match
 
 from app.schemas.product_schema import ProductSchemaRead
@@ -67,6 +68,24 @@ class CategorySchemaRead(CategorySchemaBase):
     Classe que representa o esquema de leitura de categoria.
     """
 
-    products: List[ProductSchemaRead] = Field(
-        [], description="The category's products."
+    products_count: Optional[int] = Field(
+        None, description="The number of products in the category."
     )
+    products: Optional[List[ProductSchemaRead]] = Field(
+        None, description="The category's first products (only with expand=products)."
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_products(cls, data: Any) -> Any:
+        # Em modelos, products vem da prévia (products_preview), preenchida apenas
+        # com expand=products; a relação products nunca é lida (nem carregada)
+        if inspect(data, raiseerr=False) is not None:
+            return {
+                field: getattr(
+                    data, "products_preview" if field == "products" else field
+                )
+                for field in cls.model_fields
+            }
+
+        return data
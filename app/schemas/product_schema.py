@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic.types import UUID4
-from typing import Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 from re import match
 
@@ -89,3 +89,97 @@ class ProductSchemaRead(ProductSchemaBase):
     """
 
     pass
+
+
+# Chaves de ordenação aceitas na listagem ("-" indica ordem decrescente)
+ProductSort = Literal[
+    "created_at", "-created_at", "name", "-name", "price", "-price", "stock", "-stock"
+]
+
+
+class ProductSchemaFilter(BaseModel):
+    """
+    Classe que representa os filtros da listagem de produtos.
+    """
+
+    category_uuid: Optional[UUID4] = Field(None, description="The category UUID.")
+    min_price: Optional[float] = Field(None, ge=0, description="The minimum price.")
+    max_price: Optional[float] = Field(None, ge=0, description="The maximum price.")
+    in_stock: Optional[bool] = Field(
+        None, description="Only products with (true) or without (false) stock."
+    )
+    name_prefix: Optional[str] = Field(
+        None, min_length=1, max_length=50, description="The product's name prefix."
+    )
+
+
+class ProductSchemaBulkResult(BaseModel):
+    """
+    Classe que representa o resultado de uma linha da importação em lote.
+    """
+
+    index: int = Field(..., description="The row position in the request body.")
+    status: Literal["created", "duplicate", "invalid", "failed"] = Field(
+        ..., description="The row outcome."
+    )
+    uuid: Optional[UUID4] = Field(None, description="The created product's UUID.")
+    detail: Optional[str] = Field(None, description="Why the row was not created.")
+
+
+class ProductSchemaBulkReport(BaseModel):
+    """
+    Classe que representa o relatório da importação em lote de produtos.
+    """
+
+    created: int = Field(..., description="Number of products created.")
+    duplicates: int = Field(..., description="Number of rows already existing.")
+    invalid: int = Field(..., description="Number of rows rejected by validation.")
+    failed: int = Field(..., description="Number of rows whose batch failed.")
+    results: List[ProductSchemaBulkResult] = Field(
+        ..., description="The outcome of each row, in request order."
+    )
+
+
+class ProductSchemaStockChange(BaseModel):
+    """
+    Classe que representa a baixa de estoque de um produto.
+    """
+
+    quantity: int = Field(..., gt=0, description="The quantity to remove from stock.")
+
+
+class ProductSchemaReservationItem(ProductSchemaStockChange):
+    """
+    Classe que representa um produto de uma reserva de estoque.
+    """
+
+    uuid: UUID4 = Field(..., description="The product's UUID.")
+
+
+class ProductSchemaReservation(BaseModel):
+    """
+    Classe que representa uma reserva de estoque de vários produtos.
+    """
+
+    items: List[ProductSchemaReservationItem] = Field(
+        ..., min_length=1, description="The products and quantities to reserve."
+    )
+
+
+class ProductSchemaStock(BaseModel):
+    """
+    Classe que representa o estoque de um produto após a baixa.
+    """
+
+    uuid: UUID4 = Field(..., description="The product's UUID.")
+    stock: int = Field(..., description="The product's remaining stock.")
+
+
+class ProductSchemaReservationReport(BaseModel):
+    """
+    Classe que representa o resultado de uma reserva de estoque.
+    """
+
+    items: List[ProductSchemaStock] = Field(
+        ..., description="The remaining stock of each product, in request order."
+    )
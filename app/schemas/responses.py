@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic.types import UUID4
+from typing import Generic, List, Literal, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 class Message(BaseModel):
@@ -18,3 +21,52 @@ class JWTToken(BaseModel):
 
     access_token: Optional[str] = Field(None, description="The access token.")
     token_type: Optional[str] = Field(None, description="The token type.")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Classe que representa uma página paginada por cursor.
+    """
+
+    items: List[T] = Field(..., description="The page items.")
+    size: int = Field(..., description="The page size.")
+    next_cursor: Optional[str] = Field(
+        ..., description="Cursor of the next page, null on the last page."
+    )
+    total: Optional[int] = Field(
+        None, description="Total number of items, only when include_total is set."
+    )
+
+
+class BatchGetRequest(BaseModel):
+    """
+    Classe que representa uma busca de vários registros pelo UUID.
+    """
+
+    uuids: List[UUID4] = Field(
+        ..., min_length=1, description="The UUIDs of the requested items."
+    )
+
+
+class BatchGetResult(BaseModel, Generic[T]):
+    """
+    Classe que representa o resultado de um UUID na busca em lote.
+    """
+
+    uuid: UUID4 = Field(..., description="The requested UUID.")
+    status: Literal["found", "not_found"] = Field(
+        ..., description="Whether the item exists."
+    )
+    item: Optional[T] = Field(None, description="The item, when found.")
+
+
+class BatchGetResponse(BaseModel, Generic[T]):
+    """
+    Classe que representa o resultado de uma busca em lote.
+    """
+
+    found: int = Field(..., description="Number of UUIDs found.")
+    missing: int = Field(..., description="Number of UUIDs not found.")
+    results: List[BatchGetResult[T]] = Field(
+        ..., description="The result of each UUID, in the request order."
+    )
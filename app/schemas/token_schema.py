@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
+from pydantic.types import UUID4
 
 
 class TokenData(BaseModel):
@@ -7,4 +8,17 @@ class TokenData(BaseModel):
     Classe que representa os dados do token.
     """
 
-    username: Optional[str] = Field(None, title="Nome de usuário")
+    sub: Optional[str] = Field(None, title="UUID do usuário (ou nome de usuário)")
+    version: int = Field(0, title="Versão do token do usuário")
+    exp: Optional[int] = Field(None, title="Expiração do token")
+
+
+class Principal(BaseModel):
+    """
+    Classe que representa o usuário autenticado a partir das claims do token.
+    """
+
+    uuid: UUID4 = Field(..., title="UUID do usuário")
+    username: str = Field(..., title="Nome de usuário")
+    version: int = Field(0, title="Versão do token do usuário")
+    scopes: List[str] = Field([], title="Escopos do token")
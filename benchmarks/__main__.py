@@ -0,0 +1,260 @@
+"""
+Benchmarks da API.
+
+Uso:
+    python -m benchmarks load --concurrency 20 --requests 500 --output base.json
+    python -m benchmarks micro --runs 5000 --output micro.json
+    python -m benchmarks compare base.json novo.json
+
+O banco utilizado é o de DATABASE_URL (SQLite ou PostgreSQL), com as
+migrações já aplicadas (alembic upgrade head).
+"""
+
+from typing import Any, Dict, List
+from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
+from asyncio import run
+from datetime import datetime, timezone
+from json import dump, load
+from os import environ
+from platform import python_version
+import sys
+
+
+def _metadata(args: Namespace) -> Dict[str, Any]:
+    from sqlalchemy.engine import make_url
+    from app.core.settings import settings
+
+    return {
+        "command": args.command,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": python_version(),
+        "database": make_url(settings.DATABASE_URL).get_backend_name(),
+        "async": settings.DATABASE_ASYNC,
+    }
+
+
+def _write_output(path: str, report: Dict[str, Any]) -> None:
+    if path:
+        with open(path, "w", encoding="utf-8") as file:
+            dump(report, file, indent=2)
+
+        print(f"\nResultados gravados em {path}")
+
+
+def _print_load(name: str, result: Dict[str, Any]) -> None:
+    latency = result["latency_ms"]
+    allocations = ""
+
+    if "alloc_peak_kib_mean" in result:
+        allocations = f"  alloc {result['alloc_peak_kib_mean']:>9.1f} KiB"
+
+    print(
+        f"{name:<22} p50 {latency['p50']:>8.2f} ms  p95 {latency['p95']:>8.2f} ms"
+        f"  p99 {latency['p99']:>8.2f} ms  {result['throughput_rps']:>8.1f} req/s"
+        f"  erros {result['errors']}{allocations}"
+    )
+
+
+def _print_micro(name: str, result: Dict[str, Any]) -> None:
+    latency = result["latency_us"]
+
+    print(
+        f"{name:<28} p50 {latency['p50']:>9.2f} µs  p95 {latency['p95']:>9.2f} µs"
+        f"  p99 {latency['p99']:>9.2f} µs  {result['ops_per_second']:>12.1f} op/s"
+    )
+
+
+def command_load(args: Namespace) -> None:
+    from app.core.database import async_engine, engine
+    from app.core.security import security
+    from app.main import app
+    from benchmarks.load import ENDPOINTS, run_load
+    from benchmarks.seed import clear_catalog, seed_catalog
+
+    endpoints = [
+        endpoint
+        for endpoint in ENDPOINTS
+        if not args.endpoints or endpoint.name in args.endpoints
+    ]
+    catalog = seed_catalog(args.categories, args.products_per_category, args.users)
+    print(
+        f"Catálogo: {catalog['categories']} categorias, {catalog['products']} "
+        f"produtos, {catalog['users']} usuários\n"
+    )
+
+    async def main() -> Dict[str, Any]:
+        try:
+            return await run_load(
+                app,
+                catalog,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                endpoints=endpoints,
+                warmup=args.warmup,
+                allocation_requests=args.allocations,
+                progress=_print_load,
+            )
+        finally:
+            await async_engine.dispose()
+
+    try:
+        results = run(main())
+    finally:
+        security.shutdown()
+
+        if not args.keep_data:
+            clear_catalog()
+
+        engine.dispose()
+
+    report = _metadata(args)
+    report["config"] = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "catalog": {
+            "categories": catalog["categories"],
+            "products": catalog["products"],
+            "users": catalog["users"],
+        },
+    }
+    report["results"] = results
+    _write_output(args.output, report)
+
+
+def command_micro(args: Namespace) -> None:
+    from app.core.security import security
+    from benchmarks.micro import run_micro
+    from benchmarks.seed import clear_catalog, seed_catalog
+
+    # Apenas o usuário de benchmark, utilizado por get_current_user
+    seed_catalog(0, 0, 0)
+
+    try:
+        results = run_micro(args.runs, progress=_print_micro)
+    finally:
+        security.shutdown()
+        clear_catalog()
+
+    report = _metadata(args)
+    report["config"] = {"runs": args.runs}
+    report["results"] = results
+    _write_output(args.output, report)
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def command_compare(args: Namespace) -> None:
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = load(file)
+
+    with open(args.candidate, encoding="utf-8") as file:
+        candidate = load(file)
+
+    # Latência menor é melhor; throughput maior é melhor
+    rows: List[str] = []
+
+    for name, before in baseline["results"].items():
+        after = candidate["results"].get(name)
+
+        if after is None:
+            continue
+
+        unit = "latency_ms" if "latency_ms" in before else "latency_us"
+        rate = "throughput_rps" if "throughput_rps" in before else "ops_per_second"
+        changes = "  ".join(
+            f"{key} {_change(before[unit][key], after[unit][key]):>8}"
+            for key in ("p50", "p95", "p99")
+        )
+        rows.append(
+            f"{name:<28} {changes}  {rate} {_change(before[rate], after[rate]):>8}"
+        )
+
+    print("\n".join(rows))
+
+
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    database = ArgumentParser(add_help=False)
+    database.add_argument(
+        "--database-url", help="Sobrescreve DATABASE_URL (SQLite ou PostgreSQL)."
+    )
+    database.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Executa os controllers assíncronos (DATABASE_ASYNC=true).",
+    )
+    database.add_argument("--output", default="", help="Arquivo JSON de saída.")
+
+    load_parser = subparsers.add_parser(
+        "load", parents=[database], help="Teste de carga dos endpoints via ASGI."
+    )
+    load_parser.add_argument("--categories", type=int, default=50)
+    load_parser.add_argument("--products-per-category", type=int, default=20)
+    load_parser.add_argument("--users", type=int, default=100)
+    load_parser.add_argument("--requests", type=int, default=200)
+    load_parser.add_argument("--concurrency", type=int, default=10)
+    load_parser.add_argument("--warmup", type=int, default=5)
+    load_parser.add_argument(
+        "--allocations",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Mede as alocações (tracemalloc) em N requisições sequenciais.",
+    )
+    load_parser.add_argument(
+        "--endpoints", nargs="*", help="Executa apenas os endpoints informados."
+    )
+    load_parser.add_argument(
+        "--keep-data", action="store_true", help="Mantém o catálogo ao final."
+    )
+    load_parser.set_defaults(handler=command_load)
+
+    micro_parser = subparsers.add_parser(
+        "micro", parents=[database], help="Micro-benchmarks de schemas e autenticação."
+    )
+    micro_parser.add_argument("--runs", type=int, default=2000)
+    micro_parser.set_defaults(handler=command_micro)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compara dois resultados JSON (variação percentual)."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.set_defaults(handler=command_compare)
+
+    return parser
+
+
+def main(argv: List[str]) -> None:
+    args = build_parser().parse_args(argv)
+
+    # As configurações são lidas na importação da aplicação, por isso o
+    # ambiente é ajustado antes de qualquer import de app
+    if getattr(args, "database_url", None):
+        environ["DATABASE_URL"] = args.database_url
+
+    if getattr(args, "use_async", False):
+        environ["DATABASE_ASYNC"] = "true"
+
+    # Todas as requisições partem do mesmo cliente: o limite de requisições
+    # mediria apenas respostas 429
+    environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
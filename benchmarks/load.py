@@ -0,0 +1,233 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from asyncio import gather
+from itertools import count
+from time import perf_counter
+import tracemalloc
+from httpx import ASGITransport, AsyncClient
+from app.core.settings import settings
+from benchmarks.seed import BENCHMARK_USER
+from benchmarks.stats import summarize
+
+
+class Endpoint(NamedTuple):
+    """
+    Endpoint exercitado pelo teste de carga.
+
+    O path aceita os campos {product_uuid}, {product_slug}, {category_uuid},
+    {category_slug} e {user_uuid}, preenchidos em rodízio com os dados do seed.
+    O weight multiplica a quantidade de requisições (o login usa o bcrypt e é
+    ordens de grandeza mais lento que as leituras).
+    """
+
+    name: str
+    method: str
+    path: str
+    weight: float = 1.0
+
+
+ENDPOINTS = (
+    Endpoint("login", "POST", "/login", weight=0.1),
+    Endpoint("users", "GET", "/users"),
+    Endpoint("users_cursor", "GET", "/users?pagination=cursor"),
+    Endpoint("user", "GET", "/users/{user_uuid}"),
+    Endpoint("categories", "GET", "/categories"),
+    Endpoint("categories_size_100", "GET", "/categories?size=100"),
+    Endpoint("categories_expand", "GET", "/categories?expand=products"),
+    Endpoint("categories_cursor", "GET", "/categories?pagination=cursor"),
+    Endpoint("category", "GET", "/categories/{category_uuid}"),
+    Endpoint("category_by_slug", "GET", "/categories/by-slug/{category_slug}"),
+    Endpoint("products", "GET", "/products"),
+    Endpoint("products_size_100", "GET", "/products?size=100"),
+    Endpoint("products_cursor", "GET", "/products?pagination=cursor"),
+    Endpoint("product", "GET", "/products/{product_uuid}"),
+    Endpoint("product_by_slug", "GET", "/products/by-slug/{product_slug}"),
+    Endpoint("products_export", "GET", "/products/export?format=ndjson", weight=0.1),
+)
+
+
+def _path_values(catalog: Dict[str, Any], index: int) -> Dict[str, str]:
+    # Rodízio entre os registros do seed, para não medir apenas o mesmo item
+    values = {}
+
+    for field in ("product_uuid", "product_slug", "category_uuid", "category_slug"):
+        items = catalog[f"{field}s"]
+        values[field] = items[index % len(items)] if items else ""
+
+    values["user_uuid"] = catalog["user_uuids"][index % len(catalog["user_uuids"])]
+
+    return values
+
+
+async def _send(
+    client: AsyncClient,
+    endpoint: Endpoint,
+    catalog: Dict[str, Any],
+    index: int,
+    headers: Dict[str, str],
+) -> int:
+    if endpoint.name == "login":
+        response = await client.post(
+            f"{settings.PREFIX}/login",
+            data={
+                "username": BENCHMARK_USER["email"],
+                "password": BENCHMARK_USER["password"],
+            },
+        )
+    else:
+        path = endpoint.path.format(**_path_values(catalog, index))
+        response = await client.request(
+            endpoint.method, f"{settings.PREFIX}{path}", headers=headers
+        )
+
+    return response.status_code
+
+
+async def _measure_allocations(
+    client: AsyncClient,
+    endpoint: Endpoint,
+    catalog: Dict[str, Any],
+    headers: Dict[str, str],
+    requests: int,
+) -> Dict[str, float]:
+    # Requisições sequenciais: o pico de cada uma não se mistura com as demais
+    peaks: List[int] = []
+    tracemalloc.start()
+
+    try:
+        for index in range(requests):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await _send(client, endpoint, catalog, index, headers)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - current)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "alloc_peak_kib_mean": round(sum(peaks) / len(peaks) / 1024, 1),
+        "alloc_peak_kib_max": round(max(peaks) / 1024, 1),
+    }
+
+
+async def run_endpoint(
+    client: AsyncClient,
+    endpoint: Endpoint,
+    catalog: Dict[str, Any],
+    headers: Dict[str, str],
+    requests: int,
+    concurrency: int,
+    warmup: int = 5,
+    allocation_requests: int = 0,
+) -> Dict[str, Any]:
+    """
+    Executa as requisições de um endpoint com a concorrência configurada.
+
+    Parâmetros:
+    - client: AsyncClient (Cliente ligado à aplicação via ASGI)
+    - endpoint: Endpoint (Endpoint exercitado)
+    - catalog: Dict[str, Any] (Dados retornados pelo seed)
+    - headers: Dict[str, str] (Cabeçalhos de autenticação)
+    - requests: int (Quantidade de requisições medidas)
+    - concurrency: int (Requisições simultâneas)
+    - warmup: int (Requisições descartadas antes da medição)
+    - allocation_requests: int (Requisições da medição de alocações, 0 desativa)
+
+    Retorno:
+    - Dict[str, Any] (Latências em ms, throughput, erros e alocações)
+    """
+    for index in range(warmup):
+        await _send(client, endpoint, catalog, index, headers)
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    counter = count()
+
+    async def worker() -> None:
+        while (index := next(counter)) < requests:
+            start = perf_counter()
+            status_code = await _send(client, endpoint, catalog, index, headers)
+            latencies.append(perf_counter() - start)
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+
+    start = perf_counter()
+    await gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = perf_counter() - start
+
+    result: Dict[str, Any] = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(total for code, total in statuses.items() if int(code) >= 400),
+        "statuses": statuses,
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": summarize(latencies),
+    }
+
+    if allocation_requests:
+        result.update(
+            await _measure_allocations(
+                client, endpoint, catalog, headers, allocation_requests
+            )
+        )
+
+    return result
+
+
+async def run_load(
+    app: Any,
+    catalog: Dict[str, Any],
+    requests: int,
+    concurrency: int,
+    endpoints: Sequence[Endpoint] = ENDPOINTS,
+    warmup: int = 5,
+    allocation_requests: int = 0,
+    progress: Optional[Any] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Executa o teste de carga em cada endpoint, um endpoint por vez.
+
+    As requisições passam pela pilha ASGI completa (middlewares, dependências,
+    validação e serialização), sem servidor HTTP nem rede.
+
+    Parâmetros:
+    - app: ASGI app (Aplicação FastAPI)
+    - catalog: Dict[str, Any] (Dados retornados pelo seed)
+    - requests: int (Requisições por endpoint, multiplicadas pelo weight)
+    - concurrency: int (Requisições simultâneas)
+    - endpoints: Sequence[Endpoint] (Endpoints exercitados)
+    - warmup: int (Requisições descartadas antes da medição)
+    - allocation_requests: int (Requisições da medição de alocações, 0 desativa)
+    - progress: Callable (Chamado com o nome e o resultado de cada endpoint)
+
+    Retorno:
+    - Dict[str, Dict[str, Any]] (Resultado por endpoint)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        response = await client.post(
+            f"{settings.PREFIX}/login",
+            data={
+                "username": BENCHMARK_USER["email"],
+                "password": BENCHMARK_USER["password"],
+            },
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        for endpoint in endpoints:
+            results[endpoint.name] = await run_endpoint(
+                client,
+                endpoint,
+                catalog,
+                headers,
+                requests=max(int(requests * endpoint.weight), 1),
+                concurrency=concurrency,
+                warmup=warmup,
+                allocation_requests=allocation_requests,
+            )
+
+            if progress is not None:
+                progress(endpoint.name, results[endpoint.name])
+
+    return results
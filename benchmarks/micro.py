@@ -0,0 +1,180 @@
+from typing import Any, Callable, Dict, List, Tuple, Type
+from datetime import datetime
+from json import dumps
+from time import perf_counter
+from uuid import uuid4
+from fastapi.encoders import jsonable_encoder
+from fastapi_pagination import Page
+from orjson import dumps as orjson_dumps
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.orm import Session
+from app.core.auth import auth_cache, create_access_token
+from app.core.cache import MemoryCacheBackend, TTLCache
+from app.core.database import SessionLocal
+from app.core.deps import _get_token_data, get_current_user
+from app.core.instrumentation import fingerprint_statement
+from app.models.category_model import CategoryModel
+from app.models.product_model import ProductModel
+from app.models.user_model import UserModel
+from app.schemas.category_schema import CategorySchemaRead
+from app.schemas.product_schema import ProductSchemaRead
+from benchmarks.seed import BENCHMARK_USER
+from benchmarks.stats import summarize
+
+# Tamanho da página serializada (limite do parâmetro size das listagens)
+PAGE_SIZE = 100
+
+PRODUCT = {
+    "uuid": uuid4(),
+    "category_uuid": uuid4(),
+    "name": "Bench Product",
+    "slug": "bench-product",
+    "price": 10.0,
+    "stock": 100,
+    "created_at": datetime.now(),
+    "updated_at": datetime.now(),
+}
+
+CATEGORY = {
+    "uuid": uuid4(),
+    "name": "Bench Category",
+    "slug": "bench-category",
+    "created_at": datetime.now(),
+    "updated_at": datetime.now(),
+}
+
+STATEMENT = (
+    "SELECT products.uuid, products.name FROM products "
+    "WHERE products.category_uuid IN (?, ?, ?) AND products.price > 10 LIMIT ?"
+)
+
+
+def _product_page() -> Page:
+    # Página de modelos, como retornada pelo controller de produtos
+    items = [ProductModel(**{**PRODUCT, "uuid": uuid4()}) for _ in range(PAGE_SIZE)]
+    return Page(items=items, total=PAGE_SIZE, page=1, size=PAGE_SIZE, pages=1)
+
+
+def _category_page() -> Page:
+    # Categorias com expand=products (limite padrão de produtos incluídos)
+    items = []
+
+    for _ in range(PAGE_SIZE):
+        category = CategoryModel(**{**CATEGORY, "uuid": uuid4()})
+        category.products_preview = [
+            ProductModel(**{**PRODUCT, "uuid": uuid4()}) for _ in range(10)
+        ]
+        category.products_count = 10
+        items.append(category)
+
+    return Page(items=items, total=PAGE_SIZE, page=1, size=PAGE_SIZE, pages=1)
+
+
+def _page_benchmarks(
+    name: str, page: Page, schema: Type[BaseModel]
+) -> List[Tuple[str, Callable[[], Any]]]:
+    page_model = Page[schema]
+
+    def validate() -> BaseModel:
+        return page_model.model_validate(page, from_attributes=True)
+
+    return [
+        # Caminho anterior: dict em modo JSON, jsonable_encoder e json.dumps
+        (
+            f"{name}_json_response",
+            lambda: dumps(jsonable_encoder(validate().model_dump(mode="json"))),
+        ),
+        # ORJSONResponse (resposta padrão) sobre o dict em modo JSON
+        (
+            f"{name}_orjson_response",
+            lambda: orjson_dumps(validate().model_dump(mode="json")),
+        ),
+        # page_response: JSON gerado diretamente pelo pydantic-core
+        (f"{name}_model_dump_json", lambda: validate().model_dump_json()),
+    ]
+
+
+def _build_benchmarks(db: Session) -> List[Tuple[str, Callable[[], Any]]]:
+    product = ProductSchemaRead.model_validate(PRODUCT)
+    page_adapter = TypeAdapter(List[ProductSchemaRead])
+    page = [product] * PAGE_SIZE
+    user = db.query(UserModel).filter(UserModel.email == BENCHMARK_USER["email"]).one()
+    token = create_access_token(str(user.uuid), user.token_version)
+    cache = TTLCache(maxsize=1024, ttl=60)
+    cache.set("key", product)
+    backend = MemoryCacheBackend(maxsize=1024, ttl=60)
+    backend.set("key", product)
+
+    def current_user_uncached() -> Any:
+        auth_cache.clear()
+        return get_current_user(db=db, token=token)
+
+    return [
+        ("product_schema_validate", lambda: ProductSchemaRead.model_validate(PRODUCT)),
+        ("product_schema_dump_json", product.model_dump_json),
+        # Caminho da resposta do FastAPI: dump em modo JSON seguido do json.dumps
+        (
+            f"product_page_{PAGE_SIZE}_serialize",
+            lambda: dumps(page_adapter.dump_python(page, mode="json")),
+        ),
+        *_page_benchmarks(
+            f"product_page_{PAGE_SIZE}", _product_page(), ProductSchemaRead
+        ),
+        *_page_benchmarks(
+            f"category_page_{PAGE_SIZE}_expand", _category_page(), CategorySchemaRead
+        ),
+        ("jwt_encode", lambda: create_access_token(str(user.uuid))),
+        ("jwt_decode", lambda: _get_token_data(token)),
+        ("get_current_user_uncached", current_user_uncached),
+        ("get_current_user_cached", lambda: get_current_user(db=db, token=token)),
+        ("ttl_cache_get", lambda: cache.get("key")),
+        # Leitura pelo backend: inclui a desserialização do schema
+        ("memory_cache_get", lambda: backend.get("key", ProductSchemaRead)),
+        ("fingerprint_statement", lambda: fingerprint_statement(STATEMENT)),
+    ]
+
+
+def run_micro(runs: int, progress: Any = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Executa os micro-benchmarks dos schemas, da serialização das páginas, do
+    JWT e de get_current_user.
+
+    Cada chamada é medida individualmente, com latências em microssegundos.
+    get_current_user usa o usuário de benchmark, que precisa existir no banco.
+
+    Parâmetros:
+    - runs: int (Chamadas medidas por benchmark)
+    - progress: Callable (Chamado com o nome e o resultado de cada benchmark)
+
+    Retorno:
+    - Dict[str, Dict[str, Any]] (Resultado por benchmark)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with SessionLocal() as db:
+        benchmarks = _build_benchmarks(db)
+
+        for name, function in benchmarks:
+            # Aquecimento (caches internos do pydantic e do SQLAlchemy)
+            for _ in range(min(runs, 100)):
+                function()
+
+            samples: List[float] = []
+
+            for _ in range(runs):
+                start = perf_counter()
+                function()
+                samples.append(perf_counter() - start)
+
+            results[name] = {
+                "runs": runs,
+                "ops_per_second": round(runs / sum(samples), 1),
+                "latency_us": summarize(samples, scale=1000000),
+            }
+
+            if progress is not None:
+                progress(name, results[name])
+
+    auth_cache.clear()
+
+    return results
@@ -0,0 +1,110 @@
+from typing import Any, Dict, List
+from uuid import uuid4
+from sqlalchemy import delete, insert
+from app.core.database import SessionLocal
+from app.core.security import security
+from app.models.category_model import CategoryModel
+from app.models.product_model import ProductModel
+from app.models.user_model import UserModel
+
+# Prefixos dos registros criados pelos benchmarks (removidos antes de cada seed)
+SLUG_PREFIX = "bench-"
+EMAIL_PREFIX = "benchmark"
+EMAIL_DOMAIN = "example.com"
+
+# Usuário utilizado para autenticar as requisições
+BENCHMARK_USER = {
+    "username": "benchmark",
+    "email": f"{EMAIL_PREFIX}@{EMAIL_DOMAIN}",
+    "password": "benchmark-password",
+}
+
+# Quantidade de linhas por INSERT (executemany)
+SEED_BATCH_SIZE = 1000
+
+
+def _insert_batches(db, model, rows: List[Dict[str, Any]]) -> None:
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        db.execute(insert(model), rows[start : start + SEED_BATCH_SIZE])
+
+
+def clear_catalog() -> None:
+    """
+    Remove os usuários, categorias e produtos criados pelos benchmarks.
+    """
+    with SessionLocal() as db:
+        db.execute(
+            delete(ProductModel).where(ProductModel.slug.startswith(SLUG_PREFIX))
+        )
+        db.execute(
+            delete(CategoryModel).where(CategoryModel.slug.startswith(SLUG_PREFIX))
+        )
+        db.execute(delete(UserModel).where(UserModel.email.startswith(EMAIL_PREFIX)))
+        db.commit()
+
+
+def seed_catalog(
+    categories: int, products_per_category: int, users: int
+) -> Dict[str, Any]:
+    """
+    Popula o banco configurado em DATABASE_URL com um catálogo de benchmark.
+
+    Os registros de uma execução anterior são removidos antes, então o
+    tamanho do catálogo é sempre o solicitado.
+
+    Parâmetros:
+    - categories: int (Quantidade de categorias)
+    - products_per_category: int (Quantidade de produtos por categoria)
+    - users: int (Quantidade de usuários além do usuário de benchmark)
+
+    Retorno:
+    - Dict[str, Any] (Contagens, uuids e slugs utilizados nas requisições)
+    """
+    clear_catalog()
+
+    category_rows = [
+        {"uuid": uuid4(), "name": f"Bench Category {i}", "slug": f"{SLUG_PREFIX}{i}"}
+        for i in range(categories)
+    ]
+    product_rows = [
+        {
+            "uuid": uuid4(),
+            "category_uuid": category["uuid"],
+            "name": f"Bench Product {i} {j}",
+            "slug": f"{SLUG_PREFIX}product-{i}-{j}",
+            "price": 10.0 + j,
+            "stock": 100,
+        }
+        for i, category in enumerate(category_rows)
+        for j in range(products_per_category)
+    ]
+
+    # Um único hash para todos os usuários: o bcrypt dominaria o tempo do seed
+    password = security.get_password_hash(BENCHMARK_USER["password"])
+    user_rows = [{"uuid": uuid4(), **BENCHMARK_USER, "password": password}]
+    user_rows += [
+        {
+            "uuid": uuid4(),
+            "username": f"benchmark {i}",
+            "email": f"{EMAIL_PREFIX}-{i}@{EMAIL_DOMAIN}",
+            "password": password,
+        }
+        for i in range(users)
+    ]
+
+    with SessionLocal() as db:
+        _insert_batches(db, CategoryModel, category_rows)
+        _insert_batches(db, ProductModel, product_rows)
+        _insert_batches(db, UserModel, user_rows)
+        db.commit()
+
+    return {
+        "categories": len(category_rows),
+        "products": len(product_rows),
+        "users": len(user_rows),
+        "category_uuids": [str(row["uuid"]) for row in category_rows],
+        "category_slugs": [row["slug"] for row in category_rows],
+        "product_uuids": [str(row["uuid"]) for row in product_rows],
+        "product_slugs": [row["slug"] for row in product_rows],
+        "user_uuids": [str(row["uuid"]) for row in user_rows],
+    }
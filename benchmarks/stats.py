@@ -0,0 +1,44 @@
+from typing import Dict, List, Sequence
+from math import ceil
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Calcula o percentil pelo método nearest-rank.
+
+    Parâmetros:
+    - values: Sequence[float] (Amostras)
+    - q: float (Percentil, entre 0 e 100)
+
+    Retorno:
+    - float (Valor do percentil, 0 quando não há amostras)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(ceil(q / 100 * len(ordered)), 1)
+
+    return ordered[rank - 1]
+
+
+def summarize(samples: Sequence[float], scale: float = 1000) -> Dict[str, float]:
+    """
+    Resume as durações (em segundos) em média e percentis.
+
+    Parâmetros:
+    - samples: Sequence[float] (Durações em segundos)
+    - scale: float (Fator de conversão, 1000 para ms e 1000000 para µs)
+
+    Retorno:
+    - Dict[str, float] (mean, p50, p95, p99 e max na unidade escolhida)
+    """
+    values: List[float] = [sample * scale for sample in samples]
+
+    return {
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(max(values), 3) if values else 0.0,
+    }
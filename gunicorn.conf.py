@@ -0,0 +1,55 @@
+# Configuração do servidor de produção: gunicorn com workers uvicorn
+# Uso: gunicorn (lê este arquivo do diretório atual)
+from app.core.workers import (
+    configure_worker_metrics,
+    configure_worker_pools,
+    worker_count,
+)
+from app.core.settings import settings
+
+workers = worker_count()
+
+# O pool de conexões configurado é dividido entre os workers (antes do preload,
+# que importa app.main e cria as engines)
+configure_worker_pools(workers)
+
+# As métricas de todos os workers são somadas em um diretório compartilhado
+configure_worker_metrics(workers)
+
+wsgi_app = "app.main:app"
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = settings.WEB_BIND
+
+# A aplicação é importada uma única vez no processo principal e compartilhada
+# com os workers pelo fork (inclusive os que substituem workers reciclados)
+preload_app = True
+
+# Recicla os workers após N requisições; o jitter evita reinícios simultâneos
+max_requests = settings.WEB_MAX_REQUESTS
+max_requests_jitter = settings.WEB_MAX_REQUESTS_JITTER
+
+# Ao receber SIGTERM, os workers deixam de aceitar conexões e concluem as
+# requisições em andamento; após graceful_timeout, são encerrados
+graceful_timeout = settings.WEB_GRACEFUL_TIMEOUT
+timeout = settings.WEB_TIMEOUT
+keepalive = settings.WEB_KEEPALIVE
+
+accesslog = "-"
+
+
+def post_fork(server, worker):
+    # Importado aqui: app.core.server cria as engines (já importadas pelo preload)
+    from app.core.metrics import start_metrics_flusher
+    from app.core.server import reset_engines
+
+    # Os workers não reutilizam as conexões abertas pelo processo principal
+    reset_engines()
+    # Publica as métricas do worker para o /metrics dos demais
+    start_metrics_flusher()
+
+
+def child_exit(server, worker):
+    from app.core.metrics import mark_process_dead
+
+    # Mantém os contadores do worker encerrado (ou reciclado) no /metrics
+    mark_process_dead(worker.pid)
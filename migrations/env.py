@@ -7,6 +7,7 @@ from alembic import context
 
 from app.models import __all__  # noqa
 from app.core.settings import settings as app_config
+from app.core.search import is_search_schema_object
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -27,6 +28,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = app_config.DATABASE_BASE_MODEL.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # A busca textual (tsvector, trigramas e FTS5) é criada fora dos modelos
+    return not (reflected and is_search_schema_object(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +58,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -71,7 +79,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
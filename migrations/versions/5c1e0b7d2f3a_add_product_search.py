@@ -0,0 +1,64 @@
+"""add product search
+
+Revision ID: 5c1e0b7d2f3a
+Revises: a4a1a8ca32f9
+Create Date: 2026-10-18 11:42:07.512304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e0b7d2f3a'
+down_revision: Union[str, None] = 'a4a1a8ca32f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # tsvector gerado a partir do nome e do slug (com os hífens como espaços)
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute(
+            "ALTER TABLE products ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', name || ' ' || replace(slug, '-', ' '))) STORED"
+        )
+        op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+        op.create_index('ix_products_name_trgm', 'products', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+    elif dialect == 'sqlite':
+        # FTS5 com uma cópia do nome e do slug, mantida pelos triggers
+        op.execute("CREATE VIRTUAL TABLE products_fts USING fts5(uuid UNINDEXED, name, slug, prefix='2 3')")
+        op.execute('INSERT INTO products_fts (uuid, name, slug) SELECT uuid, name, slug FROM products')
+        op.execute(
+            'CREATE TRIGGER products_fts_insert AFTER INSERT ON products BEGIN '
+            'INSERT INTO products_fts (uuid, name, slug) VALUES (new.uuid, new.name, new.slug); END'
+        )
+        op.execute(
+            'CREATE TRIGGER products_fts_delete AFTER DELETE ON products BEGIN '
+            'DELETE FROM products_fts WHERE uuid = old.uuid; END'
+        )
+        op.execute(
+            'CREATE TRIGGER products_fts_update AFTER UPDATE OF uuid, name, slug ON products BEGIN '
+            'UPDATE products_fts SET uuid = new.uuid, name = new.name, slug = new.slug WHERE uuid = old.uuid; END'
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.drop_index('ix_products_name_trgm', table_name='products')
+        op.drop_index('ix_products_search_vector', table_name='products')
+        op.drop_column('products', 'search_vector')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER products_fts_update')
+        op.execute('DROP TRIGGER products_fts_delete')
+        op.execute('DROP TRIGGER products_fts_insert')
+        op.execute('DROP TABLE products_fts')
@@ -1,11 +1,17 @@
 from datetime import datetime
+from typing import List
 from uuid import uuid4
 from pytest import fixture
-from app.core.database import SessionLocal
+from sqlalchemy import delete, event, insert
+from app.core.database import SessionLocal, AsyncSessionLocal, engine, async_engine
+from app.core.settings import settings
 from app.models.category_model import CategoryModel
 from app.models.product_model import ProductModel
 from app.models.user_model import UserModel
 from app.core.security import security
+from app.core.auth import auth_cache
+from app.core.cache import catalog_cache
+from app.core.ratelimit import rate_limit_store
 from app.controllers.user_controller import UserController
 from app.schemas.user_schema import UserSchemaLogin
 from secrets import token_urlsafe
@@ -26,6 +32,104 @@ def db_session():
         db.close()
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--large-dataset",
+        action="store_true",
+        default=False,
+        help="Popula um catálogo grande nos testes de orçamento de consultas.",
+    )
+
+
+class QueryCounter:
+    """
+    Conta as consultas SQL e as linhas carregadas pelo ORM dentro de um bloco with.
+
+    Os listeners são registrados nas engines síncrona e assíncrona, então a
+    contagem vale para os dois modos (DATABASE_ASYNC).
+    """
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self.rows = 0
+        self._engines = [engine, async_engine.sync_engine]
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _load(self, target, context):
+        self.rows += 1
+
+    def __enter__(self) -> "QueryCounter":
+        self.statements = []
+        self.rows = 0
+
+        for target in self._engines:
+            event.listen(target, "before_cursor_execute", self._before_cursor_execute)
+
+        event.listen(settings.DATABASE_BASE_MODEL, "load", self._load, propagate=True)
+        return self
+
+    def __exit__(self, *args) -> None:
+        for target in self._engines:
+            event.remove(target, "before_cursor_execute", self._before_cursor_execute)
+
+        event.remove(settings.DATABASE_BASE_MODEL, "load", self._load)
+
+
+@fixture
+def query_counter():
+    """
+    Função que retorna um contador de consultas SQL.
+
+    Uso:
+        with query_counter as queries:
+            client.get(...)
+
+        assert queries.count <= 3
+    """
+    return QueryCounter()
+
+
+@fixture(autouse=True)
+def clear_caches():
+    """
+    Limpa os caches em memória e os limites de requisições para que um teste
+    não enxergue dados de outro.
+    """
+    auth_cache.clear()
+    catalog_cache.clear()
+    rate_limit_store.clear()
+    yield
+    auth_cache.clear()
+    catalog_cache.clear()
+    rate_limit_store.clear()
+
+
+@fixture
+def anyio_backend():
+    """
+    Backend utilizado pelos testes assíncronos (pytest.mark.anyio).
+    """
+    return "asyncio"
+
+
+@fixture
+async def async_db_session():
+    """
+    Função que cria uma sessão assíncrona de banco de dados.
+
+    Returns:
+        AsyncSession: Uma sessão assíncrona de banco de dados.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @fixture
 def get_token(user_on_db, db_session):
     """
@@ -292,3 +396,51 @@ def products_on_db(db_session, categories_on_db):
         db_session.delete(product)
 
     db_session.commit()
+
+
+@fixture
+def catalog_on_db(request, db_session):
+    """
+    Função que popula o banco com um catálogo de categorias e produtos.
+
+    O tamanho padrão é pequeno; com a opção --large-dataset o catálogo tem
+    milhares de produtos, para verificar que as consultas não crescem com ele.
+
+    Returns:
+        dict: Quantidade de categorias e de produtos criados.
+    """
+    large = request.config.getoption("--large-dataset")
+    categories_count = 50 if large else 12
+    products_per_category = 100 if large else 3
+
+    categories = [
+        {"uuid": uuid4(), "name": f"Catalog {i}", "slug": f"catalog-{i}"}
+        for i in range(categories_count)
+    ]
+    products = [
+        {
+            "uuid": uuid4(),
+            "category_uuid": category["uuid"],
+            "name": f"Catalog Product {i} {j}",
+            "slug": f"catalog-product-{i}-{j}",
+            "price": 10.0,
+            "stock": 10,
+        }
+        for i, category in enumerate(categories)
+        for j in range(products_per_category)
+    ]
+
+    db_session.execute(insert(CategoryModel), categories)
+    db_session.execute(insert(ProductModel), products)
+    db_session.commit()
+
+    yield {"categories": len(categories), "products": len(products)}
+
+    category_uuids = [category["uuid"] for category in categories]
+    db_session.execute(
+        delete(ProductModel).where(ProductModel.category_uuid.in_(category_uuids))
+    )
+    db_session.execute(
+        delete(CategoryModel).where(CategoryModel.uuid.in_(category_uuids))
+    )
+    db_session.commit()
@@ -1,11 +1,20 @@
 from fastapi import status, HTTPException
-from pytest import raises
+from pytest import raises, mark
+from uuid import uuid4
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
 from app.schemas.category_schema import (
     CategorySchemaCreate,
     CategorySchemaUpdate,
+    CategorySchemaRead,
 )
+from app.core.settings import settings
+from app.core.cache import catalog_cache
 
-from app.controllers.category_controller import CategoryController
+from app.controllers.category_controller import (
+    CategoryController,
+    AsyncCategoryController,
+)
 from app.models.category_model import CategoryModel
 from fastapi_pagination import Page
 
@@ -23,6 +32,64 @@ def test_get_all_categories(categories_on_db, db_session):
     assert response.total == len(categories_on_db)
 
 
+def test_get_all_categories_products_count(products_on_db, db_session):
+    """
+    Teste de listagem de categorias com a contagem de produtos, sem carregar os produtos
+    """
+    category_controller = CategoryController(db_session)
+
+    response = category_controller.get_all(page=1, size=10)
+
+    for category in response.items:
+        schema = CategorySchemaRead.model_validate(category, from_attributes=True)
+
+        assert schema.products_count == 1
+        assert schema.products is None
+
+
+def test_get_all_categories_expand_products(products_on_db, db_session, monkeypatch):
+    """
+    Teste de listagem de categorias com os primeiros produtos de cada categoria
+    """
+    category_controller = CategoryController(db_session)
+
+    response = category_controller.get_all(page=1, size=10, expand=True)
+
+    for category in response.items:
+        schema = CategorySchemaRead.model_validate(category, from_attributes=True)
+
+        assert len(schema.products) == 1
+        assert schema.products[0].category_uuid == category.uuid
+
+    monkeypatch.setattr(settings, "CATEGORY_PRODUCTS_EXPAND_LIMIT", 0)
+
+    category = category_controller.get(products_on_db[0].category_uuid, expand=True)
+
+    assert category.products_preview == []
+    assert category.products_count == 1
+    # A relação products (com cascade) não recebe a lista parcial
+    assert "products" in inspect(category).unloaded
+
+
+def test_get_category_products(products_on_db, db_session):
+    """
+    Teste de busca paginada dos produtos de uma categoria
+    """
+    category_controller = CategoryController(db_session)
+
+    product = products_on_db[0]
+
+    response = category_controller.get_products(product.category_uuid, page=1, size=10)
+
+    assert response.total == 1
+    assert response.items[0].uuid == product.uuid
+
+    with raises(HTTPException) as exception:
+        category_controller.get_products(uuid4())
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_get_category(categories_on_db, db_session):
     """
     Teste de busca de uma categoria
@@ -36,6 +103,35 @@ def test_get_category(categories_on_db, db_session):
     assert response == category
 
 
+def test_get_category_by_slug(products_on_db, categories_on_db, db_session):
+    """
+    Teste de busca de uma categoria pelo slug, com cache e invalidação
+    """
+    category_controller = CategoryController(db_session)
+    category = categories_on_db[0]
+
+    response = category_controller.get_by_slug(category.slug)
+
+    assert response.uuid == category.uuid
+    assert response.products_count == 1
+
+    hits = catalog_cache.hits
+
+    assert category_controller.get_by_slug(category.slug) == response
+    assert catalog_cache.hits == hits + 1
+
+    category_controller.partial_update(
+        CategorySchemaUpdate(name="Renamed Category"), category.uuid
+    )
+
+    assert category_controller.get_by_slug(category.slug).name == "Renamed Category"
+
+    with raises(HTTPException) as exception:
+        category_controller.get_by_slug("categoria-inexistente")
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_create_category(db_session):
     """
     Teste de criação de uma categoria
@@ -70,6 +166,32 @@ def test_create_category_already_exists(categories_on_db, db_session):
     assert exception.value.detail == "Category already exists."
 
 
+def test_create_category_other_integrity_error(db_session):
+    """
+    Teste de criação de uma categoria barrada por outra restrição
+    """
+    category_controller = CategoryController(db_session)
+
+    category = CategorySchemaCreate(name="Nova categoria", slug="nova-categoria")
+
+    # Restrição que não é de unicidade: não deve ser reportada como duplicado
+    db_session.execute(
+        text(
+            "CREATE TRIGGER categories_read_only BEFORE INSERT ON categories "
+            "BEGIN SELECT RAISE(ABORT, 'categories are read-only'); END"
+        )
+    )
+
+    try:
+        with raises(IntegrityError):
+            category_controller.create(category)
+    finally:
+        db_session.execute(text("DROP TRIGGER categories_read_only"))
+        db_session.commit()
+
+    assert db_session.query(CategoryModel).count() == 0
+
+
 def test_full_update_category(categories_on_db, db_session):
     """
     Teste de atualização completa de uma categoria
@@ -123,3 +245,31 @@ def test_delete_category(db_session):
 
     assert response.status == True
     assert response.message == "Category deleted successfully."
+
+
+@mark.anyio
+async def test_async_get_all_categories(categories_on_db, async_db_session):
+    """
+    Teste de busca de todas as categorias com o controller assíncrono
+    """
+    category_controller = AsyncCategoryController(async_db_session)
+
+    response = await category_controller.get_all(page=1, size=10)
+
+    assert type(response) == Page
+    assert len(response.items) == len(categories_on_db)
+    assert response.total == len(categories_on_db)
+
+
+@mark.anyio
+async def test_async_get_category_not_found(async_db_session):
+    """
+    Teste de busca de uma categoria inexistente com o controller assíncrono
+    """
+    category_controller = AsyncCategoryController(async_db_session)
+
+    with raises(HTTPException) as exception:
+        await category_controller.get(uuid4())
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exception.value.detail == "Category not found."
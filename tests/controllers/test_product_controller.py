@@ -1,7 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
 from fastapi import status, HTTPException
-from pytest import raises
-from app.schemas.product_schema import ProductSchemaCreate, ProductSchemaUpdate
-from app.controllers.product_controller import ProductController
+from sqlalchemy import text
+from pytest import raises, mark
+from app.schemas.product_schema import (
+    ProductSchemaCreate,
+    ProductSchemaFilter,
+    ProductSchemaReservation,
+    ProductSchemaUpdate,
+)
+from app.controllers.product_controller import (
+    ProductController,
+    AsyncProductController,
+)
+from app.core.database import SessionLocal
+from app.core.settings import settings
 from app.models.product_model import ProductModel
 from fastapi_pagination import Page
 
@@ -19,6 +32,103 @@ def test_get_all_products(products_on_db, db_session):
     assert response.total == len(products_on_db)
 
 
+def test_get_all_products_by_cursor(products_on_db, db_session):
+    """
+    Teste de busca de todos os produtos paginados por cursor
+    """
+    product_controller = ProductController(db_session)
+
+    first_page = product_controller.get_all_by_cursor(size=3)
+
+    assert len(first_page.items) == 3
+    assert first_page.next_cursor is not None
+    assert first_page.total is None
+
+    last_page = product_controller.get_all_by_cursor(
+        cursor=first_page.next_cursor, size=3
+    )
+
+    assert len(last_page.items) == len(products_on_db) - 3
+    assert last_page.next_cursor is None
+
+    uuids = {product.uuid for product in first_page.items + last_page.items}
+
+    assert uuids == {product.uuid for product in products_on_db}
+
+
+def test_get_all_products_filtered_and_sorted(products_on_db, db_session):
+    """
+    Teste de busca de produtos com filtros e ordenação
+    """
+    product_controller = ProductController(db_session)
+
+    filters = ProductSchemaFilter(min_price=150, max_price=350, in_stock=True)
+    response = product_controller.get_all(
+        page=1, size=10, filters=filters, sort="-price"
+    )
+
+    assert response.total == 2
+    assert [product.price for product in response.items] == [300.0, 200.0]
+
+    filters = ProductSchemaFilter(
+        category_uuid=products_on_db[0].category_uuid, name_prefix="Product"
+    )
+    response = product_controller.get_all(page=1, size=10, filters=filters)
+
+    assert [product.uuid for product in response.items] == [products_on_db[0].uuid]
+
+    # Os curingas do LIKE no prefixo são tratados como texto
+    filters = ProductSchemaFilter(name_prefix="Product%")
+    response = product_controller.get_all(page=1, size=10, filters=filters)
+
+    assert response.total == 0
+
+
+def test_get_all_products_by_cursor_filtered(products_on_db, db_session):
+    """
+    Teste de busca de produtos filtrados paginados por cursor
+    """
+    product_controller = ProductController(db_session)
+
+    filters = ProductSchemaFilter(in_stock=False)
+    page = product_controller.get_all_by_cursor(
+        size=10, include_total=True, filters=filters
+    )
+
+    assert page.items == []
+    assert page.total == 0
+
+
+def test_search_products(products_on_db, db_session):
+    """
+    Teste de busca textual de produtos pelo nome e pelo slug
+    """
+    product_controller = ProductController(db_session)
+
+    first_page = product_controller.search("prod", size=3)
+
+    assert len(first_page.items) == 3
+    assert first_page.next_cursor is not None
+
+    last_page = product_controller.search("prod", cursor=first_page.next_cursor, size=3)
+
+    assert len(last_page.items) == len(products_on_db) - 3
+    assert last_page.next_cursor is None
+
+    uuids = {product.uuid for product in first_page.items + last_page.items}
+
+    assert uuids == {product.uuid for product in products_on_db}
+
+    page = product_controller.search("product-2")
+
+    assert [product.uuid for product in page.items] == [products_on_db[1].uuid]
+
+    with raises(HTTPException) as exception:
+        product_controller.search("!!!")
+
+    assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def test_get_product(products_on_db, db_session):
     """
     Teste de busca de um produto
@@ -32,6 +142,55 @@ def test_get_product(products_on_db, db_session):
     assert response == product
 
 
+def test_get_many_products(products_on_db, db_session):
+    """
+    Teste de busca de vários produtos pelo UUID
+    """
+    product_controller = ProductController(db_session)
+
+    missing = uuid4()
+    uuids = [products_on_db[0].uuid, missing, products_on_db[0].uuid]
+
+    response = product_controller.get_many(uuids)
+
+    assert response.found == 2
+    assert response.missing == 1
+    assert [result.status for result in response.results] == [
+        "found",
+        "not_found",
+        "found",
+    ]
+    assert response.results[0].item == products_on_db[0]
+    assert response.results[1].uuid == missing
+
+    with raises(HTTPException) as exception:
+        product_controller.get_many([uuid4() for _ in range(101)])
+
+    assert exception.value.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_get_product_by_slug(products_on_db, db_session):
+    """
+    Teste de busca de um produto pelo slug, com invalidação na atualização
+    """
+    product_controller = ProductController(db_session)
+    product = products_on_db[0]
+
+    response = product_controller.get_by_slug(product.slug)
+
+    assert response.uuid == product.uuid
+    assert product_controller.get_by_slug(product.slug) == response
+
+    product_controller.partial_update(ProductSchemaUpdate(stock=99), product.uuid)
+
+    assert product_controller.get_by_slug(product.slug).stock == 99
+
+    with raises(HTTPException) as exception:
+        product_controller.get_by_slug("produto-inexistente")
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_create_product(categories_on_db, db_session):
     """
     Teste de criação de um produto
@@ -85,6 +244,73 @@ def test_create_product_already_exists(products_on_db, db_session):
     assert exception.value.detail == "Product already exists."
 
 
+def test_create_product_unknown_category(categories_on_db, db_session):
+    """
+    Teste de criação de um produto com uma categoria inexistente
+    """
+    product_controller = ProductController(db_session)
+
+    product = ProductSchemaCreate(
+        category_uuid=uuid4(),
+        name="Product",
+        slug="product",
+        price=10.0,
+        stock=10,
+    )
+
+    # O SQLite só verifica as chaves estrangeiras quando habilitado na conexão
+    db_session.execute(text("PRAGMA foreign_keys = ON"))
+
+    try:
+        with raises(HTTPException) as exception:
+            product_controller.create(product)
+    finally:
+        db_session.execute(text("PRAGMA foreign_keys = OFF"))
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exception.value.detail == "Category not found."
+
+
+def test_create_product_slug_already_exists(products_on_db, db_session):
+    """
+    Teste de criação de um produto com slug já existente
+    """
+    product_controller = ProductController(db_session)
+
+    product = ProductSchemaCreate(
+        category_uuid=products_on_db[0].category_uuid,
+        name="Another Product",
+        slug=products_on_db[0].slug,
+        price=10.0,
+        stock=10,
+    )
+
+    with raises(HTTPException) as exception:
+        product_controller.create(product)
+
+    assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+
+def test_full_update_product_already_exists(products_on_db, db_session):
+    """
+    Teste de atualização de um produto com o nome de outro produto
+    """
+    product_controller = ProductController(db_session)
+
+    product = ProductSchemaUpdate(
+        category_uuid=products_on_db[0].category_uuid,
+        name=products_on_db[1].name,
+        slug=products_on_db[0].slug,
+        price=10.0,
+        stock=10,
+    )
+
+    with raises(HTTPException) as exception:
+        product_controller.full_update(product, products_on_db[0].uuid)
+
+    assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+
 def test_full_update_product(products_on_db, db_session):
     """
     Teste de atualização completa de um produto
@@ -162,3 +388,232 @@ def test_delete_product(categories_on_db, db_session):
 
     assert response.status == True
     assert response.message == "Product deleted successfully."
+
+
+def test_decrement_stock(products_on_db, db_session):
+    """
+    Teste de baixa de estoque de um produto
+    """
+    product_controller = ProductController(db_session)
+
+    product = products_on_db[0]
+
+    response = product_controller.decrement_stock(product.uuid, 4)
+
+    assert response.stock == 6
+
+    with raises(HTTPException) as exception:
+        product_controller.decrement_stock(product.uuid, 7)
+
+    assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+    with raises(HTTPException) as exception:
+        product_controller.decrement_stock(uuid4(), 1)
+
+    assert exception.value.status_code == status.HTTP_404_NOT_FOUND
+
+    db_session.refresh(product)
+
+    assert product.stock == 6
+
+
+def test_decrement_stock_concurrent(products_on_db):
+    """
+    Teste de baixas de estoque concorrentes, cada uma com a sua sessão
+    """
+    product = products_on_db[0]
+
+    def decrement() -> bool:
+        with SessionLocal() as db:
+            try:
+                ProductController(db).decrement_stock(product.uuid, 1)
+                return True
+            except HTTPException:
+                return False
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: decrement(), range(product.stock + 5)))
+
+    with SessionLocal() as db:
+        stock = db.get(ProductModel, product.uuid).stock
+
+    assert results.count(True) == product.stock
+    assert stock == 0
+
+
+def test_reserve_stock(products_on_db, db_session):
+    """
+    Teste de reserva de estoque de vários produtos em uma transação
+    """
+    product_controller = ProductController(db_session)
+
+    first, second = products_on_db[0], products_on_db[1]
+
+    response = product_controller.reserve_stock(
+        ProductSchemaReservation(
+            items=[
+                {"uuid": second.uuid, "quantity": 5},
+                {"uuid": first.uuid, "quantity": 2},
+                {"uuid": second.uuid, "quantity": 5},
+            ]
+        )
+    )
+
+    assert [(item.uuid, item.stock) for item in response.items] == [
+        (second.uuid, 10),
+        (first.uuid, 8),
+    ]
+
+    # A falta de estoque de um produto desfaz a baixa dos demais
+    with raises(HTTPException) as exception:
+        product_controller.reserve_stock(
+            ProductSchemaReservation(
+                items=[
+                    {"uuid": first.uuid, "quantity": 1},
+                    {"uuid": second.uuid, "quantity": 11},
+                ]
+            )
+        )
+
+    assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+    db_session.refresh(first)
+    db_session.refresh(second)
+
+    assert (first.stock, second.stock) == (8, 10)
+
+
+def test_reserve_stock_too_many_items(products_on_db, db_session, monkeypatch):
+    """
+    Teste de reserva com mais itens que PRODUCT_RESERVATION_MAX_ITEMS
+    """
+    product_controller = ProductController(db_session)
+    monkeypatch.setattr(settings, "PRODUCT_RESERVATION_MAX_ITEMS", 1)
+
+    with raises(HTTPException) as exception:
+        product_controller.reserve_stock(
+            ProductSchemaReservation(
+                items=[
+                    {"uuid": product.uuid, "quantity": 1}
+                    for product in products_on_db[:2]
+                ]
+            )
+        )
+
+    assert exception.value.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_create_products_bulk_repeated_uuid(categories_on_db, db_session):
+    """
+    Teste de criação em lote com duas linhas com o mesmo uuid
+    """
+    product_controller = ProductController(db_session)
+    uuid = uuid4()
+
+    rows = [
+        {
+            "uuid": str(uuid),
+            "category_uuid": str(categories_on_db[0].uuid),
+            "name": f"Same UUID {i}",
+            "slug": f"same-uuid-{i}",
+            "price": 10.0,
+            "stock": 1,
+        }
+        for i in range(2)
+    ]
+
+    report = product_controller.create_bulk(rows)
+
+    assert [result.status for result in report.results] == ["created", "duplicate"]
+    assert report.created == 1
+    assert report.duplicates == 1
+    assert db_session.query(ProductModel).filter(ProductModel.uuid == uuid).count() == 1
+
+    db_session.query(ProductModel).filter(ProductModel.uuid == uuid).delete()
+    db_session.commit()
+
+
+@mark.anyio
+async def test_async_create_and_delete_product(categories_on_db, async_db_session):
+    """
+    Teste de criação e exclusão de um produto com o controller assíncrono
+    """
+    product_controller = AsyncProductController(async_db_session)
+
+    product = ProductSchemaCreate(
+        category_uuid=categories_on_db[0].uuid,
+        name="Async Product",
+        slug="async-product",
+        price=10.0,
+        stock=10,
+    )
+
+    response = await product_controller.create(product)
+
+    assert response.status == True
+    assert response.message == "Product created successfully."
+
+    with raises(HTTPException) as exception:
+        await product_controller.create(product)
+
+    assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+    filters = ProductSchemaFilter(name_prefix="Async", min_price=5)
+    page = await product_controller.get_all(
+        page=1, size=10, filters=filters, sort="name"
+    )
+    product_model = page.items[0]
+
+    assert page.total == 1
+
+    response = await product_controller.delete(product_model.uuid)
+
+    assert response.status == True
+    assert response.message == "Product deleted successfully."
+
+
+def test_create_products_bulk(products_on_db, categories_on_db, db_session):
+    """
+    Teste de criação de produtos em lote
+    """
+    product_controller = ProductController(db_session)
+
+    rows = [
+        {
+            "category_uuid": str(categories_on_db[0].uuid),
+            "name": f"Bulk Product {i}",
+            "slug": f"bulk-product-{i}",
+            "price": 10.0,
+            "stock": 1,
+        }
+        for i in range(5)
+    ]
+    # Repetido no próprio lote, já existente no banco, inválido e sem categoria
+    rows.append(dict(rows[0]))
+    rows.append({**rows[1], "name": products_on_db[0].name})
+    rows.append({**rows[2], "name": "Bulk Product X", "price": 0})
+    rows.append({**rows[3], "name": "Bulk Product Y", "category_uuid": str(uuid4())})
+
+    report = product_controller.create_bulk(rows, batch_size=2)
+
+    assert report.created == 5
+    assert report.duplicates == 2
+    assert report.invalid == 2
+    assert report.failed == 0
+    assert [result.status for result in report.results] == ["created"] * 5 + [
+        "duplicate",
+        "duplicate",
+        "invalid",
+        "invalid",
+    ]
+    assert report.results[8].detail == "Category not found."
+
+    created = [result.uuid for result in report.results if result.uuid]
+
+    assert (
+        db_session.query(ProductModel).filter(ProductModel.uuid.in_(created)).count()
+        == 5
+    )
+
+    db_session.query(ProductModel).filter(ProductModel.uuid.in_(created)).delete()
+    db_session.commit()
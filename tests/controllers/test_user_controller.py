@@ -4,7 +4,8 @@ from app.schemas.user_schema import (
     UserSchemaLogin,
 )
 from app.schemas.responses import JWTToken
-from app.controllers.user_controller import UserController
+from pytest import mark
+from app.controllers.user_controller import UserController, AsyncUserController
 from app.models.user_model import UserModel
 from fastapi_pagination import Page
 
@@ -22,6 +23,19 @@ def test_get_all_users(users_on_db, db_session):
     assert response.total == len(users_on_db)
 
 
+def test_get_all_users_by_cursor(users_on_db, db_session):
+    """
+    Teste de busca de todos os usuários paginados por cursor com contagem total
+    """
+    user_controller = UserController(db_session)
+
+    response = user_controller.get_all_by_cursor(size=10, include_total=True)
+
+    assert len(response.items) == len(users_on_db)
+    assert response.total == len(users_on_db)
+    assert response.next_cursor is None
+
+
 def test_create_user(generate_fake_user, db_session):
     """
     Teste de criação de usuário
@@ -144,3 +158,23 @@ def test_login_user(user_on_db, db_session):
     assert isinstance(response.token_type, str)
     assert response.access_token != ""
     assert response.token_type != ""
+
+
+@mark.anyio
+async def test_async_login_user(user_on_db, async_db_session):
+    """
+    Teste de login de usuário com o controller assíncrono
+    """
+
+    user_controller = AsyncUserController(async_db_session)
+
+    fake_user = UserSchemaLogin(
+        email=user_on_db["email"],
+        password=user_on_db["password"],
+    )
+
+    response = await user_controller.login(fake_user)
+
+    assert isinstance(response, JWTToken)
+    assert response.token_type == "bearer"
+    assert response.access_token != ""
@@ -0,0 +1,51 @@
+from datetime import timedelta
+from fastapi import HTTPException, status
+from fastapi.security import SecurityScopes
+from pytest import raises
+from app.core.auth import _create_token, create_access_token
+from app.core.deps import get_current_principal
+
+
+def test_current_principal_from_claims(users_on_db):
+    user = users_on_db[0]
+    token = create_access_token(
+        str(user.uuid), 2, username=user.username, scopes=["read"]
+    )
+
+    principal = get_current_principal(SecurityScopes(["read"]), token)
+
+    assert principal.uuid == user.uuid
+    assert principal.username == user.username
+    assert principal.version == 2
+
+
+def test_current_principal_missing_scope(users_on_db):
+    user = users_on_db[0]
+    token = create_access_token(str(user.uuid), username=user.username, scopes=["read"])
+
+    with raises(HTTPException) as exception:
+        get_current_principal(SecurityScopes(["write"]), token)
+
+    assert exception.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_current_principal_invalid_tokens(users_on_db):
+    user = users_on_db[0]
+    tokens = [
+        # Token sem as claims do modo claims
+        create_access_token(str(user.uuid)),
+        # Token expirado
+        _create_token(
+            "access_token",
+            timedelta(minutes=-1),
+            str(user.uuid),
+            username=user.username,
+            scopes=["read"],
+        ),
+    ]
+
+    for token in tokens:
+        with raises(HTTPException) as exception:
+            get_current_principal(SecurityScopes(["read"]), token)
+
+        assert exception.value.status_code == status.HTTP_401_UNAUTHORIZED
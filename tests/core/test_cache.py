@@ -0,0 +1,145 @@
+from time import sleep
+from fakeredis import FakeAsyncRedis, FakeRedis, FakeServer
+from pytest import fixture, mark
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from app.controllers import product_controller
+from app.controllers.product_controller import ProductController
+from app.core import cache
+from app.core.cache import MemoryCacheBackend, RedisCacheBackend, TTLCache
+from app.schemas.product_schema import ProductSchemaRead, ProductSchemaUpdate
+from app.schemas.responses import Message
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_cache_expires_items():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1, ttl=0.01)
+    sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+
+def test_cache_delete_where():
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 1)
+
+    assert cache.delete_where(lambda value: value == 1) == 2
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+@fixture
+def redis_server():
+    """
+    Servidor Redis em memória (fakeredis), compartilhado pelos clientes do teste.
+    """
+    return FakeServer()
+
+
+def _redis_backend(server: FakeServer, ttl: float = 60) -> RedisCacheBackend:
+    return RedisCacheBackend(
+        FakeRedis(server=server), FakeAsyncRedis(server=server), "test:", ttl
+    )
+
+
+@fixture(params=["memory", "redis"])
+def backend(request, redis_server):
+    if request.param == "memory":
+        return MemoryCacheBackend(maxsize=16, ttl=60)
+
+    return _redis_backend(redis_server)
+
+
+def test_backend_serializes_schemas(backend):
+    message = Message(message="cached")
+
+    backend.set("message", message, tags=["messages"])
+    cached = backend.get("message", Message)
+
+    assert cached == message
+    assert cached is not message
+    assert backend.get("missing", Message) is None
+    assert (backend.hits, backend.misses) == (1, 1)
+
+
+def test_backend_expires_entries(backend):
+    backend.set("message", Message(message="cached"), ttl=0.01)
+    sleep(0.02)
+
+    assert backend.get("message", Message) is None
+
+
+def test_backend_invalidates_tags(backend):
+    backend.set("a", Message(message="a"), tags=["messages", "message:a"])
+    backend.set("b", Message(message="b"), tags=["messages", "message:b"])
+    backend.set("c", Message(message="c"), tags=["others"])
+
+    backend.invalidate("message:a")
+
+    assert backend.get("a", Message) is None
+    assert backend.get("b", Message) is not None
+
+    backend.invalidate("messages")
+
+    assert backend.get("b", Message) is None
+    assert backend.get("c", Message) is not None
+
+
+@mark.anyio
+async def test_backend_async(backend):
+    await backend.async_set("a", Message(message="a"), tags=["messages"])
+
+    assert (await backend.async_get("a", Message)).message == "a"
+
+    await backend.async_invalidate("messages")
+
+    assert await backend.async_get("a", Message) is None
+
+
+def test_redis_backend_unavailable():
+    client = Redis(port=1, socket_connect_timeout=0.1)
+    backend = RedisCacheBackend(client, AsyncRedis(port=1), "test:", 60)
+
+    # Sem o Redis, a leitura é tratada como ausência e a escrita é descartada
+    backend.set("a", Message(message="a"))
+
+    assert backend.get("a", Message) is None
+
+
+def test_catalog_shared_between_workers(
+    monkeypatch, redis_server, products_on_db, db_session
+):
+    # Dois workers com o catálogo no mesmo servidor Redis
+    worker, other_worker = _redis_backend(redis_server), _redis_backend(redis_server)
+    monkeypatch.setattr(cache, "catalog_cache", worker)
+    monkeypatch.setattr(product_controller, "catalog_cache", worker)
+
+    product = ProductController(db_session).get_by_slug("product-1")
+
+    assert other_worker.get("product:product-1", ProductSchemaRead) == product
+
+    ProductController(db_session).partial_update(
+        ProductSchemaUpdate(name="Renamed Product"), product.uuid
+    )
+
+    assert other_worker.get("product:product-1", ProductSchemaRead) is None
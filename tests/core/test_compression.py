@@ -0,0 +1,131 @@
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from pytest import mark
+from app.core.compression import (
+    CompressionMiddleware,
+    brotli,
+    decode_etag,
+    encode_etag,
+    select_encoding,
+)
+from app.core.conditional import conditional_response
+
+LARGE_BODY = [{"name": f"Product {index}", "price": index} for index in range(200)]
+
+
+def _client() -> TestClient:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    def large():
+        return LARGE_BODY
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/versioned")
+    def versioned(request: Request, response: Response):
+        return conditional_response(request, response, '"v1"') or LARGE_BODY
+
+    @app.get("/not-modified")
+    def not_modified():
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (f"line {index}\n" for index in range(1000)), media_type="text/plain"
+        )
+
+    return TestClient(app)
+
+
+def test_select_encoding():
+    assert select_encoding("gzip, deflate") == "gzip"
+    assert select_encoding("deflate") is None
+    assert select_encoding("") is None
+    assert select_encoding("gzip;q=0, *") == "gzip"
+    assert select_encoding("br;q=0, gzip") == "gzip"
+    assert select_encoding("gzip;q=0") is None
+
+
+def test_gzip_above_minimum_size():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE_BODY
+
+
+def test_encode_etag():
+    assert encode_etag('"v1"', "gzip") == '"v1-gzip"'
+    assert encode_etag('W/"v1"', "br") == 'W/"v1-br"'
+    assert decode_etag('"v1-gzip"') == '"v1"'
+    assert decode_etag('W/"v1-br"') == 'W/"v1"'
+    assert decode_etag('"v1"') == '"v1"'
+
+
+def test_compressed_response_etag():
+    client = _client()
+
+    response = client.get("/versioned", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"v1-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    response = client.get("/versioned", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    # O ETag comprimido valida a mesma versão, e o 304 o repete
+    response = client.get(
+        "/versioned",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": '"v1-gzip"'},
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == '"v1-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@mark.skipif(brotli is None, reason="brotli não instalado")
+def test_brotli_preferred_when_accepted():
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == LARGE_BODY
+
+
+def test_small_and_empty_bodies_are_not_compressed():
+    client = _client()
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    not_modified = client.get("/not-modified", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+    assert small.json() == {"status": "ok"}
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert "content-encoding" not in not_modified.headers
+
+
+def test_without_accept_encoding():
+    response = _client().get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == LARGE_BODY
+
+
+def test_streaming_response_is_compressed_incrementally():
+    response = _client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "".join(f"line {index}\n" for index in range(1000))
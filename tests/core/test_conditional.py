@@ -0,0 +1,130 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+from fastapi import HTTPException, Response, status
+from pytest import raises
+from starlette.requests import Request
+from app.core.compression import encode_etag
+from app.core.conditional import (
+    check_if_match,
+    collection_etag,
+    conditional_response,
+    entity_etag,
+    last_modified,
+)
+from app.core.settings import settings
+from app.models.category_model import CategoryModel
+
+
+def _request(**headers) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def _item(**fields) -> SimpleNamespace:
+    return SimpleNamespace(uuid=uuid4(), updated_at=datetime(2024, 6, 1, 12), **fields)
+
+
+def test_etag_changes_with_version():
+    item = _item()
+    etag = entity_etag(item)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert entity_etag(item) == etag
+
+    item.updated_at = datetime(2024, 6, 1, 13)
+
+    assert entity_etag(item) != etag
+
+
+def test_etag_includes_products_count_and_page_items():
+    item = _item(products_count=1)
+    etag = entity_etag(item)
+    page = SimpleNamespace(items=[item], total=1)
+    page_etag = collection_etag(page)
+
+    item.products_count = 2
+
+    assert entity_etag(item) != etag
+    assert collection_etag(page) != page_etag
+
+    page.items.append(_item())
+
+    assert collection_etag(SimpleNamespace(items=[], total=0)) != page_etag
+
+
+def test_etag_includes_expanded_products():
+    category = CategoryModel(uuid=uuid4(), updated_at=datetime(2024, 6, 1, 12))
+    etag = entity_etag(category)
+
+    # Os produtos de expand=products ficam fora da relação products
+    category.products_preview = [_item()]
+    expanded_etag = entity_etag(category)
+
+    assert expanded_etag != etag
+
+    category.products_preview[0].updated_at = datetime(2024, 6, 1, 13)
+
+    assert entity_etag(category) != expanded_etag
+
+
+def test_conditional_response_if_none_match():
+    item = _item()
+    etag = entity_etag(item)
+    response = Response()
+
+    assert conditional_response(_request(), response, etag) is None
+    assert response.headers["etag"] == etag
+
+    not_modified = conditional_response(
+        _request(if_none_match=f'"other", W/{etag}'), Response(), etag
+    )
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+
+
+def test_conditional_response_if_modified_since(monkeypatch):
+    # Datas sem fuso são interpretadas no fuso de settings.TIMEZONE
+    monkeypatch.setattr(settings, "TIMEZONE", "America/Sao_Paulo")
+    item = _item()
+    modified = last_modified(item)
+
+    assert modified == "Sat, 01 Jun 2024 15:00:00 GMT"
+
+    not_modified = conditional_response(
+        _request(if_modified_since=modified), Response(), entity_etag(item), modified
+    )
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # If-None-Match tem precedência sobre If-Modified-Since
+    response = conditional_response(
+        _request(if_none_match='"other"', if_modified_since=modified),
+        Response(),
+        entity_etag(item),
+        modified,
+    )
+
+    assert response is None
+
+
+def test_check_if_match():
+    item = _item()
+
+    check_if_match(None, item)
+    check_if_match(entity_etag(item), item)
+    check_if_match(encode_etag(entity_etag(item), "gzip"), item)
+    check_if_match("*", item)
+
+    with raises(HTTPException) as exception:
+        check_if_match(f"W/{entity_etag(item)}", item)
+
+    assert exception.value.status_code == status.HTTP_412_PRECONDITION_FAILED
@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+from fastapi import status
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+from app.core import health
+from app.core.database import get_engine_options
+from app.core.settings import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_database_health_check():
+    response = client.get("/health/db")
+    data = response.json()
+    pool = data["pools"]["async" if settings.DATABASE_ASYNC else "sync"]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["status"] == "ok"
+    assert data["mode"] == "queue"
+    assert pool["size"] == settings.DATABASE_POOL_SIZE
+    assert pool["checked_out"] == 0
+    assert pool["waits"] >= 1
+    assert pool["wait_seconds_total"] >= 0
+
+
+def test_database_health_check_unavailable(monkeypatch):
+    def unavailable():
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    monkeypatch.setattr(health, "_ping", unavailable)
+    monkeypatch.setattr(health, "_async_ping", unavailable)
+
+    response = client.get("/health/db")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["status"] == "unavailable"
+    assert response.json()["error"] == "OperationalError"
+
+
+def test_engine_options_pgbouncer(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_MODE", "pgbouncer")
+    monkeypatch.setattr(settings, "DATABASE_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = get_engine_options("postgresql+asyncpg://user@host/db", QueuePool, "t")
+
+    assert options["poolclass"].__name__ == "InstrumentedNullPool"
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+    monkeypatch.setattr(settings, "DATABASE_POOL_MODE", "queue")
+
+    options = get_engine_options("postgresql+psycopg2://user@host/db", QueuePool, "t")
+
+    assert options["poolclass"].__name__ == "InstrumentedQueuePool"
+    assert options["pool_timeout"] == settings.DATABASE_POOL_TIMEOUT
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
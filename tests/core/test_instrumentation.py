@@ -0,0 +1,109 @@
+import json
+import os
+from fastapi.testclient import TestClient
+from fastapi import status
+from app.core.settings import settings
+from app.core.metrics import http_request_queries, mark_process_dead, render_metrics
+from app.core.instrumentation import fingerprint_statement, normalize_statement
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_normalize_statement():
+    statement = (
+        "SELECT * FROM products\n WHERE name = 'Product 1' AND stock > 10 "
+        "AND uuid IN (?, ?, ?) LIMIT :param_1"
+    )
+
+    assert normalize_statement(statement) == (
+        "SELECT * FROM products WHERE name = ? AND stock > ? "
+        "AND uuid IN (...) LIMIT ?"
+    )
+    assert fingerprint_statement(statement) == fingerprint_statement(
+        "SELECT * FROM products WHERE name = 'x' AND stock > 1 "
+        "AND uuid IN (?) LIMIT :param_1"
+    )
+
+
+def test_metrics_middleware(products_on_db, get_token):
+    route = f"{settings.PREFIX}/products/{{uuid}}"
+    count = http_request_queries.count("GET", route)
+
+    response = client.get(
+        f"{settings.PREFIX}/products/{products_on_db[0].uuid}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert http_request_queries.count("GET", route) == count + 1
+
+    metrics = client.get("/metrics").text
+
+    assert (
+        f'http_request_duration_seconds_count{{method="GET",route="{route}",'
+        'status="200"}'
+    ) in metrics
+    assert 'db_pool_wait_seconds_count{pool="' in metrics
+    assert "db_query_duration_seconds_count" in metrics
+
+
+def test_metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "metrics-token")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer metrics-token"})
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_metrics_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_metrics_multiprocess(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+
+    # Snapshots de outros dois workers
+    for pid, value in ((1, 2), (2, 3)):
+        (tmp_path / f"{pid}.json").write_text(
+            json.dumps(
+                [
+                    [
+                        "db_slow_queries_total",
+                        "counter",
+                        "Consultas lentas.",
+                        [['db_slow_queries_total{fingerprint="other"}', value]],
+                    ],
+                    [
+                        "password_hash_pending",
+                        "gauge",
+                        "Operações pendentes.",
+                        [["password_hash_pending", value]],
+                    ],
+                ]
+            )
+        )
+
+    metrics = render_metrics()
+
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+    assert 'db_slow_queries_total{fingerprint="other"} 5' in metrics
+    assert "password_hash_pending 5" in metrics
+
+    # O contador de um worker encerrado é mantido; o gauge, descartado
+    mark_process_dead(1)
+
+    metrics = render_metrics()
+
+    assert not (tmp_path / "1.json").exists()
+    assert 'db_slow_queries_total{fingerprint="other"} 5' in metrics
+    assert "password_hash_pending 3" in metrics
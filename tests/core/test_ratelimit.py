@@ -0,0 +1,116 @@
+from fakeredis import FakeAsyncRedis
+from fastapi.testclient import TestClient
+from fastapi import status
+from pytest import fixture, mark, raises
+from app.core.ratelimit import MemoryRateLimitStore, RedisRateLimitStore
+from app.core.ratelimit import RateLimitMiddleware, get_rate_limit, parse_rate_limit
+from app.core.security import security
+from app.core.settings import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+@fixture(params=["memory", "redis"])
+def store(request):
+    if request.param == "memory":
+        return MemoryRateLimitStore(maxsize=16)
+
+    return RedisRateLimitStore(FakeAsyncRedis(), "test:")
+
+
+@mark.anyio
+async def test_token_bucket(store):
+    assert await store.hit("key", 2, 60) == 0
+    assert await store.hit("key", 2, 60) == 0
+
+    # Bucket vazio: o próximo token chega em 30 segundos (2 tokens por minuto)
+    retry_after = await store.hit("key", 2, 60)
+
+    assert 29 < retry_after <= 30
+    assert await store.hit("other", 2, 60) == 0
+
+
+def test_get_rate_limit(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_WRITES", "60/60")
+    monkeypatch.setattr(settings, "RATE_LIMIT_ROUTES", {"GET /items": "5/1"})
+
+    assert get_rate_limit("GET", "/items") == (5, 1.0)
+    assert get_rate_limit("DELETE", "/items/{uuid}") == (60, 60.0)
+    assert get_rate_limit("GET", "/items/{uuid}") is None
+    assert get_rate_limit("POST", "/items/batch-get", read_only=True) is None
+
+
+@mark.parametrize("value", ["10", "ten/60", "0/60", "10/0"])
+def test_invalid_rate_limit_fails_at_startup(monkeypatch, value):
+    assert parse_rate_limit("10/60") == (10, 60.0)
+
+    with raises(ValueError):
+        parse_rate_limit(value)
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_ROUTES", {"POST /items": value})
+
+    with raises(ValueError, match="POST /items"):
+        RateLimitMiddleware(app)
+
+
+def test_login_rate_limit(monkeypatch, user_on_db):
+    calls = []
+    verify_password = security.verify_password
+    async_verify_password = security.async_verify_password
+
+    def spy(plain_password, hashed_password):
+        calls.append(plain_password)
+        return verify_password(plain_password, hashed_password)
+
+    async def async_spy(plain_password, hashed_password):
+        calls.append(plain_password)
+        return await async_verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(
+        settings, "RATE_LIMIT_ROUTES", {f"POST {settings.PREFIX}/login": "2/60"}
+    )
+    monkeypatch.setattr(security, "verify_password", spy)
+    monkeypatch.setattr(security, "async_verify_password", async_spy)
+
+    data = {"username": user_on_db["email"], "password": "wrong-password"}
+    responses = [client.post(f"{settings.PREFIX}/login", data=data) for _ in range(3)]
+
+    assert responses[2].status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert responses[2].headers["Retry-After"] == "30"
+    assert responses[2].json() == {"detail": "Too many requests."}
+    # A tentativa recusada não executa o bcrypt
+    assert len(calls) == 2
+
+
+def test_write_rate_limit_per_user(monkeypatch, get_token, categories_on_db):
+    monkeypatch.setattr(settings, "RATE_LIMIT_WRITES", "1/60")
+    headers = {"Authorization": f"Bearer {get_token}"}
+    url = f"{settings.PREFIX}/categories/{categories_on_db[0].uuid}"
+
+    first = client.patch(url, json={"name": "Renamed"}, headers=headers)
+    second = client.patch(url, json={"name": "Renamed"}, headers=headers)
+    anonymous = client.patch(url, json={"name": "Renamed"})
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    # Outro usuário (anônimo) tem o seu próprio bucket
+    assert anonymous.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_batch_get_uses_read_limit(monkeypatch, get_token, products_on_db):
+    monkeypatch.setattr(settings, "RATE_LIMIT_READS", "2/60")
+    monkeypatch.setattr(settings, "RATE_LIMIT_WRITES", "1/60")
+
+    url = f"{settings.PREFIX}/products/batch-get"
+    headers = {"Authorization": f"Bearer {get_token}"}
+    body = {"uuids": [str(products_on_db[0].uuid)]}
+
+    # batch-get é um POST apenas de leitura: conta no limite das leituras
+    for _ in range(2):
+        response = client.post(url, json=body, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    response = client.post(url, json=body, headers=headers)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,167 @@
+from uuid import uuid4
+from fakeredis import FakeAsyncRedis, FakeRedis, FakeServer
+from fastapi.testclient import TestClient
+from fastapi import status
+from pytest import fixture, mark
+from starlette.requests import Request
+from app.core import replicas
+from app.core.auth import create_access_token
+from app.core.cache import RedisCacheBackend
+from app.core.database import engine
+from app.core.replicas import (
+    Replica,
+    ReplicaRouter,
+    open_session,
+    primary_session,
+    record_write,
+)
+from app.core.settings import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def _request(method: str = "GET", token: str = None) -> Request:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+@fixture
+def replica_router(monkeypatch):
+    """
+    Configura uma réplica no mesmo banco dos testes e uma réplica fora do ar.
+    """
+    replica = Replica(settings.DATABASE_URL, "replica-test")
+    offline = Replica("sqlite:////nonexistent/replica.db", "replica-offline")
+    router = ReplicaRouter([offline, replica], retry_seconds=60)
+
+    monkeypatch.setattr(replicas, "replica_router", router)
+    replicas.recent_writers.clear()
+    yield router
+    replicas.recent_writers.clear()
+
+    for item in (replica, offline):
+        item.engine.dispose()
+
+
+def test_reads_use_replicas(replica_router):
+    offline, replica = replica_router.replicas
+
+    db = open_session(_request())
+
+    # A réplica fora do ar é ignorada e a leitura segue para a próxima
+    assert db.get_bind() is replica.engine
+    assert not offline.available
+
+    db.close()
+    db = open_session(_request("POST"))
+
+    assert db.get_bind() is not replica.engine
+
+    db.close()
+
+
+def test_reads_after_write_use_primary(replica_router):
+    replica = replica_router.replicas[1]
+    writer_uuid = str(uuid4())
+
+    record_write(_request("PATCH", token=create_access_token(writer_uuid)))
+
+    # A janela é do usuário (sub), e não do token usado na escrita
+    writer = open_session(_request(token=create_access_token(writer_uuid, 1)))
+    reader = open_session(_request(token=create_access_token(str(uuid4()))))
+    forged = open_session(_request(token="forged." + writer_uuid))
+
+    assert writer.get_bind() is not replica.engine
+    assert reader.get_bind() is replica.engine
+    assert forged.get_bind() is replica.engine
+
+    for db in (writer, reader, forged):
+        db.close()
+
+
+def test_reads_after_write_shared_between_workers(monkeypatch, replica_router):
+    # Dois workers com a janela no mesmo servidor Redis
+    server = FakeServer()
+    replica = replica_router.replicas[1]
+    token = create_access_token(str(uuid4()))
+
+    def worker() -> RedisCacheBackend:
+        return RedisCacheBackend(
+            FakeRedis(server=server), FakeAsyncRedis(server=server), "test:", 5
+        )
+
+    monkeypatch.setattr(replicas, "recent_writers", worker())
+    record_write(_request("POST", token=token))
+
+    monkeypatch.setattr(replicas, "recent_writers", worker())
+    db = open_session(_request(token=token))
+
+    assert db.get_bind() is not replica.engine
+
+    db.close()
+
+
+def test_primary_session(replica_router):
+    db = open_session(_request())
+
+    # Leituras que preenchem os caches nunca usam a réplica
+    with primary_session(db) as primary:
+        assert primary is not db
+        assert primary.get_bind() is engine
+
+    db.close()
+    db = open_session(_request("POST"))
+
+    with primary_session(db) as primary:
+        assert primary is db
+
+    db.close()
+
+
+def test_without_available_replicas_reads_use_primary(replica_router):
+    for replica in replica_router.replicas:
+        replica_router.mark_unavailable(replica)
+
+    db = open_session(_request())
+
+    assert db.get_bind() not in [item.engine for item in replica_router.replicas]
+
+    db.close()
+
+
+@mark.parametrize("path", ["/products", "/categories"])
+def test_replica_routes(path, replica_router, products_on_db, get_token):
+    replica = replica_router.replicas[1]
+    engine = (
+        replica.async_engine.sync_engine if settings.DATABASE_ASYNC else replica.engine
+    )
+
+    response = client.get(
+        f"{settings.PREFIX}{path}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] >= 1
+    assert engine.pool.checkedin() >= 1
+
+
+def test_batch_get_uses_replica(replica_router, products_on_db, get_token):
+    replica = replica_router.replicas[1]
+    engine = (
+        replica.async_engine.sync_engine if settings.DATABASE_ASYNC else replica.engine
+    )
+
+    # batch-get é um POST apenas de leitura (READ_ONLY_ROUTE)
+    response = client.post(
+        f"{settings.PREFIX}/products/batch-get",
+        json={"uuids": [str(products_on_db[0].uuid)]},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["found"] == 1
+    assert engine.pool.checkedin() >= 1
+    # Sem janela de leitura após escrita para o usuário
+    assert replicas.recent_writers.size() == 0
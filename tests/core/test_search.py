@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from app.core.search import create_search_query, encode_search_cursor
+
+
+def _postgresql_db() -> SimpleNamespace:
+    dialect = postgresql.dialect()
+    return SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=dialect))
+
+
+def test_postgresql_rank_is_double_precision():
+    cursor = encode_search_cursor(0.1, uuid4())
+    query = create_search_query(_postgresql_db(), "phone", cursor, 10)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    # O mesmo rank (double precision) no SELECT, no ORDER BY e no keyset: um
+    # real (float4) não sobrevive à ida e volta pelo cursor
+    rank = "CAST(ts_rank("
+    assert sql.count(rank) == 3
+    assert sql.count("AS DOUBLE PRECISION)") == 3
+    assert "(CAST(ts_rank(" in sql.split("WHERE", 1)[1].split("ORDER BY")[0]
@@ -0,0 +1,29 @@
+from pytest import mark, raises
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from app.core.security import Security
+
+
+@mark.anyio
+async def test_async_password_hash():
+    security = Security(workers=1, max_pending=4)
+
+    try:
+        hashed = await security.async_get_password_hash("password")
+
+        assert await security.async_verify_password("password", hashed)
+        assert not await security.async_verify_password("wrong", hashed)
+        assert security.verify_password("password", hashed)
+        assert security.pending == 0
+    finally:
+        security.shutdown()
+
+
+def test_password_hash_sheds_load():
+    security = Security(workers=1, max_pending=0)
+
+    with raises(HTTPException) as exc:
+        security.get_password_hash("password")
+
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert exc.value.headers == {"Retry-After": "1"}
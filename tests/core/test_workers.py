@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+from fastapi import status
+from app.core import workers
+from app.core.database import engine
+from app.core.server import reset_engines
+from app.core.settings import settings
+from app.core.workers import configure_worker_pools, worker_count
+from app.core.workers import worker_pool_settings
+from app.main import app
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.setattr(workers, "cpu_count", lambda: 4)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 0)
+
+    assert worker_count() == 4
+
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 3)
+
+    assert worker_count() == 3
+
+
+def test_worker_pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", 10)
+    monkeypatch.setattr(settings, "DATABASE_MAX_OVERFLOW", 5)
+
+    assert worker_pool_settings(4) == {
+        "DATABASE_POOL_SIZE": 2,
+        "DATABASE_MAX_OVERFLOW": 1,
+    }
+    # Cada worker mantém ao menos uma conexão
+    assert worker_pool_settings(16)["DATABASE_POOL_SIZE"] == 1
+
+    configure_worker_pools(2)
+
+    assert settings.DATABASE_POOL_SIZE == 5
+    assert settings.DATABASE_MAX_OVERFLOW == 2
+
+
+def test_engines_lifecycle():
+    # O lifespan fecha as conexões ao encerrar a aplicação
+    with TestClient(app) as client:
+        response = client.get("/health/db")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    assert engine.pool.checkedin() == 0
+
+    # Após o fork, o worker descarta o pool herdado e abre novas conexões
+    reset_engines()
+
+    with engine.connect():
+        assert engine.pool.checkedout() == 1
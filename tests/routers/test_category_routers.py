@@ -4,6 +4,7 @@ from app.models.category_model import CategoryModel
 from app.core.settings import settings
 from fastapi_pagination import Page
 from app.main import app
+from app.models.product_model import ProductModel
 
 
 client = TestClient(app)
@@ -72,6 +73,61 @@ def test_get_category_router(categories_on_db, get_token):
     assert response.json()["slug"] == category.slug
 
 
+def test_get_category_router_conditional(categories_on_db, get_token, db_session):
+    # Arrange
+    category = categories_on_db[0]
+    url = f"{settings.PREFIX}/categories/{category.uuid}"
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = client.get(url, headers=headers)
+    etag = response.headers["ETag"]
+
+    # Sem Last-Modified: a contagem de produtos não altera o updated_at
+    assert "Last-Modified" not in response.headers
+
+    # Act
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Act: um novo produto altera a contagem, mas não o updated_at da categoria
+    product = ProductModel(
+        category_uuid=category.uuid,
+        name="Conditional Product",
+        slug="conditional-product",
+        price=10.0,
+        stock=1,
+    )
+    db_session.add(product)
+    db_session.commit()
+
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["products_count"] == 1
+
+    response = client.get(
+        url, headers={**headers, "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # Act
+    response = client.put(
+        url,
+        json={"name": "Conditional", "slug": "conditional"},
+        headers={**headers, "If-Match": etag},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    db_session.delete(product)
+    db_session.commit()
+
+
 def test_get_all_categories(categories_on_db, get_token):
     # Act
     response = client.get(
@@ -86,6 +142,83 @@ def test_get_all_categories(categories_on_db, get_token):
     assert response.status_code == status.HTTP_200_OK
     assert data.get("total") == len(categories_on_db)
     assert len(data.get("items")) == len(categories_on_db)
+    assert all(category["products"] is None for category in data.get("items"))
+
+
+def test_get_all_categories_cursor(categories_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/categories",
+        params={"pagination": "cursor", "size": 10},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(data.get("items")) == len(categories_on_db)
+    assert data.get("next_cursor") is None
+
+
+def test_get_all_categories_expand_products(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/categories",
+        params={"expand": "products"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    for category in data.get("items"):
+        assert category["products_count"] == 1
+        assert len(category["products"]) == 1
+
+
+def test_get_categories_batch_router(products_on_db, get_token):
+    # Arrange
+    category_uuid = str(products_on_db[0].category_uuid)
+    missing = "b0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e"
+
+    # Act
+    response = client.post(
+        f"{settings.PREFIX}/categories/batch-get",
+        params={"expand": "products"},
+        json={"uuids": [missing, category_uuid]},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert (data["found"], data["missing"]) == (1, 1)
+    assert data["results"][0] == {"uuid": missing, "status": "not_found", "item": None}
+    assert data["results"][1]["item"]["products_count"] == 1
+    assert data["results"][1]["item"]["products"][0]["uuid"] == str(
+        products_on_db[0].uuid
+    )
+
+
+def test_get_category_products_router(products_on_db, get_token):
+    # Arrange
+    product = products_on_db[0]
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/categories/{product.category_uuid}/products",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert data.get("total") == 1
+    assert data["items"][0]["uuid"] == str(product.uuid)
 
 
 def test_full_upgrade_category_router(categories_on_db, get_token):
@@ -155,3 +288,16 @@ def test_delete_category_router(get_token, db_session):
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["status"] == True
     assert response.json()["message"] == "Category deleted successfully."
+
+
+def test_get_category_by_slug_router(categories_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/categories/by-slug/{categories_on_db[0].slug}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["uuid"] == str(categories_on_db[0].uuid)
+    assert response.json()["products_count"] == 0
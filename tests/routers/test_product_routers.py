@@ -1,3 +1,6 @@
+from csv import DictReader
+from io import StringIO
+from json import dumps, loads
 from fastapi.testclient import TestClient
 from fastapi import status
 from app.models.product_model import ProductModel
@@ -76,6 +79,85 @@ def test_get_product_router(products_on_db, get_token):
     assert response.json()["category_uuid"] == str(product.category_uuid)
 
 
+def test_get_product_router_conditional(products_on_db, get_token):
+    # Arrange
+    product = products_on_db[0]
+    url = f"{settings.PREFIX}/products/{product.uuid}"
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = client.get(url, headers=headers)
+    etag = response.headers["ETag"]
+
+    # Act
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # Act
+    response = client.get(
+        url,
+        headers={**headers, "If-Modified-Since": response.headers["Last-Modified"]},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Act: a versão enviada no If-Match é a atual
+    response = client.patch(
+        url, json={"stock": 99}, headers={**headers, "If-Match": etag}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+
+    # Act: a versão mudou com a alteração anterior
+    response = client.patch(
+        url, json={"stock": 98}, headers={**headers, "If-Match": etag}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["stock"] == 99
+    assert response.headers["ETag"] != etag
+
+
+def test_get_all_products_conditional(products_on_db, get_token):
+    # Arrange
+    url = f"{settings.PREFIX}/products"
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    etag = client.get(url, headers=headers).headers["ETag"]
+
+    # Act
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_get_all_products_compressed(catalog_on_db, get_token):
+    # Arrange
+    url = f"{settings.PREFIX}/products?size=30"
+    headers = {"Authorization": f"Bearer {get_token}", "Accept-Encoding": "gzip"}
+
+    # Act
+    response = client.get(url, headers=headers)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert "ETag" in response.headers
+    assert len(response.json()["items"]) == 30
+
+
 def test_get_product_router_not_found(get_token):
     # Arrange
     uuid = "b0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e"
@@ -91,6 +173,102 @@ def test_get_product_router_not_found(get_token):
     assert response.json()["detail"] == "Product not found."
 
 
+def test_get_products_batch_router(products_on_db, get_token):
+    # Arrange
+    missing = "b0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e"
+    uuids = [str(products_on_db[1].uuid), missing, str(products_on_db[0].uuid)]
+
+    # Act
+    response = client.post(
+        f"{settings.PREFIX}/products/batch-get",
+        json={"uuids": uuids},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert data["found"] == 2
+    assert data["missing"] == 1
+    assert [result["uuid"] for result in data["results"]] == uuids
+    assert [result["status"] for result in data["results"]] == [
+        "found",
+        "not_found",
+        "found",
+    ]
+    assert data["results"][0]["item"]["name"] == products_on_db[1].name
+    assert data["results"][1]["item"] is None
+
+
+def test_get_products_batch_router_limits(get_token, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(settings, "BATCH_GET_MAX_ITEMS", 2)
+    url = f"{settings.PREFIX}/products/batch-get"
+    headers = {"Authorization": f"Bearer {get_token}"}
+    uuids = [
+        "b0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e",
+        "c0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e",
+        "d0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e",
+    ]
+
+    # Act
+    too_many = client.post(url, json={"uuids": uuids}, headers=headers)
+    empty = client.post(url, json={"uuids": []}, headers=headers)
+
+    # Assert
+    assert too_many.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert empty.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_decrement_product_stock_router(products_on_db, get_token):
+    # Arrange
+    product = products_on_db[0]
+    url = f"{settings.PREFIX}/products/{product.uuid}/stock/decrement"
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    # Act
+    response = client.post(url, json={"quantity": 3}, headers=headers)
+    conflict = client.post(url, json={"quantity": 8}, headers=headers)
+    invalid = client.post(url, json={"quantity": 0}, headers=headers)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"uuid": str(product.uuid), "stock": 7}
+    assert conflict.status_code == status.HTTP_409_CONFLICT
+    assert (
+        conflict.json()["detail"] == f"Insufficient stock for product {product.uuid}."
+    )
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_reserve_products_stock_router(products_on_db, get_token):
+    # Arrange
+    url = f"{settings.PREFIX}/products/stock/reservations"
+    headers = {"Authorization": f"Bearer {get_token}"}
+    items = [
+        {"uuid": str(products_on_db[0].uuid), "quantity": 10},
+        {"uuid": str(products_on_db[1].uuid), "quantity": 1},
+    ]
+    missing = {"uuid": "b0a8b4d1-0b8a-4c9f-8d3a-5d1b1b9d5e8e", "quantity": 1}
+
+    # Act
+    not_found = client.post(url, json={"items": items + [missing]}, headers=headers)
+    response = client.post(url, json={"items": items}, headers=headers)
+
+    # Assert
+    assert not_found.status_code == status.HTTP_404_NOT_FOUND
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["stock"] for item in response.json()["items"]] == [0, 19]
+
+    # O produto com estoque esgotado é atualizado também na leitura pelo slug
+    product = client.get(
+        f"{settings.PREFIX}/products/by-slug/{products_on_db[0].slug}", headers=headers
+    )
+
+    assert product.json()["stock"] == 0
+
+
 def test_get_all_products(products_on_db, get_token):
     # Act
     response = client.get(
@@ -106,6 +284,131 @@ def test_get_all_products(products_on_db, get_token):
     assert len(data.get("items")) == len(products_on_db)
 
 
+def test_get_all_products_cursor(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"pagination": "cursor", "size": 2},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(data.get("items")) == 2
+    assert data.get("total") is None
+    assert data.get("next_cursor") is not None
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"cursor": data["next_cursor"], "size": 2, "include_total": True},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(data.get("items")) == 2
+    assert data.get("total") == len(products_on_db)
+    assert data.get("next_cursor") is None
+
+
+def test_get_all_products_invalid_cursor(get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"cursor": "invalid"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Invalid cursor."
+
+
+def test_get_all_products_filtered(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"min_price": 200, "sort": "-price"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert data.get("total") == 3
+    assert [item["price"] for item in data.get("items")] == [400.0, 300.0, 200.0]
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={
+            "category_uuid": str(products_on_db[1].category_uuid),
+            "pagination": "cursor",
+        },
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["uuid"] for item in data.get("items")] == [str(products_on_db[1].uuid)]
+
+
+def test_get_all_products_invalid_sort(get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"sort": "password"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products",
+        params={"sort": "price", "pagination": "cursor"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_products_router(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products/search",
+        params={"q": "Product 3"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["uuid"] for item in data.get("items")] == [str(products_on_db[2].uuid)]
+    assert data.get("next_cursor") is None
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products/search",
+        params={"q": "product", "cursor": "invalid"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def test_full_upgrade_product_router(products_on_db, get_token):
     # Arrange
     product = products_on_db[0]
@@ -173,3 +476,135 @@ def test_delete_product_router(get_token, categories_on_db, db_session):
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["status"] == True
     assert response.json()["message"] == "Product deleted successfully."
+
+
+def test_create_products_bulk_router(get_token, categories_on_db, db_session):
+    # Arrange
+    rows = [
+        {
+            "name": f"Bulk Product {i}",
+            "slug": f"bulk-product-{i}",
+            "price": 10.0,
+            "stock": 10,
+            "category_uuid": str(categories_on_db[0].uuid),
+        }
+        for i in range(3)
+    ]
+
+    # Act
+    response = client.post(
+        f"{settings.PREFIX}/products/bulk",
+        json=rows,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["created"] == 3
+    assert [result["index"] for result in response.json()["results"]] == [0, 1, 2]
+
+    # Clean Up
+    db_session.query(ProductModel).filter(
+        ProductModel.name.like("Bulk Product%")
+    ).delete(synchronize_session=False)
+    db_session.commit()
+
+
+def test_create_products_bulk_router_ndjson(get_token, products_on_db):
+    # Arrange
+    product = products_on_db[0]
+    body = "\n".join(
+        [
+            dumps(
+                {
+                    "name": product.name,
+                    "slug": product.slug,
+                    "price": product.price,
+                    "stock": product.stock,
+                    "category_uuid": str(product.category_uuid),
+                }
+            ),
+            dumps({"name": "Bulk Product", "slug": "bulk-product"}),
+            "",
+        ]
+    )
+
+    # Act
+    response = client.post(
+        f"{settings.PREFIX}/products/bulk",
+        content=body,
+        headers={
+            "Authorization": f"Bearer {get_token}",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["created"] == 0
+    assert response.json()["duplicates"] == 1
+    assert response.json()["invalid"] == 1
+
+
+def test_create_products_bulk_router_invalid_body(get_token):
+    # Act
+    response = client.post(
+        f"{settings.PREFIX}/products/bulk",
+        json={"name": "Bulk Product"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_export_products_router(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products/export",
+        params={"category_uuid": str(products_on_db[0].category_uuid)},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [loads(line) for line in response.text.splitlines()]
+
+    assert len(rows) == 1
+    assert rows[0]["uuid"] == str(products_on_db[0].uuid)
+    assert rows[0]["name"] == products_on_db[0].name
+
+
+def test_export_products_router_csv(products_on_db, get_token, monkeypatch):
+    # Arrange: um produto por lote
+    monkeypatch.setattr(settings, "PRODUCT_EXPORT_BATCH_SIZE", 1)
+
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products/export",
+        params={"format": "csv"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(DictReader(StringIO(response.text)))
+
+    assert len(rows) == len(products_on_db)
+    assert {row["name"] for row in rows} == {p.name for p in products_on_db}
+
+
+def test_get_product_by_slug_router(products_on_db, get_token):
+    # Act
+    response = client.get(
+        f"{settings.PREFIX}/products/by-slug/{products_on_db[0].slug}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["uuid"] == str(products_on_db[0].uuid)
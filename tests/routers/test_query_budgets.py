@@ -0,0 +1,144 @@
+from fastapi.testclient import TestClient
+from fastapi import status
+from uuid import uuid4
+from pytest import mark
+from app.core.deps import get_authenticated_principal, get_current_principal
+from app.core.settings import settings
+from app.models.category_model import CategoryModel
+from app.models.product_model import ProductModel
+from app.models.user_model import UserModel
+from app.main import app
+
+client = TestClient(app)
+
+# Máximo de consultas por endpoint, incluindo a busca do usuário autenticado
+# (o cache de autenticação é limpo a cada teste)
+QUERY_BUDGETS = {
+    "/products": 3,
+    "/products?pagination=cursor": 2,
+    "/categories": 3,
+    "/categories?expand=products": 4,
+    "/categories?pagination=cursor": 2,
+    "/users": 3,
+}
+
+# Endpoints de listagem cujo custo não pode depender do tamanho da página
+PAGINATED_URLS = [
+    "/products",
+    "/products?pagination=cursor",
+    "/categories",
+    "/categories?pagination=cursor",
+    "/users",
+]
+
+
+@mark.parametrize("url, budget", QUERY_BUDGETS.items())
+def test_query_budget(url, budget, catalog_on_db, get_token, query_counter):
+    # Act
+    with query_counter as queries:
+        response = client.get(
+            f"{settings.PREFIX}{url}",
+            headers={"Authorization": f"Bearer {get_token}"},
+        )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert queries.count <= budget, queries.statements
+
+
+def test_authenticated_user_query(catalog_on_db, get_token, query_counter):
+    with query_counter as queries:
+        response = client.get(
+            f"{settings.PREFIX}/users",
+            headers={"Authorization": f"Bearer {get_token}"},
+        )
+
+    # O usuário do token é buscado pela chave primária, não pelo nome de usuário
+    user_query = queries.statements[0]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "FROM users" in user_query
+    assert "users.uuid = " in user_query
+    assert "users.username" not in user_query.split("WHERE")[1]
+
+
+def test_claims_mode_skips_user_query(catalog_on_db, get_token, query_counter):
+    # Modo claims (JWT_CLAIMS_MODE): as rotas de leitura usam get_current_principal
+    app.dependency_overrides[get_authenticated_principal] = get_current_principal
+
+    try:
+        with query_counter as queries:
+            response = client.get(
+                f"{settings.PREFIX}/products?pagination=cursor",
+                headers={"Authorization": f"Bearer {get_token}"},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert queries.count == 1
+    assert all("FROM users" not in statement for statement in queries.statements)
+
+
+def test_login_query_budget(user_on_db, query_counter):
+    # Act
+    with query_counter as queries:
+        response = client.post(
+            f"{settings.PREFIX}/login",
+            data={"username": user_on_db["email"], "password": user_on_db["password"]},
+        )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert queries.count <= 1, queries.statements
+
+
+@mark.parametrize(
+    "resource, model",
+    [("products", ProductModel), ("categories", CategoryModel), ("users", UserModel)],
+)
+def test_batch_get_query_budget(
+    resource, model, catalog_on_db, users_on_db, get_token, db_session, query_counter
+):
+    # Arrange: 50 UUIDs, existentes e inexistentes
+    uuids = [str(uuid) for uuid, in db_session.query(model.uuid).limit(25)]
+    uuids += [str(uuid4()) for _ in range(50 - len(uuids))]
+
+    # Act
+    with query_counter as queries:
+        response = client.post(
+            f"{settings.PREFIX}/{resource}/batch-get",
+            json={"uuids": uuids},
+            headers={"Authorization": f"Bearer {get_token}"},
+        )
+
+    # Assert: uma consulta para o usuário autenticado e uma para o lote
+    assert response.status_code == status.HTTP_200_OK
+    assert queries.count <= 2, queries.statements
+
+
+@mark.parametrize("url", PAGINATED_URLS)
+def test_queries_do_not_scale_with_page_size(
+    url, catalog_on_db, users_on_db, get_token, query_counter
+):
+    # Arrange
+    headers = {"Authorization": f"Bearer {get_token}"}
+    separator = "&" if "?" in url else "?"
+    counts = []
+
+    # Resolve o usuário antes, para que as duas medições usem o cache
+    client.get(f"{settings.PREFIX}{url}", headers=headers)
+
+    # Act
+    for size in (5, 50):
+        with query_counter as queries:
+            response = client.get(
+                f"{settings.PREFIX}{url}{separator}size={size}", headers=headers
+            )
+
+        # Assert: no máximo a página (e o item extra do cursor) é carregada
+        assert response.status_code == status.HTTP_200_OK
+        assert queries.rows <= size + 1
+        counts.append(queries.count)
+
+    assert counts[0] == counts[1]
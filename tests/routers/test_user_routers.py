@@ -2,6 +2,8 @@ from fastapi.testclient import TestClient
 from fastapi import status
 from app.models.user_model import UserModel
 from app.core.settings import settings
+from app.core.auth import auth_cache, create_access_token, get_cached_user
+from app.core.security import security
 from app.main import app
 
 
@@ -64,6 +66,24 @@ def test_get_all_users_router(users_on_db, get_token):
     assert len(data.get("items")) == len(users_on_db) + 1
 
 
+def test_get_users_batch_router(users_on_db, get_token):
+    uuids = [str(user.uuid) for user in users_on_db]
+
+    response = client.post(
+        f"{settings.PREFIX}/users/batch-get",
+        json={"uuids": uuids + uuids[:1]},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["found"] == len(uuids) + 1
+    assert data["missing"] == 0
+    assert data["results"][-1]["item"]["email"] == users_on_db[0].email
+    assert "password" not in data["results"][0]["item"]
+
+
 def test_full_update_user_router(users_on_db, get_token):
     body = {
         "username": "TestUser",
@@ -111,3 +131,136 @@ def test_delete_user_router(db_session, get_token):
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"status": True, "message": "User deleted successfully."}
+
+
+def test_authenticated_user_cache_router(users_on_db, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    client.get(f"{settings.PREFIX}/users/{users_on_db[0].uuid}", headers=headers)
+    hits = auth_cache.hits
+
+    response = client.get(
+        f"{settings.PREFIX}/users/{users_on_db[0].uuid}", headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert auth_cache.hits == hits + 1
+    assert get_cached_user(get_token) is not None
+
+    metrics = client.get("/metrics").text
+
+    assert f"auth_cache_hits_total {auth_cache.hits}" in metrics
+
+
+def test_update_user_invalidates_cache_router(db_session, user_on_db, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    user = (
+        db_session.query(UserModel)
+        .filter(UserModel.email == user_on_db["email"])
+        .first()
+    )
+
+    response = client.patch(
+        f"{settings.PREFIX}/users/{user.uuid}",
+        json={"username": "renamedusername"},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert auth_cache.size() == 0
+
+    # O token aponta para o UUID: continua válido após a troca do nome de usuário
+    response = client.patch(
+        f"{settings.PREFIX}/users/{user.uuid}",
+        json={"password": "new-password"},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # A troca de senha incrementa token_version e invalida o token
+    response = client.get(f"{settings.PREFIX}/users/{user.uuid}", headers=headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_username_subject_token_router(monkeypatch, user_on_db):
+    # Token emitido antes da troca do sub para o UUID
+    token = create_access_token("testeusername")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get(f"{settings.PREFIX}/users", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    auth_cache.clear()
+    monkeypatch.setattr(settings, "JWT_ACCEPT_USERNAME_SUBJECT", False)
+
+    response = client.get(f"{settings.PREFIX}/users", headers=headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_password_routes_do_not_block_threadpool(monkeypatch, db_session, user_on_db):
+    def blocking(*args):
+        raise AssertionError("bcrypt executado na thread da requisição")
+
+    # As rotas aguardam o pool de processos, também no modo síncrono
+    monkeypatch.setattr(security, "verify_password", blocking)
+    monkeypatch.setattr(security, "get_password_hash", blocking)
+
+    response = client.post(
+        f"{settings.PREFIX}/login",
+        data={"username": user_on_db["email"], "password": user_on_db["password"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.post(
+        f"{settings.PREFIX}/login",
+        data={"username": user_on_db["email"], "password": "wrong-password"},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    body = {
+        "username": "HashUser",
+        "email": "hash@email.com",
+        "password": "testpassword",
+    }
+    response = client.post(f"{settings.PREFIX}/users", json=body)
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+    db_session.query(UserModel).filter(UserModel.username == "HashUser").delete()
+    db_session.commit()
+
+
+def test_write_routes_skip_auth_cache(db_session, user_on_db, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = client.get(f"{settings.PREFIX}/users", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # Senha trocada em outro worker: o cache deste worker não é invalidado
+    user = (
+        db_session.query(UserModel)
+        .filter(UserModel.email == user_on_db["email"])
+        .first()
+    )
+    user.token_version += 1
+    db_session.commit()
+
+    response = client.get(f"{settings.PREFIX}/users", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # As escritas conferem o token_version no banco
+    response = client.patch(
+        f"{settings.PREFIX}/users/{user.uuid}",
+        json={"username": "revokedusername"},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED